@@ -0,0 +1,144 @@
+"""
+Data Cache Module - Columnar sidecar cache for the INAD and BAZL workbooks
+
+Each workbook is parsed once into its normalized columns and written next to
+the source file as an uncompressed Arrow (Feather v2) file. The cache file
+name carries a hash of the workbook content, so replacing the workbook
+invalidates the cache automatically. Later loads memory-map the Arrow file
+instead of re-parsing the Excel sheet: string columns and numeric columns
+without missing values stay backed by the mapped file rather than being
+copied into pandas memory (nullable integer and boolean columns are copied).
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+from typing import Callable, Optional
+
+import pandas as pd
+
+# Bump when the normalized layout of the cached tables changes
+CACHE_VERSION = 2
+
+# Directory override (defaults to a .casa_cache folder next to the workbook)
+CACHE_DIR_ENV = 'CASA_CACHE_DIR'
+
+# Try to load pyarrow; without it every load parses the workbook directly
+_feather = None
+try:
+    import pyarrow.feather as _feather
+except ImportError:
+    pass
+
+
+def cache_enabled() -> bool:
+    """Return True if parsed tables can be cached (pyarrow is installed)."""
+    return _feather is not None
+
+
+def file_digest(file_path: str, salt: str = '', chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+
+    Args:
+        file_path: Path to the file
+        salt: Extra text mixed into the hash (e.g. parser settings)
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    digest.update(f'v{CACHE_VERSION}:{salt}'.encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_cache_dir(source_path: str) -> str:
+    """Return the cache directory used for a given workbook."""
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return override
+    return os.path.join(os.path.dirname(os.path.abspath(source_path)), '.casa_cache')
+
+
+def get_cache_path(source_path: str, kind: str, digest: str) -> str:
+    """Return the sidecar file path for a workbook with the given content hash."""
+    name = os.path.basename(source_path).replace(' ', '_')
+    return os.path.join(get_cache_dir(source_path), f'{name}.{kind}.{digest[:24]}.arrow')
+
+
+def _prune_stale(source_path: str, kind: str, keep: str) -> None:
+    """Remove older cache files written for the same workbook name."""
+    name = os.path.basename(source_path).replace(' ', '_')
+    pattern = os.path.join(glob.escape(get_cache_dir(source_path)), f'{glob.escape(name)}.{kind}.*.arrow')
+    for path in glob.glob(pattern):
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def load_cached_table(
+    source_path: str,
+    kind: str,
+    parse: Callable[[str], pd.DataFrame],
+    salt: str = '',
+    digest: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Load a normalized table for a workbook, parsing it only on a cache miss.
+
+    Args:
+        source_path: Path to the Excel workbook
+        kind: Table kind used in the cache file name (e.g. 'inad', 'bazl')
+        parse: Function that parses the workbook into the normalized table
+        salt: Parser settings that should invalidate the cache when changed
+        digest: Precomputed content hash (computed from the file if None)
+
+    Returns:
+        Normalized DataFrame, read-only; its string and non-null numeric
+        columns reference the memory-mapped cache file when available
+    """
+    if _feather is None:
+        return parse(source_path)
+
+    if digest is None:
+        digest = file_digest(source_path, salt)
+    cache_path = get_cache_path(source_path, kind, digest)
+
+    if os.path.exists(cache_path):
+        try:
+            table = _feather.read_table(cache_path, memory_map=True)
+            # One block per column keeps zero-copy columns as views of the
+            # mapping instead of consolidating them into a new 2D block
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        except Exception:
+            # Corrupt or truncated cache file - fall through and rebuild it
+            pass
+
+    df = parse(source_path)
+
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            _feather.write_feather(df, tmp_path, compression='uncompressed')
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _prune_stale(source_path, kind, cache_path)
+    except OSError:
+        # Read-only location - the parsed table is still usable without a cache
+        pass
+
+    return df
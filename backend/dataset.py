@@ -0,0 +1,289 @@
+"""
+Dataset Module - In-memory INAD/BAZL dataset for the API
+
+Both workbooks are parsed once (through the columnar cache) into their
+normalized tables, which are then aggregated into an airline x last stop x
+month count cube (see monthly_cube). Requests reduce slices of this cube
+instead of re-reading or re-grouping the raw rows. Each semester or month
+window gets an AnalysisPipeline, so config changes only re-run the stages
+that depend on the changed fields.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from inad_analysis import (
+    AnalysisConfig,
+    AnalysisPipeline,
+    analyze_windows,
+    config_fingerprint,
+    load_inad_table,
+    load_bazl_table,
+    parse_semester,
+    parse_window,
+    rolling_windows,
+    semesters_from_cube,
+    stage_fields,
+    sweep_parameters,
+    window_label
+)
+from metrics import span
+from monthly_cube import MonthlyCube
+from threshold_index import ThresholdIndex
+from route_history import RouteHistory
+
+# Threshold indexes kept per dataset (one per semester and step 3 config),
+# least recently used evicted first
+MAX_THRESHOLD_INDEXES = 256
+
+# Route histories kept per dataset (one per config)
+MAX_ROUTE_HISTORIES = 8
+
+# Month window pipelines kept per dataset
+MAX_WINDOW_PIPELINES = 32
+
+
+def _table_digest(table: pd.DataFrame) -> bytes:
+    """Hash the rows of a normalized table."""
+    return pd.util.hash_pandas_object(table, index=False).to_numpy().tobytes()
+
+
+class InadDataset:
+    """Normalized INAD and BAZL tables with their monthly count cube."""
+
+    def __init__(
+        self,
+        inad_table: pd.DataFrame,
+        bazl_table: pd.DataFrame,
+        inad_path: Optional[str] = None,
+        bazl_path: Optional[str] = None
+    ):
+        self.inad_table = inad_table
+        self.bazl_table = bazl_table
+        self.inad_path = inad_path
+        self.bazl_path = bazl_path
+
+        self.digest = hashlib.sha256(
+            _table_digest(inad_table) + b'|' + _table_digest(bazl_table)
+        ).hexdigest()
+
+        # All request-path aggregates are reductions over this cube
+        with span('monthly_cube'):
+            self.cube = MonthlyCube(inad_table, bazl_table)
+        self.semesters: List[Dict] = semesters_from_cube(self.cube)
+
+        self._pipelines: Dict[str, AnalysisPipeline] = {}
+        self._pipelines_lock = threading.Lock()
+        self._threshold_indexes: 'OrderedDict[tuple, ThresholdIndex]' = OrderedDict()
+        self._histories: 'OrderedDict[str, RouteHistory]' = OrderedDict()
+        self._window_pipelines: 'OrderedDict[str, AnalysisPipeline]' = OrderedDict()
+
+    @classmethod
+    def from_files(cls, inad_path: str, bazl_path: str) -> 'InadDataset':
+        """
+        Parse both workbooks into a dataset.
+
+        Args:
+            inad_path: Path to INAD-Tabelle file
+            bazl_path: Path to BAZL-Daten file
+
+        Returns:
+            InadDataset for the two files
+        """
+        return cls(load_inad_table(inad_path), load_bazl_table(bazl_path), inad_path, bazl_path)
+
+    @property
+    def semester_values(self) -> List[str]:
+        """Semester keys present in the INAD data, in chronological order."""
+        return [s['value'] for s in self.semesters]
+
+    def pipeline(self, semester: str) -> AnalysisPipeline:
+        """Return the (stage-cached) analysis pipeline of a semester."""
+        with self._pipelines_lock:
+            pipeline = self._pipelines.get(semester)
+            if pipeline is None:
+                start_date, end_date = parse_semester(semester)
+                pipeline = AnalysisPipeline.from_cube(self.cube, start_date, end_date)
+                self._pipelines[semester] = pipeline
+            return pipeline
+
+    def analyze(self, semester: str, config: Optional[AnalysisConfig] = None) -> Dict[str, Any]:
+        """
+        Run the analysis pipeline for one semester.
+
+        Only the stages affected by config fields that differ from earlier
+        runs of this semester are recomputed. The classified routes are
+        recorded in the route history of the config.
+
+        Args:
+            semester: Semester key (e.g. '2024-H1')
+            config: Analysis configuration (uses defaults if None)
+
+        Returns:
+            Results dict with the same layout as run_full_analysis
+        """
+        if config is None:
+            config = AnalysisConfig()
+        results = self.pipeline(semester).run(config)
+        self.route_history(config).update(semester, results['step3'])
+        return results
+
+    def route_history(self, config: AnalysisConfig) -> RouteHistory:
+        """Return the route-by-semester history recorded under a config."""
+        key = config_fingerprint(config)
+        with self._pipelines_lock:
+            history = self._histories.get(key)
+            if history is None:
+                history = RouteHistory()
+                self._histories[key] = history
+                while len(self._histories) > MAX_ROUTE_HISTORIES:
+                    self._histories.popitem(last=False)
+            else:
+                self._histories.move_to_end(key)
+            return history
+
+    def history_for(self, semesters: List[str], config: AnalysisConfig) -> RouteHistory:
+        """Return the config's route history with every given semester recorded."""
+        history = self.route_history(config)
+        for semester in semesters:
+            if semester not in history:
+                results = self.pipeline(semester).run(config)
+                history.update(semester, results['step3'])
+        return history
+
+    def systemic_cases(self, semesters: List[str], config: AnalysisConfig) -> pd.DataFrame:
+        """
+        Detect systemic cases across semesters from the route history.
+
+        Args:
+            semesters: Semester keys in chronological order
+            config: Analysis configuration
+
+        Returns:
+            DataFrame with systemic case analysis (see detect_systemic_cases)
+        """
+        history = self.history_for(semesters, config)
+        return history.systemic_cases(semesters, config)
+
+    def _index_key(self, semester: str, config: AnalysisConfig) -> tuple:
+        return (semester,) + tuple(getattr(config, name) for name in stage_fields('step3'))
+
+    def threshold_ready(self, semester: str, config: AnalysisConfig, need_threshold: bool = True) -> bool:
+        """Return True if threshold_counts can answer without running the pipeline."""
+        with self._pipelines_lock:
+            if self._index_key(semester, config) not in self._threshold_indexes:
+                return False
+        return not need_threshold or self.pipeline(semester).cached('threshold', config)
+
+    def threshold_counts(
+        self,
+        semester: str,
+        config: AnalysisConfig,
+        threshold: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Count routes per priority at a threshold, using the sorted density index.
+
+        Args:
+            semester: Semester key (e.g. '2024-H1')
+            config: Analysis configuration (min_inad/min_pax select the routes;
+                multiplier, min_density and high_priority_min_inad are applied)
+            threshold: Density threshold (computed with config if None)
+
+        Returns:
+            Dictionary with the threshold used and the priority counts
+        """
+        pipeline = self.pipeline(semester)
+        key = self._index_key(semester, config)
+        with self._pipelines_lock:
+            index = self._threshold_indexes.get(key)
+            if index is not None:
+                self._threshold_indexes.move_to_end(key)
+
+        if index is None:
+            # Build outside the lock; keep the first index if another thread raced us
+            built = ThresholdIndex(pipeline.step3(config))
+            with self._pipelines_lock:
+                index = self._threshold_indexes.setdefault(key, built)
+                self._threshold_indexes.move_to_end(key)
+                while len(self._threshold_indexes) > MAX_THRESHOLD_INDEXES:
+                    self._threshold_indexes.popitem(last=False)
+
+        if threshold is None:
+            threshold = float(pipeline.threshold(config))
+
+        counts = index.counts(
+            threshold,
+            config.high_priority_multiplier,
+            config.min_density,
+            config.high_priority_min_inad
+        )
+        return {'threshold': threshold, **counts}
+
+    def analyze_window(self, window: str, config: Optional[AnalysisConfig] = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run the analysis pipeline for an arbitrary month window.
+
+        Args:
+            window: Window key (see parse_window), e.g. '2023-07:2024-06'
+            config: Analysis configuration (uses defaults if None)
+
+        Returns:
+            Tuple of (canonical 'YYYY-MM:YYYY-MM' window key, results dict
+            with the same layout as run_full_analysis)
+        """
+        if config is None:
+            config = AnalysisConfig()
+        start_date, end_date = parse_window(window)
+        label = window_label(start_date, end_date)
+
+        with self._pipelines_lock:
+            pipeline = self._window_pipelines.get(label)
+            if pipeline is None:
+                pipeline = AnalysisPipeline.from_cube(self.cube, start_date, end_date)
+                self._window_pipelines[label] = pipeline
+                while len(self._window_pipelines) > MAX_WINDOW_PIPELINES:
+                    self._window_pipelines.popitem(last=False)
+            else:
+                self._window_pipelines.move_to_end(label)
+
+        return label, pipeline.run(config)
+
+    def rolling(self, months: int, step: int = 1, config: Optional[AnalysisConfig] = None) -> pd.DataFrame:
+        """
+        Summary counts of a window sliding over the whole dataset.
+
+        Args:
+            months: Window length in months
+            step: Months between window starts
+            config: Analysis configuration (uses defaults if None)
+
+        Returns:
+            DataFrame with one row per window (see analyze_windows)
+        """
+        return analyze_windows(self.cube, rolling_windows(self.cube, months, step), config)
+
+    def sweep(
+        self,
+        semesters: List[str],
+        grid: Dict[str, List[Any]],
+        config: Optional[AnalysisConfig] = None
+    ) -> pd.DataFrame:
+        """
+        Compute summary counts for every point of a parameter grid.
+
+        Args:
+            semesters: Semester keys to sweep
+            grid: Mapping of parameter name -> values (see sweep_parameters)
+            config: Base configuration for parameters not in the grid
+
+        Returns:
+            DataFrame with one row per semester and grid point
+        """
+        for semester in semesters:
+            parse_semester(semester)
+        return sweep_parameters(self.inad_table, self.bazl_table, semesters, grid, config, self.cube)
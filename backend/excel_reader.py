@@ -0,0 +1,146 @@
+"""
+Excel Reader Module - Column-projected streaming reader for large workbooks
+
+Reads the first sheet of a workbook with openpyxl's read_only row iterator
+and keeps only the columns the analysis needs. The header row is named the
+way pandas.read_excel would name it, so the keyword-based column detection
+works unchanged, but peak memory and parse time follow the number of used
+columns instead of the full sheet width. Values are appended straight into
+one list per text column and one typed array per numeric column, so no
+per-row objects are kept while the sheet streams.
+"""
+
+import math
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+# Cell texts that pandas.read_excel treats as missing by default
+NA_STRINGS = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+}
+
+
+def _header_names(header_row: tuple) -> List[str]:
+    """Name header cells like pandas.read_excel (Unnamed: i, duplicate suffixes)."""
+    names = []
+    seen: Dict[str, int] = {}
+    for idx, value in enumerate(header_row):
+        if value is None or (isinstance(value, str) and value in NA_STRINGS):
+            name = f'Unnamed: {idx}'
+        else:
+            name = str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _clean_value(value):
+    """Map NA-like cell texts to None, as read_excel's default na_values do."""
+    if isinstance(value, str) and value in NA_STRINGS:
+        return None
+    return value
+
+
+def numeric_cell(value: Any) -> float:
+    """Cell value as a float, NaN if missing or not numeric (like pd.to_numeric(errors='coerce'))."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+def _numeric_series(values: array, integral: bool) -> pd.Series:
+    """Wrap a float array as a Series, int64 when every cell held an integer."""
+    data = np.frombuffer(values, dtype=np.float64) if len(values) else np.empty(0)
+    if integral and len(data):
+        data = data.astype(np.int64)
+    return pd.Series(data)
+
+
+def read_projected_columns(
+    file_path: str,
+    select_columns: Callable[[List[str]], Optional[Dict[str, str]]],
+    numeric: Optional[Dict[str, Callable[[Any], float]]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Stream the first sheet of a workbook, keeping only selected columns.
+
+    Args:
+        file_path: Path to the .xlsx/.xlsm workbook
+        select_columns: Called with the (stripped) header names; returns a
+            mapping of output name -> header name, or None if the header
+            alone is not enough to pick the columns
+        numeric: Output name -> converter of a cell value to float (NaN if
+            missing) for the numeric columns, e.g. numeric_cell; all other
+            columns keep the cell values as objects
+
+    Returns:
+        DataFrame with one column per selected output name (rows that are
+        blank in all selected columns are skipped), or None when
+        select_columns returned None. Numeric columns are int64 when every
+        kept cell held an integer, float64 otherwise.
+    """
+    numeric = numeric or {}
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+
+        header_row = next(rows, None)
+        if header_row is None:
+            names: List[str] = []
+        else:
+            names = [name.strip() for name in _header_names(header_row)]
+
+        selected = select_columns(names)
+        if selected is None:
+            return None
+
+        outputs = list(selected)
+        positions = [names.index(selected[out]) for out in outputs]
+        last = max(positions, default=-1)
+
+        # One growing column per output: floats for numeric, objects otherwise
+        columns = [array('d') if out in numeric else [] for out in outputs]
+        converters = [numeric.get(out) for out in outputs]
+        integral = [True] * len(outputs)
+
+        for row in ws.iter_rows(min_row=2, max_col=last + 1, values_only=True):
+            width = len(row)
+            picked = [_clean_value(row[pos]) if pos < width else None for pos in positions]
+            # Rows without a value in any kept column carry nothing the
+            # analysis can use (read_excel's trailing blank rows included)
+            if all(value is None for value in picked):
+                continue
+            for idx, value in enumerate(picked):
+                convert = converters[idx]
+                if convert is None:
+                    columns[idx].append(value)
+                else:
+                    if type(value) is not int:
+                        integral[idx] = False
+                    columns[idx].append(convert(value))
+    finally:
+        wb.close()
+
+    return pd.DataFrame({
+        out: (
+            pd.Series(col, dtype=object) if converters[idx] is None
+            else _numeric_series(col, integral[idx])
+        )
+        for idx, (out, col) in enumerate(zip(outputs, columns))
+    })
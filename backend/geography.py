@@ -3,8 +3,13 @@ Geography Module - Airport coordinate lookup for CASA Dashboard
 """
 
 import pandas as pd
-from typing import Dict, Optional, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import json
 import math
+import os
+
+from metrics import timed
 
 # Switzerland coordinates (destination for all routes)
 SWITZERLAND = {'lat': 46.8182, 'lng': 8.2275, 'name': 'Switzerland'}
@@ -104,13 +109,162 @@ AIRPORT_DATABASE = {
     'SCL': {'name': 'Arturo Merino Benitez', 'city': 'Santiago', 'country': 'CL', 'lat': -33.3930, 'lng': -70.7858},
 }
 
-# Try to load airportsdata package
-_airports_data = None
-try:
-    import airportsdata
-    _airports_data = airportsdata.load('IATA')
-except ImportError:
-    pass
+# Prebuilt compact airport index (regenerate with scripts/build_airport_index.py):
+# a sorted structured array of IATA codes with float32 coordinates, plus
+# string tables that the name/city/country fields index into
+AIRPORT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airport_index.npy')
+AIRPORT_STRINGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airport_index.json')
+
+AIRPORT_INDEX_DTYPE = np.dtype([
+    ('code', 'S3'),
+    ('lat', '<f4'),
+    ('lng', '<f4'),
+    ('name', '<u2'),
+    ('city', '<u2'),
+    ('country', '<u2')
+])
+
+# Airport index and string tables (loaded on first lookup)
+_airport_index: Optional[np.ndarray] = None
+_airport_strings: Optional[Dict[str, List[str]]] = None
+
+# Merged airport table (built on first use)
+_airport_table: Optional[pd.DataFrame] = None
+
+
+def _collect_airports() -> Tuple[Dict[str, Dict], str]:
+    """
+    Merge the airportsdata package (if installed) with AIRPORT_DATABASE.
+
+    Returns:
+        Tuple of (IATA code -> airport dict, source description)
+    """
+    airports = {code: dict(info) for code, info in AIRPORT_DATABASE.items()}
+    source = 'AIRPORT_DATABASE'
+
+    try:
+        import airportsdata
+    except ImportError:
+        return airports, source
+
+    for code, ap in airportsdata.load('IATA').items():
+        airports[code] = {
+            'name': ap.get('name', ''),
+            'city': ap.get('city', ''),
+            'country': ap.get('country', ''),
+            'lat': ap.get('lat', 0),
+            'lng': ap.get('lon', 0)
+        }
+    source = f"airportsdata {getattr(airportsdata, '__version__', '')} + AIRPORT_DATABASE".strip()
+    return airports, source
+
+
+def build_airport_index(airports: Dict[str, Dict]) -> Tuple[np.ndarray, Dict[str, List[str]]]:
+    """
+    Build the compact airport index from airport dictionaries.
+
+    Args:
+        airports: IATA code -> dict with name, city, country, lat, lng
+
+    Returns:
+        Tuple of (sorted AIRPORT_INDEX_DTYPE array, string tables)
+    """
+    tables: Dict[str, List[str]] = {'names': [], 'cities': [], 'countries': []}
+    interned: Dict[str, Dict[str, int]] = {key: {} for key in tables}
+
+    def intern(table: str, value) -> int:
+        value = value or ''
+        ids = interned[table]
+        if value not in ids:
+            ids[value] = len(tables[table])
+            tables[table].append(value)
+        return ids[value]
+
+    codes = sorted(code for code in airports if len(code) == 3 and code.isascii())
+    index = np.empty(len(codes), dtype=AIRPORT_INDEX_DTYPE)
+    for i, code in enumerate(codes):
+        ap = airports[code]
+        index[i] = (
+            code.encode('ascii'),
+            ap.get('lat', 0) or 0,
+            ap.get('lng', 0) or 0,
+            intern('names', ap.get('name')),
+            intern('cities', ap.get('city')),
+            intern('countries', ap.get('country'))
+        )
+
+    return index, tables
+
+
+def write_airport_index(index_path: str = AIRPORT_INDEX_PATH, strings_path: str = AIRPORT_STRINGS_PATH) -> int:
+    """
+    Rebuild the airport index files from airportsdata and AIRPORT_DATABASE.
+
+    Returns:
+        Number of airports written
+    """
+    airports, source = _collect_airports()
+    index, tables = build_airport_index(airports)
+
+    with open(index_path, 'wb') as f:
+        np.save(f, index)
+    with open(strings_path, 'w', encoding='utf-8') as f:
+        json.dump({'source': source, **tables}, f, ensure_ascii=False, separators=(',', ':'))
+
+    return len(index)
+
+
+def _load_airport_index() -> Tuple[np.ndarray, Dict[str, List[str]]]:
+    """Memory-map the airport index on first use (built in memory if the files are missing)."""
+    global _airport_index, _airport_strings
+
+    if _airport_index is None:
+        if os.path.exists(AIRPORT_INDEX_PATH) and os.path.exists(AIRPORT_STRINGS_PATH):
+            with open(AIRPORT_STRINGS_PATH, encoding='utf-8') as f:
+                strings = json.load(f)
+            index = np.load(AIRPORT_INDEX_PATH, mmap_mode='r')
+        else:
+            index, strings = build_airport_index(_collect_airports()[0])
+        _airport_strings = strings
+        _airport_index = index
+
+    return _airport_index, _airport_strings
+
+
+def _coordinate(value) -> float:
+    """Widen a stored float32 coordinate, dropping float32 noise digits."""
+    return round(float(value), 5)
+
+
+def get_airport_table() -> pd.DataFrame:
+    """
+    Get the merged airport table used for vectorized lookups.
+
+    Entries from the airportsdata package take precedence over the local
+    AIRPORT_DATABASE fallback, matching get_airport_info.
+
+    Returns:
+        DataFrame indexed by IATA code with name, city, country, lat, lng
+        and the precomputed distance to Switzerland in km
+    """
+    global _airport_table
+
+    if _airport_table is None:
+        index, strings = _load_airport_index()
+        table = pd.DataFrame(
+            {
+                'name': np.asarray(strings['names'], dtype=object)[index['name']],
+                'city': np.asarray(strings['cities'], dtype=object)[index['city']],
+                'country': np.asarray(strings['countries'], dtype=object)[index['country']],
+                'lat': [_coordinate(value) for value in index['lat'].tolist()],
+                'lng': [_coordinate(value) for value in index['lng'].tolist()]
+            },
+            index=pd.Index(np.char.decode(index['code'], 'ascii'), dtype=object)
+        )
+        table['distance'] = calculate_distances(table['lat'], table['lng'], SWITZERLAND['lat'], SWITZERLAND['lng'])
+        _airport_table = table
+
+    return _airport_table
 
 
 def get_airport_info(iata_code: str) -> Optional[Dict]:
@@ -125,16 +279,21 @@ def get_airport_info(iata_code: str) -> Optional[Dict]:
     """
     code = iata_code.upper().strip()
 
-    # Try airportsdata package first
-    if _airports_data and code in _airports_data:
-        ap = _airports_data[code]
-        return {
-            'name': ap.get('name', ''),
-            'city': ap.get('city', ''),
-            'country': ap.get('country', ''),
-            'lat': ap.get('lat', 0),
-            'lng': ap.get('lon', 0)
-        }
+    # Binary search in the sorted airport index
+    if len(code) == 3 and code.isascii():
+        index, strings = _load_airport_index()
+        key = code.encode('ascii')
+        codes = index['code']
+        pos = int(np.searchsorted(codes, key))
+        if pos < len(codes) and codes[pos] == key:
+            _, lat, lng, name, city, country = index[pos].tolist()
+            return {
+                'name': strings['names'][name],
+                'city': strings['cities'][city],
+                'country': strings['countries'][country],
+                'lat': _coordinate(lat),
+                'lng': _coordinate(lng)
+            }
 
     # Fall back to local database
     if code in AIRPORT_DATABASE:
@@ -183,6 +342,31 @@ def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
     return R * c
 
 
+def calculate_distances(lat1, lng1, lat2: float, lng2: float) -> np.ndarray:
+    """
+    Vectorized Haversine distance from many points to one point.
+
+    Args:
+        lat1, lng1: Arrays of point coordinates
+        lat2, lng2: Target point coordinates
+
+    Returns:
+        Array of distances in kilometers
+    """
+    R = 6371  # Earth's radius in km
+
+    lat1_rad = np.radians(np.asarray(lat1, dtype=float))
+    lat2_rad = math.radians(lat2)
+    dlat = math.radians(lat2) - lat1_rad
+    dlng = math.radians(lng2) - np.radians(np.asarray(lng1, dtype=float))
+
+    a = np.sin(dlat/2)**2 + np.cos(lat1_rad) * math.cos(lat2_rad) * np.sin(dlng/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return R * c
+
+
+@timed('enrich_routes')
 def enrich_routes_with_coordinates(df: pd.DataFrame) -> pd.DataFrame:
     """
     Add geographic coordinates to routes DataFrame.
@@ -194,28 +378,26 @@ def enrich_routes_with_coordinates(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with added coordinate columns
     """
     enriched = df.copy()
-
-    enriched['OriginLat'] = None
-    enriched['OriginLng'] = None
-    enriched['OriginCity'] = None
-    enriched['OriginCountry'] = None
-    enriched['Distance'] = None
-
-    for idx, row in enriched.iterrows():
-        coords = get_coordinates(row['LastStop'])
-        info = get_airport_info(row['LastStop'])
-
-        if coords:
-            enriched.at[idx, 'OriginLat'] = coords[0]
-            enriched.at[idx, 'OriginLng'] = coords[1]
-            enriched.at[idx, 'Distance'] = calculate_distance(
-                coords[0], coords[1],
-                SWITZERLAND['lat'], SWITZERLAND['lng']
-            )
-
-        if info:
-            enriched.at[idx, 'OriginCity'] = info.get('city', '')
-            enriched.at[idx, 'OriginCountry'] = info.get('country', '')
+    table = get_airport_table()
+
+    # Resolve each distinct code once, then broadcast to the rows
+    row_codes, uniques = pd.factorize(enriched['LastStop'])
+    keys = pd.Index(uniques).astype('string').str.upper().str.strip()
+    positions = table.index.get_indexer(keys)
+    rows = np.where(row_codes >= 0, positions[row_codes] if len(positions) else -1, -1)
+    found = rows >= 0
+
+    # Missing airports keep None, as the JSON output expects
+    def column(name: str) -> pd.Series:
+        out = np.full(len(enriched), None, dtype=object)
+        out[found] = table[name].to_numpy(dtype=object)[rows[found]]
+        return pd.Series(out, index=enriched.index, dtype=object)
+
+    enriched['OriginLat'] = column('lat')
+    enriched['OriginLng'] = column('lng')
+    enriched['OriginCity'] = column('city')
+    enriched['OriginCountry'] = column('country')
+    enriched['Distance'] = column('distance')
 
     return enriched
 
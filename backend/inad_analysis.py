@@ -5,13 +5,27 @@ Ported from v1 Streamlit application
 
 import pandas as pd
 import numpy as np
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, replace
+
+from data_cache import load_cached_table
+from excel_reader import numeric_cell, read_projected_columns
+from metrics import span, timed
+from monthly_cube import MonthlyCube, CubeWindow, key_to_month, month_key
 
 # Exclusion codes for INAD cases (not counted as systemic)
 EXCLUDE_CODES = {'B1n', 'B2n', 'C4n', 'C5n', 'C8', 'D1n', 'D2n', 'E', 'F1n', 'G', 'H', 'I'}
 
+# Priority categories (codes are the positions in this list)
+PRIORITY_LABELS = ['UNRELIABLE', 'NO_DATA', 'HIGH_PRIORITY', 'WATCH_LIST', 'CLEAR']
+PRIORITY_DTYPE = pd.CategoricalDtype(PRIORITY_LABELS)
+UNRELIABLE, NO_DATA, HIGH_PRIORITY, WATCH_LIST, CLEAR = range(len(PRIORITY_LABELS))
+
 # Default configuration
 DEFAULT_CONFIG = {
     'min_inad': 6,
@@ -36,6 +50,12 @@ class AnalysisConfig:
     systemic_semesters: int = 2
 
 
+def config_fingerprint(config: AnalysisConfig) -> str:
+    """Stable hash over every AnalysisConfig field."""
+    payload = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
 def excel_serial_to_date(serial: float) -> Optional[datetime]:
     """Convert Excel serial date to datetime"""
     try:
@@ -46,6 +66,268 @@ def excel_serial_to_date(serial: float) -> Optional[datetime]:
         return None
 
 
+def _normalize_year_month(df: pd.DataFrame, year_col: str, month_col: str) -> pd.DataFrame:
+    """Add nullable integer Year/Month columns and drop rows without a period."""
+    if pd.api.types.is_datetime64_any_dtype(df[year_col]):
+        years = pd.to_datetime(df[year_col], errors='coerce').dt.year
+    else:
+        years = pd.to_numeric(df[year_col], errors='coerce')
+
+    if pd.api.types.is_datetime64_any_dtype(df[month_col]):
+        months = pd.to_datetime(df[month_col], errors='coerce').dt.month
+    else:
+        months = pd.to_numeric(df[month_col], errors='coerce')
+
+    df['Year'] = years.astype('Int64')
+    df['Month'] = months.astype('Int64')
+    return df.dropna(subset=['Year', 'Month'])
+
+
+def _period_cell(part: str) -> Callable[[Any], float]:
+    """Cell converter for a Year/Month column: the date's year/month for date cells."""
+    def convert(value: Any) -> float:
+        if isinstance(value, date):
+            return float(getattr(value, part))
+        return numeric_cell(value)
+    return convert
+
+
+# Numeric columns of the projected INAD/BAZL reads and their cell converters
+INAD_NUMERIC_COLUMNS = {'Year': _period_cell('year'), 'Month': _period_cell('month')}
+BAZL_NUMERIC_COLUMNS = {**INAD_NUMERIC_COLUMNS, 'PAX': numeric_cell}
+
+
+def _text_column(values: pd.Series) -> pd.Series:
+    """Coerce a key column to strings, keeping missing values missing."""
+    return values.astype('string').astype(object).where(values.notna(), None)
+
+
+def _month_dates(df: pd.DataFrame) -> pd.Series:
+    """Build first-of-month dates from the normalized Year/Month columns."""
+    return pd.to_datetime(
+        df['Year'].astype(int).astype(str) + '-' + df['Month'].astype(int).astype(str).str.zfill(2) + '-01'
+    )
+
+
+def _select_inad_columns(columns: List[str]) -> Dict[str, str]:
+    """
+    Pick the INAD-Tabelle columns used by the analysis from the header names.
+
+    Args:
+        columns: Stripped header names of the INAD sheet
+
+    Returns:
+        Mapping of normalized name -> header name
+    """
+    # Expected columns (may vary by file version)
+    airline_col = None
+    laststop_col = None
+    year_col = None
+    month_col = None
+    code_col = None
+
+    # Find matching columns
+    for col in columns:
+        col_lower = col.lower()
+        if 'fluggesellschaft' in col_lower or 'airline' in col_lower or 'carrier' in col_lower:
+            airline_col = col
+        elif 'abflugort' in col_lower or 'last' in col_lower or 'stop' in col_lower:
+            laststop_col = col
+        elif 'jahr' in col_lower or 'year' in col_lower:
+            year_col = col
+        elif 'monat' in col_lower or 'month' in col_lower:
+            month_col = col
+        elif 'code' in col_lower or 'grund' in col_lower or 'reason' in col_lower:
+            code_col = col
+
+    if not all([airline_col, laststop_col, year_col, month_col]):
+        raise ValueError(f"Missing required columns. Found: {list(columns)}")
+
+    selected = {'Airline': airline_col, 'LastStop': laststop_col, 'Year': year_col, 'Month': month_col}
+    if code_col:
+        selected['Code'] = code_col
+    return selected
+
+
+def _parse_inad_workbook(file_path: str) -> pd.DataFrame:
+    """
+    Parse the INAD-Tabelle workbook into its normalized columns.
+
+    Only the airline, last stop, year, month and reason-code columns are
+    materialized (see excel_reader.read_projected_columns).
+
+    Args:
+        file_path: Path to INAD-Tabelle Excel file
+
+    Returns:
+        DataFrame with Airline, LastStop, Year, Month and Included columns
+    """
+    df = read_projected_columns(file_path, _select_inad_columns, INAD_NUMERIC_COLUMNS)
+
+    # Normalize year/month columns before building dates
+    df = _normalize_year_month(df, 'Year', 'Month')
+
+    # Determine if case is included (not in exclusion list)
+    if 'Code' in df.columns:
+        included = ~df['Code'].isin(EXCLUDE_CODES)
+    else:
+        included = pd.Series(True, index=df.index)
+
+    return pd.DataFrame({
+        'Airline': _text_column(df['Airline']),
+        'LastStop': _text_column(df['LastStop']),
+        'Year': df['Year'],
+        'Month': df['Month'],
+        'Included': included.astype(bool)
+    }).reset_index(drop=True)
+
+
+def _match_bazl_columns(columns: List[str]) -> Dict[str, Optional[str]]:
+    """Keyword-based detection of the BAZL-Daten columns (None if not found)."""
+    airline_col = None
+    airport_col = None
+    pax_col = None
+    year_col = None
+    month_col = None
+
+    # First pass: Try to identify columns with priority for specific patterns
+    for col in columns:
+        col_lower = col.lower()
+
+        # PAX column - check for various spellings including French "passagers"
+        if pax_col is None:
+            if 'pax' in col_lower or 'passenger' in col_lower or 'passagier' in col_lower or 'passager' in col_lower:
+                pax_col = col
+
+        # Airline column - prefer IATA code column
+        if 'iata' in col_lower and 'airline' in col_lower:
+            airline_col = col
+        elif airline_col is None and ('airline' in col_lower or 'carrier' in col_lower or 'fluggesellschaft' in col_lower):
+            airline_col = col
+
+        # Airport column - prefer IATA code column
+        if 'iata' in col_lower and 'flughafen' in col_lower:
+            airport_col = col
+        elif airport_col is None and ('airport' in col_lower or 'flughafen' in col_lower or 'abflugort' in col_lower):
+            airport_col = col
+
+        # Year and Month
+        if year_col is None and ('year' in col_lower or 'jahr' in col_lower):
+            year_col = col
+        if month_col is None and ('month' in col_lower or 'monat' in col_lower):
+            month_col = col
+
+    return {'Airline': airline_col, 'Airport': airport_col, 'PAX': pax_col, 'Year': year_col, 'Month': month_col}
+
+
+def _select_bazl_columns(columns: List[str]) -> Optional[Dict[str, str]]:
+    """Header-only BAZL column selection; None when dtype-based detection is needed."""
+    matched = _match_bazl_columns(columns)
+    if not all([matched['Airline'], matched['Airport'], matched['PAX']]):
+        return None
+    if not (matched['Year'] and matched['Month']):
+        del matched['Year'], matched['Month']
+    return matched
+
+
+def _read_bazl_full(file_path: str) -> pd.DataFrame:
+    """Read the whole BAZL sheet when the columns can't be chosen by header alone."""
+    df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
+
+    # Normalize column names
+    df.columns = df.columns.str.strip()
+    matched = _match_bazl_columns(df.columns)
+    airline_col = matched['Airline']
+    airport_col = matched['Airport']
+    pax_col = matched['PAX']
+
+    # Try alternative column detection
+    for col in df.columns:
+        if df[col].dtype == 'object' and airline_col is None:
+            airline_col = col
+        elif df[col].dtype == 'object' and airport_col is None:
+            airport_col = col
+        elif pd.api.types.is_numeric_dtype(df[col]) and pax_col is None:
+            pax_col = col
+
+    selected = {'Airline': airline_col, 'Airport': airport_col, 'PAX': pax_col}
+    if matched['Year'] and matched['Month']:
+        selected['Year'] = matched['Year']
+        selected['Month'] = matched['Month']
+    return pd.DataFrame({out: df[col] for out, col in selected.items()})
+
+
+def _parse_bazl_workbook(file_path: str) -> pd.DataFrame:
+    """
+    Parse the BAZL-Daten workbook into its normalized columns.
+
+    Args:
+        file_path: Path to BAZL-Daten Excel file
+
+    Returns:
+        DataFrame with Airline, Airport, PAX, Year and Month columns
+        (Year/Month are missing for every row if the file has no period columns)
+    """
+    df = read_projected_columns(file_path, _select_bazl_columns, BAZL_NUMERIC_COLUMNS)
+    if df is None:
+        df = _read_bazl_full(file_path)
+
+    if 'Year' in df.columns and 'Month' in df.columns:
+        df = _normalize_year_month(df, 'Year', 'Month')
+    else:
+        df['Year'] = pd.array([pd.NA] * len(df), dtype='Int64')
+        df['Month'] = pd.array([pd.NA] * len(df), dtype='Int64')
+
+    return pd.DataFrame({
+        'Airline': _text_column(df['Airline']),
+        'Airport': _text_column(df['Airport']),
+        'PAX': pd.to_numeric(df['PAX'], errors='coerce'),
+        'Year': df['Year'],
+        'Month': df['Month']
+    }).reset_index(drop=True)
+
+
+@timed('load_inad_table')
+def load_inad_table(file_path: str) -> pd.DataFrame:
+    """
+    Load the normalized INAD table, parsing the workbook only once.
+
+    The parsed columns are kept in a content-hash-keyed sidecar cache
+    (see data_cache), so later calls memory-map the cache instead of
+    re-reading the Excel file. Treat the returned frame as read-only.
+
+    Args:
+        file_path: Path to INAD-Tabelle Excel file
+
+    Returns:
+        DataFrame with Airline, LastStop, Year, Month and Included columns
+    """
+    try:
+        return load_cached_table(
+            file_path, 'inad', _parse_inad_workbook,
+            salt=','.join(sorted(EXCLUDE_CODES))
+        )
+    except Exception as e:
+        raise ValueError(f"Error loading INAD data: {str(e)}")
+
+
+@timed('load_bazl_table')
+def load_bazl_table(file_path: str) -> pd.DataFrame:
+    """
+    Load the normalized BAZL table, parsing the workbook only once.
+
+    Args:
+        file_path: Path to BAZL-Daten Excel file
+
+    Returns:
+        DataFrame with Airline, Airport, PAX, Year and Month columns
+    """
+    try:
+        return load_cached_table(file_path, 'bazl', _parse_bazl_workbook)
+    except Exception as e:
+        raise ValueError(f"Error loading BAZL data: {str(e)}")
+
+
 def load_inad_data(file_path: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
     """
     Load INAD data from Excel file and filter by date range.
@@ -58,177 +340,63 @@ def load_inad_data(file_path: str, start_date: datetime, end_date: datetime) ->
     Returns:
         DataFrame with INAD cases filtered by date
     """
-    try:
-        # Try to read the INAD Tabelle
-        df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
-
-        # Normalize column names
-        df.columns = df.columns.str.strip()
-
-        # Expected columns (may vary by file version)
-        airline_col = None
-        laststop_col = None
-        year_col = None
-        month_col = None
-        code_col = None
-
-        # Find matching columns
-        for col in df.columns:
-            col_lower = col.lower()
-            if 'fluggesellschaft' in col_lower or 'airline' in col_lower or 'carrier' in col_lower:
-                airline_col = col
-            elif 'abflugort' in col_lower or 'last' in col_lower or 'stop' in col_lower:
-                laststop_col = col
-            elif 'jahr' in col_lower or 'year' in col_lower:
-                year_col = col
-            elif 'monat' in col_lower or 'month' in col_lower:
-                month_col = col
-            elif 'code' in col_lower or 'grund' in col_lower or 'reason' in col_lower:
-                code_col = col
-
-        if not all([airline_col, laststop_col, year_col, month_col]):
-            raise ValueError(f"Missing required columns. Found: {df.columns.tolist()}")
-
-        # Normalize year/month columns before building dates
-        if pd.api.types.is_datetime64_any_dtype(df[year_col]):
-            years = pd.to_datetime(df[year_col], errors='coerce').dt.year
-        else:
-            years = pd.to_numeric(df[year_col], errors='coerce')
+    return inad_period(load_inad_table(file_path), start_date, end_date)
 
-        if pd.api.types.is_datetime64_any_dtype(df[month_col]):
-            months = pd.to_datetime(df[month_col], errors='coerce').dt.month
-        else:
-            months = pd.to_numeric(df[month_col], errors='coerce')
 
-        df['Year'] = years.astype('Int64')
-        df['Month'] = months.astype('Int64')
-        df = df.dropna(subset=['Year', 'Month'])
+def inad_period(df: pd.DataFrame, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    """
+    Filter a normalized INAD table to the cases of an analysis period.
+
+    Args:
+        df: Normalized INAD table (see load_inad_table)
+        start_date: Start of analysis period
+        end_date: End of analysis period
 
+    Returns:
+        DataFrame with INAD cases filtered by date
+    """
+    try:
         # Create date column from year and month
-        df['Date'] = pd.to_datetime(
-            df['Year'].astype(int).astype(str) + '-' + df['Month'].astype(int).astype(str).str.zfill(2) + '-01'
-        )
+        df = df.assign(Date=_month_dates(df))
 
         # Filter by date range
         df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
 
-        # Determine if case is included (not in exclusion list)
-        if code_col:
-            df['Included'] = ~df[code_col].isin(EXCLUDE_CODES)
-        else:
-            df['Included'] = True
-
-        # Rename columns for consistency
-        df = df.rename(columns={
-            airline_col: 'Airline',
-            laststop_col: 'LastStop'
-        })
-
         return df[['Airline', 'LastStop', 'Date', 'Included']].copy()
 
     except Exception as e:
         raise ValueError(f"Error loading INAD data: {str(e)}")
 
 
-def load_bazl_data(file_path: str, start_date: datetime, end_date: datetime) -> Tuple[Dict, pd.DataFrame]:
+def _load_bazl_period(file_path: str, start_date: datetime, end_date: datetime) -> Tuple[pd.Series, pd.DataFrame]:
+    """Aggregate BAZL PAX for a period as a (Airline, Airport) Series plus monthly PAX."""
+    return bazl_period(load_bazl_table(file_path), start_date, end_date)
+
+
+def bazl_period(df: pd.DataFrame, start_date: datetime, end_date: datetime) -> Tuple[pd.Series, pd.DataFrame]:
     """
-    Load BAZL passenger data from Excel file.
+    Aggregate a normalized BAZL table over an analysis period.
 
     Args:
-        file_path: Path to BAZL-Daten Excel file
+        df: Normalized BAZL table (see load_bazl_table)
         start_date: Start of analysis period
         end_date: End of analysis period
 
     Returns:
-        Tuple of (pax_lookup dict, monthly_pax DataFrame)
+        Tuple of (PAX Series indexed by (Airline, Airport), monthly_pax DataFrame)
     """
     try:
-        df = pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
-
-        # Normalize column names
-        df.columns = df.columns.str.strip()
-
-        # Find columns
-        airline_col = None
-        airport_col = None
-        pax_col = None
-        year_col = None
-        month_col = None
-
-        # First pass: Try to identify columns with priority for specific patterns
-        for col in df.columns:
-            col_lower = col.lower()
-
-            # PAX column - check for various spellings including French "passagers"
-            if pax_col is None:
-                if 'pax' in col_lower or 'passenger' in col_lower or 'passagier' in col_lower or 'passager' in col_lower:
-                    pax_col = col
-
-            # Airline column - prefer IATA code column
-            if 'iata' in col_lower and 'airline' in col_lower:
-                airline_col = col
-            elif airline_col is None and ('airline' in col_lower or 'carrier' in col_lower or 'fluggesellschaft' in col_lower):
-                airline_col = col
-
-            # Airport column - prefer IATA code column
-            if 'iata' in col_lower and 'flughafen' in col_lower:
-                airport_col = col
-            elif airport_col is None and ('airport' in col_lower or 'flughafen' in col_lower or 'abflugort' in col_lower):
-                airport_col = col
-
-            # Year and Month
-            if year_col is None and ('year' in col_lower or 'jahr' in col_lower):
-                year_col = col
-            if month_col is None and ('month' in col_lower or 'monat' in col_lower):
-                month_col = col
-
-        if not all([airline_col, airport_col, pax_col]):
-            # Try alternative column detection
-            for col in df.columns:
-                if df[col].dtype == 'object' and airline_col is None:
-                    airline_col = col
-                elif df[col].dtype == 'object' and airport_col is None:
-                    airport_col = col
-                elif pd.api.types.is_numeric_dtype(df[col]) and pax_col is None:
-                    pax_col = col
-
-        # Create date if year/month available
-        if year_col and month_col:
-            if pd.api.types.is_datetime64_any_dtype(df[year_col]):
-                years = pd.to_datetime(df[year_col], errors='coerce').dt.year
-            else:
-                years = pd.to_numeric(df[year_col], errors='coerce')
-
-            if pd.api.types.is_datetime64_any_dtype(df[month_col]):
-                months = pd.to_datetime(df[month_col], errors='coerce').dt.month
-            else:
-                months = pd.to_numeric(df[month_col], errors='coerce')
-
-            df['Year'] = years.astype('Int64')
-            df['Month'] = months.astype('Int64')
-            df = df.dropna(subset=['Year', 'Month'])
+        clean_df = df[['Airline', 'Airport', 'PAX']].copy()
 
-            df['Date'] = pd.to_datetime(
-                df['Year'].astype(int).astype(str) + '-' + df['Month'].astype(int).astype(str).str.zfill(2) + '-01'
-            )
-            df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
-
-        # Create a clean dataframe with only the columns we need
-        clean_df = pd.DataFrame({
-            'Airline': df[airline_col],
-            'Airport': df[airport_col],
-            'PAX': df[pax_col]
-        })
-
-        # Add date columns if they exist
-        if 'Year' in df.columns and 'Month' in df.columns:
+        # Filter by date if the file has year/month columns
+        if df['Year'].notna().any():
             clean_df['Year'] = df['Year']
             clean_df['Month'] = df['Month']
-        if 'Date' in df.columns:
-            clean_df['Date'] = df['Date']
+            clean_df['Date'] = _month_dates(df)
+            clean_df = clean_df[(clean_df['Date'] >= start_date) & (clean_df['Date'] <= end_date)]
 
-        # Create PAX lookup by (Airline, Airport)
-        pax_agg = clean_df.groupby(['Airline', 'Airport'])['PAX'].sum().to_dict()
+        # PAX by (Airline, Airport)
+        route_pax = clean_df.groupby(['Airline', 'Airport'])['PAX'].sum()
 
         # Also create monthly PAX for quality checks
         if 'Date' in clean_df.columns:
@@ -236,7 +404,61 @@ def load_bazl_data(file_path: str, start_date: datetime, end_date: datetime) ->
         else:
             monthly_pax = pd.DataFrame()
 
-        return pax_agg, monthly_pax
+        return route_pax, monthly_pax
+
+    except Exception as e:
+        raise ValueError(f"Error loading BAZL data: {str(e)}")
+
+
+def load_bazl_data(file_path: str, start_date: datetime, end_date: datetime) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Load BAZL passenger data from Excel file.
+
+    Args:
+        file_path: Path to BAZL-Daten Excel file
+        start_date: Start of analysis period
+        end_date: End of analysis period
+
+    Returns:
+        Tuple of (pax_lookup dict, monthly_pax DataFrame)
+    """
+    return bazl_lookup(load_bazl_table(file_path), start_date, end_date)
+
+
+def bazl_lookup(df: pd.DataFrame, start_date: datetime, end_date: datetime) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Aggregate a normalized BAZL table into the PAX lookup of a period.
+
+    Args:
+        df: Normalized BAZL table (see load_bazl_table)
+        start_date: Start of analysis period
+        end_date: End of analysis period
+
+    Returns:
+        Tuple of (pax_lookup dict, monthly_pax DataFrame)
+    """
+    try:
+        cube = MonthlyCube(bazl_table=df)
+        lo, hi = cube.window(start_date, end_date)
+
+        # PAX by (Airline, Airport) for routes with BAZL rows in the period
+        found = (cube.route_sums('pax_rows', lo, hi) > 0) & (cube.route_stop >= 0)
+        keys = zip(cube.airlines[cube.route_airline[found]], cube.stops[cube.route_stop[found]])
+        pax_lookup = dict(zip(keys, cube.route_sums('pax', lo, hi)[found].tolist()))
+
+        # Also create monthly PAX for quality checks
+        if not cube.pax_dated:
+            return pax_lookup, pd.DataFrame()
+        routes, months = np.nonzero(cube.month_values('pax_rows', lo, hi) * (cube.route_stop >= 0)[:, None])
+        keys = cube.first_month + np.arange(cube.n_months)
+        dates = _month_dates(pd.DataFrame({'Year': keys // 12, 'Month': keys % 12 + 1}))
+        monthly_pax = pd.DataFrame({
+            'Airline': cube.airlines[cube.route_airline[routes]],
+            'Airport': cube.stops[cube.route_stop[routes]],
+            'Date': dates.to_numpy()[lo + months],
+            'PAX': cube.month_values('pax', lo, hi)[routes, months]
+        })
+        return pax_lookup, monthly_pax
 
     except Exception as e:
         raise ValueError(f"Error loading BAZL data: {str(e)}")
@@ -289,64 +511,178 @@ def calculate_step2(inad_df: pd.DataFrame, step1_df: pd.DataFrame, config: Analy
     return step2_result
 
 
+def _pax_frame(pax_lookup: Union[Dict, pd.Series]) -> pd.DataFrame:
+    """Turn a (Airline, Airport) -> PAX mapping into a joinable frame."""
+    if isinstance(pax_lookup, pd.Series):
+        route_pax = pax_lookup
+    elif pax_lookup:
+        route_pax = pd.Series(
+            list(pax_lookup.values()),
+            index=pd.MultiIndex.from_tuples(list(pax_lookup.keys()))
+        )
+    else:
+        route_pax = pd.Series(
+            [], dtype='int64',
+            index=pd.MultiIndex.from_arrays([[], []])
+        )
+    return route_pax.rename('PAX').rename_axis(['Airline', 'LastStop']).reset_index()
+
+
 def calculate_step3(
     step2_df: pd.DataFrame,
-    pax_lookup: Dict,
+    pax_lookup: Union[Dict, pd.Series],
     config: AnalysisConfig,
     partner_mapping: Optional[Dict] = None
 ) -> pd.DataFrame:
     """
     Step 3: Calculate density and classify priority for each route.
 
+    PAX is attached with a left join against the aggregated BAZL data and
+    density, reliability and confidence are computed as column expressions.
+
     Args:
         step2_df: DataFrame with routes from step 2
-        pax_lookup: Dictionary of (Airline, Airport) -> PAX
+        pax_lookup: Dictionary (or MultiIndex Series) of (Airline, Airport) -> PAX
         config: Analysis configuration
         partner_mapping: Optional mapping of partner airlines
 
     Returns:
         DataFrame with density, confidence, and priority classification
     """
-    results = []
+    columns = ['Airline', 'LastStop', 'INAD_Count', 'PAX', 'Density', 'Confidence', 'IsReliable']
+    if step2_df.empty:
+        return pd.DataFrame(columns=columns)
 
-    for _, row in step2_df.iterrows():
-        airline = row['Airline']
-        laststop = row['LastStop']
-        inad_count = row['INAD_Count']
+    route_pax = _pax_frame(pax_lookup)
+    routes = step2_df[['Airline', 'LastStop', 'INAD_Count']].reset_index(drop=True)
 
-        # Get PAX (including partner airlines if applicable)
-        pax = pax_lookup.get((airline, laststop), 0)
+    # Get PAX (including partner airlines if applicable)
+    pax = routes.merge(route_pax, how='left', on=['Airline', 'LastStop'])['PAX']
+    found = pax.notna().any()
+    pax = pax.fillna(0)
 
-        if partner_mapping and airline in partner_mapping:
-            for partner in partner_mapping[airline]:
-                pax += pax_lookup.get((partner, laststop), 0)
+    if partner_mapping:
+        partners = pd.DataFrame(
+            [(airline, partner) for airline, group in partner_mapping.items() for partner in group],
+            columns=['Airline', 'Partner']
+        )
+        partner_pax = (
+            routes[['Airline', 'LastStop']].reset_index()
+            .merge(partners, on='Airline')
+            .drop(columns='Airline')
+            .rename(columns={'Partner': 'Airline'})
+            .merge(route_pax, how='left', on=['Airline', 'LastStop'])
+        )
+        found = found or partner_pax['PAX'].notna().any()
+        pax = pax.add(partner_pax.groupby('index')['PAX'].sum().reindex(pax.index), fill_value=0)
 
-        # Calculate density (per mille)
-        density = (inad_count / pax * 1000) if pax > 0 else None
+    # Routes without any PAX match keep integer zeros, as the lookup default did
+    if pd.api.types.is_integer_dtype(route_pax['PAX'].dtype) or not found:
+        pax = pax.astype('int64')
 
-        # Determine reliability
-        is_reliable = pax >= config.min_pax
+    routes['PAX'] = pax
+    routes = routes.assign(**_route_metrics(routes['INAD_Count'], routes['PAX'], config))
+    return routes[columns]
+
+
+def _window_counts(present: np.ndarray, counts: np.ndarray, min_inad: int, **keys) -> pd.DataFrame:
+    """
+    Build a step 1/2 count frame from cube totals.
+
+    The frame equals grouping the period's rows (present groups only),
+    filtering by min_inad and sorting by count, including its index labels.
+    Keys are code dictionaries indexed by row, or functions of the rows.
+    """
+    rows = np.flatnonzero(present)
+    keep = counts[rows] >= min_inad
+    selected = rows[keep]
+    columns = {
+        name: (values(selected) if callable(values) else values[selected])
+        for name, values in keys.items()
+    }
+    columns['INAD_Count'] = counts[selected]
+    frame = pd.DataFrame(columns, index=np.flatnonzero(keep))
+    return frame.sort_values('INAD_Count', ascending=False)
 
-        # Calculate confidence score
-        if pax < config.min_pax:
-            confidence = 0
-        else:
-            inad_score = min(100, (inad_count / 20) * 100)
-            pax_score = min(100, (pax / 100000) * 100)
-            confidence = int(0.6 * inad_score + 0.4 * pax_score)
-
-        results.append({
-            'Airline': airline,
-            'LastStop': laststop,
-            'INAD_Count': inad_count,
-            'PAX': pax,
-            'Density': density,
-            'Confidence': confidence,
-            'IsReliable': is_reliable
-        })
 
+def window_step1(window: CubeWindow, config: AnalysisConfig) -> pd.DataFrame:
+    """
+    Step 1 from a monthly cube window (same result as calculate_step1).
+
+    Args:
+        window: Month window of a MonthlyCube
+        config: Analysis configuration
+
+    Returns:
+        DataFrame with airlines exceeding threshold
+    """
+    counts = window.airline_inad
+    return _window_counts(
+        counts > 0,
+        counts,
+        config.min_inad,
+        Airline=window.cube.airlines
+    )
+
+
+def window_step2(window: CubeWindow, step1_df: pd.DataFrame, config: AnalysisConfig) -> pd.DataFrame:
+    """
+    Step 2 from a monthly cube window (same result as calculate_step2).
+
+    Args:
+        window: Month window of a MonthlyCube
+        step1_df: DataFrame with airlines from step 1
+        config: Analysis configuration
+
+    Returns:
+        DataFrame with routes exceeding threshold
+    """
+    cube = window.cube
+    valid_airlines = np.zeros(len(cube.airlines), dtype=bool)
+    valid_airlines[cube.airlines.get_indexer(pd.Index(step1_df['Airline']))] = True
+
+    counts = window.route_inad
+    return _window_counts(
+        valid_airlines[cube.route_airline] & (cube.route_stop >= 0) & (counts > 0),
+        counts,
+        config.min_inad,
+        Airline=lambda rows: cube.airlines[cube.route_airline[rows]],
+        LastStop=lambda rows: cube.stops[cube.route_stop[rows]]
+    )
+
+
+def window_step3(window: CubeWindow, step2_df: pd.DataFrame, config: AnalysisConfig) -> pd.DataFrame:
+    """
+    Step 3 from a monthly cube window (same result as calculate_step3).
+
+    Args:
+        window: Month window of a MonthlyCube
+        step2_df: DataFrame with routes from step 2
+        config: Analysis configuration
+
+    Returns:
+        DataFrame with density and confidence for each route
+    """
     columns = ['Airline', 'LastStop', 'INAD_Count', 'PAX', 'Density', 'Confidence', 'IsReliable']
-    return pd.DataFrame(results, columns=columns)
+    if step2_df.empty:
+        return pd.DataFrame(columns=columns)
+
+    positions = window.cube.route_positions(step2_df['Airline'], step2_df['LastStop'])
+    pax = window.route_pax[positions]
+
+    # Without any BAZL row behind the routes, PAX stays integer zeros
+    if window.cube.pax_dtype.kind != 'i' and not (window.route_pax_rows[positions] > 0).any():
+        pax = pax.astype('int64')
+
+    inad = step2_df['INAD_Count'].reset_index(drop=True)
+    pax = pd.Series(pax)
+    return pd.DataFrame({
+        'Airline': step2_df['Airline'].array,
+        'LastStop': step2_df['LastStop'].array,
+        'INAD_Count': inad,
+        'PAX': pax,
+        **_route_metrics(inad, pax, config)
+    }, columns=columns)
 
 
 def calculate_threshold(step3_df: pd.DataFrame, config: AnalysisConfig) -> float:
@@ -361,26 +697,79 @@ def calculate_threshold(step3_df: pd.DataFrame, config: AnalysisConfig) -> float
         Calculated threshold value
     """
     # Only use reliable data for threshold calculation
-    reliable_densities = step3_df[step3_df['IsReliable'] & step3_df['Density'].notna()]['Density']
+    density = pd.to_numeric(step3_df['Density'], errors='coerce').to_numpy(dtype=float)
+    reliable = step3_df['IsReliable'].to_numpy(dtype=bool)
+    return _density_threshold(density[reliable & ~np.isnan(density)], config)
 
+
+def _density_threshold(reliable_densities: np.ndarray, config: AnalysisConfig) -> float:
+    """Threshold rule of calculate_threshold on an array of reliable densities."""
     if len(reliable_densities) == 0:
         return config.min_density
 
     if config.threshold_method == 'median':
-        return reliable_densities.median()
+        return np.median(reliable_densities)
     elif config.threshold_method == 'trimmed_mean':
         # Remove top/bottom 10%
-        q_low = reliable_densities.quantile(0.1)
-        q_high = reliable_densities.quantile(0.9)
+        q_low, q_high = np.quantile(reliable_densities, [0.1, 0.9])
         trimmed = reliable_densities[(reliable_densities >= q_low) & (reliable_densities <= q_high)]
-        return trimmed.mean() if len(trimmed) > 0 else reliable_densities.median()
+        return trimmed.mean() if len(trimmed) > 0 else np.median(reliable_densities)
     else:  # mean
         return reliable_densities.mean()
 
 
+def _route_arrays(step3_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Extract the step 3 columns used by the priority rules as NumPy arrays."""
+    return {
+        'density': pd.to_numeric(step3_df['Density'], errors='coerce').to_numpy(dtype=float),
+        'pax': step3_df['PAX'].to_numpy(dtype=float),
+        'inad': step3_df['INAD_Count'].to_numpy(dtype=float),
+        'reliable': step3_df['IsReliable'].to_numpy(dtype=bool)
+    }
+
+
+def _priority_codes(
+    density: np.ndarray,
+    pax: np.ndarray,
+    inad: np.ndarray,
+    reliable: np.ndarray,
+    threshold: Any,
+    min_density: Any,
+    multiplier: Any,
+    min_inad: Any
+) -> np.ndarray:
+    """
+    Vectorized priority rules returning PRIORITY_LABELS codes.
+
+    Route arrays have shape (n,); every rule parameter may be a scalar or
+    any array that broadcasts against them (e.g. shape (k, 1) for k
+    thresholds), so a whole parameter grid is classified in one pass.
+    """
+    threshold = np.asarray(threshold, dtype=float)
+
+    with np.errstate(invalid='ignore'):
+        # WATCH_LIST criteria
+        watch = density >= threshold
+
+        # HIGH_PRIORITY criteria
+        high = (
+            watch &
+            (density >= min_density) &
+            (density >= threshold * multiplier) &
+            (inad >= min_inad)
+        )
+
+    no_data = np.isnan(density) | (pax == 0)
+
+    codes = np.where(high, HIGH_PRIORITY, np.where(watch, WATCH_LIST, CLEAR))
+    codes = np.where(no_data, NO_DATA, codes)
+    codes = np.where(reliable, codes, UNRELIABLE)
+    return codes.astype(np.int8)
+
+
 def classify_priority(
     step3_df: pd.DataFrame,
-    threshold: float,
+    threshold: Any,
     config: AnalysisConfig
 ) -> pd.DataFrame:
     """
@@ -388,37 +777,218 @@ def classify_priority(
 
     Args:
         step3_df: DataFrame with step 3 results
-        threshold: Calculated density threshold
+        threshold: Calculated density threshold (or one threshold per route)
         config: Analysis configuration
 
     Returns:
-        DataFrame with Priority column added
+        DataFrame with a categorical Priority column added
     """
     df = step3_df.copy()
+    codes = _priority_codes(
+        **_route_arrays(df),
+        threshold=threshold,
+        min_density=config.min_density,
+        multiplier=config.high_priority_multiplier,
+        min_inad=config.high_priority_min_inad
+    )
+    df['Priority'] = pd.Categorical.from_codes(codes, dtype=PRIORITY_DTYPE)
+    return df
 
-    def get_priority(row):
-        if not row['IsReliable']:
-            return 'UNRELIABLE'
-        if row['Density'] is None or row['PAX'] == 0:
-            return 'NO_DATA'
 
-        # HIGH_PRIORITY criteria
-        if (row['Density'] >= threshold and
-            row['Density'] >= config.min_density and
-            row['Density'] >= threshold * config.high_priority_multiplier and
-            row['INAD_Count'] >= config.high_priority_min_inad):
-            return 'HIGH_PRIORITY'
+def classify_priority_batch(
+    step3_df: pd.DataFrame,
+    thresholds: Any,
+    config: AnalysisConfig
+) -> np.ndarray:
+    """
+    Classify every route under a batch of density thresholds at once.
 
-        # WATCH_LIST criteria
-        if row['Density'] >= threshold:
-            return 'WATCH_LIST'
+    Args:
+        step3_df: DataFrame with step 3 results
+        thresholds: Sequence of k threshold values
+        config: Analysis configuration
 
-        return 'CLEAR'
+    Returns:
+        int8 label matrix of shape (k, n_routes); codes index PRIORITY_LABELS
+        (np.asarray(PRIORITY_LABELS)[matrix] gives the label strings)
+    """
+    thresholds = np.asarray(thresholds, dtype=float).reshape(-1, 1)
+    return _priority_codes(
+        **_route_arrays(step3_df),
+        threshold=thresholds,
+        min_density=config.min_density,
+        multiplier=config.high_priority_multiplier,
+        min_inad=config.high_priority_min_inad
+    )
 
-    df['Priority'] = df.apply(get_priority, axis=1)
-    return df
+
+# Relative density change over the flagged span that counts as a trend (%)
+TREND_CHANGE_PCT = 10
+
+
+def _calendar_gaps(semesters: List[str]) -> np.ndarray:
+    """
+    Mark where a chronological list of period keys skips calendar time.
+
+    Args:
+        semesters: Period keys ('2024-H1', ...) in chronological order
+
+    Returns:
+        Boolean array with one entry per neighbouring pair, True where the
+        second period does not start the day after the first one ends
+    """
+    bounds = [_period_bounds(label) for label in semesters]
+    return np.array(
+        [following[0] != previous[1] + timedelta(days=1) for previous, following in zip(bounds, bounds[1:])],
+        dtype=bool
+    )
 
 
+def _flag_runs(flagged: np.ndarray, gaps: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Longest and current (ending at the last semester) run of flagged semesters.
+
+    Args:
+        flagged: Boolean matrix of shape (n_routes, n_semesters)
+        gaps: Optional boolean array of length n_semesters - 1, True where
+            a column is not the calendar successor of the one before it;
+            runs never continue across a gap
+
+    Returns:
+        Tuple of (longest_run, current_run) integer arrays of length n_routes
+    """
+    if gaps is not None and gaps.any():
+        # An unflagged column for the missing semesters ends the runs there
+        flagged = np.insert(flagged, np.flatnonzero(gaps) + 1, False, axis=1)
+    n_routes, n_semesters = flagged.shape
+    padded = np.zeros((n_routes, n_semesters + 2), dtype=np.int8)
+    padded[:, 1:-1] = flagged
+    edges = np.diff(padded, axis=1)
+
+    # Run starts and ends come out row-major, so they pair up per route
+    start_rows, start_cols = np.nonzero(edges == 1)
+    _, end_cols = np.nonzero(edges == -1)
+    lengths = end_cols - start_cols
+
+    longest = np.zeros(n_routes, dtype=np.int64)
+    np.maximum.at(longest, start_rows, lengths)
+    current = np.zeros(n_routes, dtype=np.int64)
+    at_end = end_cols == n_semesters
+    current[start_rows[at_end]] = lengths[at_end]
+    return longest, current
+
+
+def _density_slopes(flagged: np.ndarray, density: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Least-squares density slope per semester over each route's flagged semesters.
+
+    Args:
+        flagged: Boolean matrix of shape (n_routes, n_semesters)
+        density: Density matrix of the same shape
+
+    Returns:
+        Tuple of (slope, change_pct): the fitted slope and the fitted change
+        across the flagged span relative to the mean density (in %); NaN for
+        routes with fewer than two usable points
+    """
+    x = np.arange(flagged.shape[1], dtype=float)
+    w = (flagged & np.isfinite(density) & (density != 0)).astype(float)
+    y = np.where(w > 0, density, 0.0)
+
+    n = w.sum(axis=1)
+    sum_x = w @ x
+    sum_y = y.sum(axis=1)
+    sum_xx = w @ (x * x)
+    sum_xy = (y * x).sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_x = sum_xx - sum_x * sum_x / n
+        slope = (sum_xy - sum_x * sum_y / n) / var_x
+        span = np.where(w > 0, x, np.nan)
+        span = np.nanmax(span, axis=1, initial=-np.inf) - np.nanmin(span, axis=1, initial=np.inf)
+        change_pct = slope * span / (sum_y / n) * 100
+
+    usable = (n >= 2) & (var_x > 0)
+    return np.where(usable, slope, np.nan), np.where(usable, change_pct, np.nan)
+
+
+def systemic_from_matrices(
+    routes: List[Tuple[str, str]],
+    semesters: List[str],
+    priority: np.ndarray,
+    density: np.ndarray,
+    config: AnalysisConfig
+) -> pd.DataFrame:
+    """
+    Detect systemic cases from route-by-semester priority and density matrices.
+
+    Args:
+        routes: (airline, lastStop) per matrix row, in output order
+        semesters: Semester label per matrix column, in chronological order;
+            the list may skip semesters, which then break consecutive runs
+        priority: PRIORITY_LABELS codes (negative where a route is absent)
+        density: Densities (NaN where a route is absent)
+        config: Analysis configuration
+
+    Returns:
+        DataFrame with one row per route flagged in at least
+        config.systemic_semesters semesters
+    """
+    columns = [
+        'Airline', 'LastStop', 'Appearances', 'Consecutive', 'LongestStreak',
+        'CurrentStreak', 'Trend', 'Slope', 'LatestPriority', 'History'
+    ]
+    flagged = (priority == HIGH_PRIORITY) | (priority == WATCH_LIST)
+    appearances = flagged.sum(axis=1)
+    rows = np.flatnonzero((appearances >= config.systemic_semesters) & (appearances > 0))
+    if len(rows) == 0:
+        return pd.DataFrame(columns=columns)
+
+    flagged = flagged[rows]
+    priority = priority[rows]
+    density = density[rows]
+    appearances = appearances[rows]
+
+    longest, current = _flag_runs(flagged, _calendar_gaps(semesters))
+    slope, change_pct = _density_slopes(flagged, density)
+    trend = np.where(
+        change_pct > TREND_CHANGE_PCT, 'WORSENING',
+        np.where(change_pct < -TREND_CHANGE_PCT, 'IMPROVING', 'STABLE')
+    )
+    last = flagged.shape[1] - 1 - flagged[:, ::-1].argmax(axis=1)
+    latest = np.asarray(PRIORITY_LABELS)[priority[np.arange(len(rows)), last]]
+
+    # Flagged appearances per route, row-major so they group by route
+    hit_rows, hit_cols = np.nonzero(flagged)
+    labels = np.asarray(PRIORITY_LABELS)[priority[hit_rows, hit_cols]]
+    splits = np.cumsum(appearances)[:-1]
+    histories = [
+        [
+            {'Semester': semesters[col], 'Priority': label, 'Density': dens}
+            for col, label, dens in zip(cols, route_labels, route_density)
+        ]
+        for cols, route_labels, route_density in zip(
+            np.split(hit_cols, splits),
+            np.split(labels, splits),
+            np.split(density[hit_rows, hit_cols], splits)
+        )
+    ]
+
+    return pd.DataFrame({
+        'Airline': [routes[row][0] for row in rows],
+        'LastStop': [routes[row][1] for row in rows],
+        'Appearances': appearances,
+        'Consecutive': longest >= config.systemic_semesters,
+        'LongestStreak': longest,
+        'CurrentStreak': current,
+        'Trend': trend,
+        'Slope': slope,
+        'LatestPriority': latest,
+        'History': histories
+    }, columns=columns)
+
+
+@timed('detect_systemic_cases')
 def detect_systemic_cases(
     semester_results: List[Tuple[str, pd.DataFrame]],
     config: AnalysisConfig
@@ -426,75 +996,212 @@ def detect_systemic_cases(
     """
     Detect systemic cases across multiple semesters.
 
+    Flagged (HIGH_PRIORITY/WATCH_LIST) routes are pivoted into a route by
+    semester matrix; appearance counts, consecutive runs and density trends
+    are then computed for all routes at once. A case is Consecutive when it
+    was flagged in at least config.systemic_semesters calendar-adjacent
+    semesters (a semester missing from the list breaks a run);
+    Trend follows the least-squares density slope over the flagged
+    semesters (a fitted change above TREND_CHANGE_PCT of the mean density).
+
     Args:
-        semester_results: List of (semester_label, step3_df) tuples
+        semester_results: List of (semester_label, step3_df) tuples, in
+            chronological order
         config: Analysis configuration
 
     Returns:
         DataFrame with systemic case analysis
     """
-    # Track route appearances
-    route_history = {}
-
-    for semester_label, df in semester_results:
+    semesters = [label for label, _ in semester_results]
+    frames = []
+    for col, (_, df) in enumerate(semester_results):
         flagged = df[df['Priority'].isin(['HIGH_PRIORITY', 'WATCH_LIST'])]
+        frames.append(pd.DataFrame({
+            'Airline': flagged['Airline'].to_numpy(),
+            'LastStop': flagged['LastStop'].to_numpy(),
+            'Priority': pd.Categorical(flagged['Priority'], dtype=PRIORITY_DTYPE).codes,
+            'Density': pd.to_numeric(flagged['Density'], errors='coerce').to_numpy(dtype=float),
+            'Column': col
+        }))
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(
+        columns=['Airline', 'LastStop', 'Priority', 'Density', 'Column']
+    )
+
+    # Routes in order of first flagged appearance
+    route_codes, route_index = pd.factorize(pd.MultiIndex.from_arrays([rows['Airline'], rows['LastStop']]))
+    priority = np.full((len(route_index), len(semesters)), -1, dtype=np.int8)
+    density = np.full((len(route_index), len(semesters)), np.nan)
+    columns = rows['Column'].to_numpy(dtype=np.int64)
+    priority[route_codes, columns] = rows['Priority'].to_numpy(dtype=np.int8)
+    density[route_codes, columns] = rows['Density'].to_numpy(dtype=float)
+
+    return systemic_from_matrices(list(route_index), semesters, priority, density, config)
+
+
+# Config fields read directly by each pipeline stage, in pipeline order. A
+# stage is cached under its own fields plus those of every upstream stage,
+# so a config change only recomputes stages from the first one that reads a
+# changed field (e.g. min_density or the multiplier only re-run classify).
+STAGE_DEPENDENCIES = OrderedDict([
+    ('step1', ('min_inad',)),
+    ('step2', ('min_inad',)),
+    ('step3', ('min_pax',)),
+    ('threshold', ('threshold_method', 'min_density')),
+    ('classify', ('min_density', 'high_priority_multiplier', 'high_priority_min_inad')),
+])
+
+
+def stage_fields(stage: str) -> Tuple[str, ...]:
+    """Return every config field a stage depends on, directly or upstream."""
+    fields: List[str] = []
+    for name, direct in STAGE_DEPENDENCIES.items():
+        fields.extend(direct)
+        if name == stage:
+            return tuple(dict.fromkeys(fields))
+    raise ValueError(f"Unknown pipeline stage: {stage}")
+
+
+class AnalysisPipeline:
+    """
+    Single-period analysis pipeline with cached stages.
 
-        for _, row in flagged.iterrows():
-            key = (row['Airline'], row['LastStop'])
-            if key not in route_history:
-                route_history[key] = []
-            route_history[key].append({
-                'Semester': semester_label,
-                'Priority': row['Priority'],
-                'Density': row['Density']
-            })
-
-    # Build systemic cases
-    systemic_cases = []
-
-    for (airline, laststop), history in route_history.items():
-        appearances = len(history)
-
-        # Check for consecutive appearances
-        consecutive = appearances >= config.systemic_semesters
-
-        # Calculate trend
-        if len(history) >= 2:
-            first_density = history[0]['Density']
-            last_density = history[-1]['Density']
-            if first_density and last_density:
-                change = (last_density - first_density) / first_density * 100
-                if change > 10:
-                    trend = 'WORSENING'
-                elif change < -10:
-                    trend = 'IMPROVING'
-                else:
-                    trend = 'STABLE'
-            else:
-                trend = 'STABLE'
-        else:
-            trend = 'STABLE'
-
-        if appearances >= config.systemic_semesters:
-            systemic_cases.append({
-                'Airline': airline,
-                'LastStop': laststop,
-                'Appearances': appearances,
-                'Consecutive': consecutive,
-                'Trend': trend,
-                'LatestPriority': history[-1]['Priority'],
-                'History': history
-            })
-
-    return pd.DataFrame(systemic_cases)
-
+    Holds the loaded INAD cases and PAX of one period. Each stage result is
+    cached under the values of the config fields it depends on (see
+    STAGE_DEPENDENCIES), so re-running with a changed config only recomputes
+    the stages downstream of the changed fields.
+    """
 
+    def __init__(
+        self,
+        inad_df: Optional[pd.DataFrame],
+        route_pax: Optional[pd.Series],
+        monthly_pax: Optional[pd.DataFrame] = None,
+        max_entries: int = 16,
+        window: Optional[CubeWindow] = None
+    ):
+        self.inad_df = inad_df
+        self.route_pax = route_pax
+        self.monthly_pax = monthly_pax if monthly_pax is not None else pd.DataFrame()
+        # Cube window the steps are reduced from instead of the INAD rows
+        self.window = window
+        self.total_inad = window.total_inad if window is not None else inad_df['Included'].sum()
+        self.max_entries = max_entries
+        self.stage_runs = {stage: 0 for stage in STAGE_DEPENDENCIES}
+        self._stage_fields = {stage: stage_fields(stage) for stage in STAGE_DEPENDENCIES}
+        self._cache: Dict[str, OrderedDict] = {stage: OrderedDict() for stage in STAGE_DEPENDENCIES}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_tables(
+        cls,
+        inad_table: pd.DataFrame,
+        bazl_table: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime
+    ) -> 'AnalysisPipeline':
+        """Build a pipeline for a period from normalized INAD and BAZL tables."""
+        route_pax, monthly_pax = bazl_period(bazl_table, start_date, end_date)
+        return cls(inad_period(inad_table, start_date, end_date), route_pax, monthly_pax)
+
+    @classmethod
+    def from_cube(cls, cube: MonthlyCube, start_date: datetime, end_date: datetime) -> 'AnalysisPipeline':
+        """Build a pipeline for a period from a monthly count cube."""
+        return cls(None, None, window=CubeWindow.from_dates(cube, start_date, end_date))
+
+    def _stage_key(self, stage: str, config: AnalysisConfig) -> tuple:
+        return tuple(getattr(config, name) for name in self._stage_fields[stage])
+
+    def cached(self, stage: str, config: AnalysisConfig) -> bool:
+        """Return True if a stage result for this config is already cached."""
+        with self._lock:
+            return self._stage_key(stage, config) in self._cache[stage]
+
+    def _stage(self, stage: str, config: AnalysisConfig, compute):
+        """Return a cached stage result, computing it on a miss."""
+        key = self._stage_key(stage, config)
+        cache = self._cache[stage]
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        with span(stage):
+            value = compute()
+
+        with self._lock:
+            self.stage_runs[stage] += 1
+            cache[key] = value
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+        return value
+
+    def step1(self, config: AnalysisConfig) -> pd.DataFrame:
+        """Step 1 airlines for a config (cached)."""
+        if self.window is not None:
+            return self._stage('step1', config, lambda: window_step1(self.window, config))
+        return self._stage('step1', config, lambda: calculate_step1(self.inad_df, config))
+
+    def step2(self, config: AnalysisConfig) -> pd.DataFrame:
+        """Step 2 routes for a config (cached)."""
+        if self.window is not None:
+            return self._stage('step2', config, lambda: window_step2(self.window, self.step1(config), config))
+        return self._stage('step2', config, lambda: calculate_step2(self.inad_df, self.step1(config), config))
+
+    def step3(self, config: AnalysisConfig) -> pd.DataFrame:
+        """Unclassified step 3 routes with PAX and density for a config (cached)."""
+        if self.window is not None:
+            return self._stage('step3', config, lambda: window_step3(self.window, self.step2(config), config))
+        return self._stage('step3', config, lambda: calculate_step3(self.step2(config), self.route_pax, config))
+
+    def threshold(self, config: AnalysisConfig) -> float:
+        """Density threshold for a config (cached)."""
+        return self._stage('threshold', config, lambda: calculate_threshold(self.step3(config), config))
+
+    def run(self, config: Optional[AnalysisConfig] = None) -> Dict[str, Any]:
+        """
+        Run the pipeline, reusing every stage whose inputs are unchanged.
+
+        Args:
+            config: Analysis configuration (uses defaults if None)
+
+        Returns:
+            Dictionary containing all analysis results
+        """
+        if config is None:
+            config = AnalysisConfig()
+
+        # Run analysis steps
+        step1_df = self.step1(config)
+        step2_df = self.step2(config)
+        step3_df = self.step3(config)
+
+        # Calculate threshold and classify
+        threshold = self.threshold(config)
+
+        def classify():
+            classified = classify_priority(step3_df, threshold, config)
+            return classified, _summarize(self.total_inad, classified, threshold, config)
+
+        classified_df, summary = self._stage('classify', config, classify)
+
+        return {
+            'step1': step1_df,
+            'step2': step2_df,
+            'step3': classified_df,
+            'summary': summary,
+            'threshold': threshold,
+            'config': config
+        }
+
+
+@timed('run_full_analysis')
 def run_full_analysis(
     inad_path: str,
     bazl_path: str,
-    start_date: datetime,
-    end_date: datetime,
-    config: Optional[AnalysisConfig] = None
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    config: Optional[AnalysisConfig] = None,
+    window: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Run the complete INAD analysis pipeline.
@@ -505,6 +1212,7 @@ def run_full_analysis(
         start_date: Analysis period start
         end_date: Analysis period end
         config: Analysis configuration (uses defaults if None)
+        window: Month window instead of start/end dates (see parse_window)
 
     Returns:
         Dictionary containing all analysis results
@@ -512,22 +1220,238 @@ def run_full_analysis(
     if config is None:
         config = AnalysisConfig()
 
-    # Load data
-    inad_df = load_inad_data(inad_path, start_date, end_date)
-    pax_lookup, monthly_pax = load_bazl_data(bazl_path, start_date, end_date)
+    if window is not None:
+        start_date, end_date = parse_window(window)
+    elif start_date is None or end_date is None:
+        raise ValueError("Either start_date and end_date or a window is required")
+
+    # Aggregate both workbooks once; the steps are reductions over the cube
+    inad_table = load_inad_table(inad_path)
+    bazl_table = load_bazl_table(bazl_path)
+    with span('monthly_cube'):
+        cube = MonthlyCube(inad_table, bazl_table)
+    return AnalysisPipeline.from_cube(cube, start_date, end_date).run(config)
+
 
-    # Run analysis steps
-    step1_df = calculate_step1(inad_df, config)
-    step2_df = calculate_step2(inad_df, step1_df, config)
-    step3_df = calculate_step3(step2_df, pax_lookup, config)
+def parse_semester(semester: str) -> Tuple[datetime, datetime]:
+    """
+    Convert a semester key like '2024-H1' into its date range.
+
+    Args:
+        semester: Semester key ('YYYY-H1' or 'YYYY-H2')
+
+    Returns:
+        Tuple of (start_date, end_date)
+    """
+    year, half = semester.split('-')
+    year = int(year)
+
+    if half == 'H1':
+        return datetime(year, 1, 1), datetime(year, 6, 30)
+    if half == 'H2':
+        return datetime(year, 7, 1), datetime(year, 12, 31)
+    raise ValueError(f"Invalid semester: {semester}")
+
+
+def _month_end(year: int, month: int) -> datetime:
+    """Last day of a calendar month."""
+    next_year, next_month = key_to_month(month_key(year, month) + 1)
+    return datetime(next_year, next_month, 1) - timedelta(days=1)
+
+
+def _period_bounds(period: str) -> Tuple[datetime, datetime]:
+    """Date range of a single period key: 'YYYY', 'YYYY-H1', 'YYYY-Q3' or 'YYYY-MM'."""
+    parts = period.split('-')
+    year = int(parts[0])
+    if len(parts) == 1:
+        return datetime(year, 1, 1), datetime(year, 12, 31)
+    if len(parts) != 2:
+        raise ValueError(period)
+
+    part = parts[1].upper()
+    if part in ('H1', 'H2'):
+        return parse_semester(f'{year}-{part}')
+    if part[:1] == 'Q' and part[1:] in ('1', '2', '3', '4'):
+        first = (int(part[1]) - 1) * 3 + 1
+        return datetime(year, first, 1), _month_end(year, first + 2)
+    month = int(part)
+    if not 1 <= month <= 12:
+        raise ValueError(period)
+    return datetime(year, month, 1), _month_end(year, month)
+
+
+def parse_window(window: str) -> Tuple[datetime, datetime]:
+    """
+    Convert a month window key into its date range.
+
+    A window is a period key ('2024' calendar year, '2024-H1' semester,
+    '2024-Q3' quarter or '2024-05' month) or a 'START:END' range of period
+    keys, e.g. '2023-07:2024-06' for a custom twelve months.
 
-    # Calculate threshold and classify
-    threshold = calculate_threshold(step3_df, config)
-    classified_df = classify_priority(step3_df, threshold, config)
+    Args:
+        window: Window key
 
-    # Calculate summary statistics
-    summary = {
-        'total_inad': int(inad_df['Included'].sum()),
+    Returns:
+        Tuple of (start_date, end_date)
+    """
+    try:
+        start, _, end = window.strip().partition(':')
+        start_date = _period_bounds(start.strip())[0]
+        end_date = _period_bounds((end or start).strip())[1]
+    except (ValueError, IndexError):
+        raise ValueError(f"Invalid window: {window}")
+
+    if start_date > end_date:
+        raise ValueError(f"Invalid window: {window} (start after end)")
+    return start_date, end_date
+
+
+def window_label(start_date: datetime, end_date: datetime) -> str:
+    """Canonical 'YYYY-MM:YYYY-MM' key of a month window."""
+    return f'{start_date.year}-{start_date.month:02d}:{end_date.year}-{end_date.month:02d}'
+
+
+def rolling_windows(cube: MonthlyCube, months: int, step: int = 1) -> List[str]:
+    """
+    Keys of the complete windows of a given length sliding over the cube.
+
+    Args:
+        cube: Monthly count cube
+        months: Window length in months
+        step: Months between window starts
+
+    Returns:
+        Window keys in chronological order
+    """
+    if months < 1 or step < 1:
+        raise ValueError("Window length and step must be at least one month")
+
+    windows = []
+    for lo in range(0, cube.n_months - months + 1, step):
+        start = key_to_month(cube.first_month + lo)
+        end = key_to_month(cube.first_month + lo + months - 1)
+        windows.append(f'{start[0]}-{start[1]:02d}:{end[0]}-{end[1]:02d}')
+    return windows
+
+
+def analyze_windows(
+    cube: MonthlyCube,
+    windows: List[str],
+    config: Optional[AnalysisConfig] = None
+) -> pd.DataFrame:
+    """
+    Compute summary counts for many month windows in one pass over the cube.
+
+    All windows' route and airline totals come from one prefix-sum
+    subtraction; steps 1-3 become masks over the resulting (route, window)
+    matrices and every window is classified in a single broadcast of the
+    priority rules. Only the thresholds are computed per window.
+
+    Args:
+        cube: Monthly count cube
+        windows: Window keys (see parse_window)
+        config: Analysis configuration (uses defaults if None)
+
+    Returns:
+        DataFrame with one row per window: Window, Start, End, threshold,
+        total_inad and the summary counts
+    """
+    if config is None:
+        config = AnalysisConfig()
+
+    columns = ['Window', 'Start', 'End', 'threshold', 'total_inad',
+               'high_priority', 'watch_list', 'unreliable', 'clear']
+    if not windows:
+        return pd.DataFrame(columns=columns)
+
+    dates = [parse_window(window) for window in windows]
+    bounds = np.array([cube.window(start, end) for start, end in dates], dtype=np.int64).reshape(-1, 2)
+    lo, hi = bounds[:, 0], bounds[:, 1]
+
+    # Step 1 and 2 as masks over (airline|route, window) totals
+    route_inad = cube.route_sums('included', lo, hi)
+    airline_inad = cube.airline_sums(route_inad)
+    step1 = (airline_inad > 0) & (airline_inad >= config.min_inad)
+    step2 = (
+        step1[cube.route_airline] &
+        (cube.route_stop >= 0)[:, None] &
+        (route_inad > 0) &
+        (route_inad >= config.min_inad)
+    )
+
+    # Step 3 metrics for every route and window
+    inad = route_inad.astype(float)
+    pax = cube.route_sums('pax', lo, hi).astype(float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        density = np.where(pax > 0, inad / pax * 1000, np.nan)
+    reliable = pax >= config.min_pax
+
+    usable = step2 & reliable & ~np.isnan(density)
+    thresholds = np.array([
+        _density_threshold(density[usable[:, k], k], config)
+        for k in range(len(windows))
+    ], dtype=float)
+
+    codes = _priority_codes(
+        density=density.T,
+        pax=pax.T,
+        inad=inad.T,
+        reliable=reliable.T,
+        threshold=thresholds[:, None],
+        min_density=config.min_density,
+        multiplier=config.high_priority_multiplier,
+        min_inad=config.high_priority_min_inad
+    )
+    included = step2.T
+
+    return pd.DataFrame({
+        'Window': [window_label(start, end) for start, end in dates],
+        'Start': [start.strftime('%Y-%m-%d') for start, _ in dates],
+        'End': [end.strftime('%Y-%m-%d') for _, end in dates],
+        'threshold': thresholds,
+        'total_inad': cube.total(lo, hi).astype(np.int64),
+        'high_priority': ((codes == HIGH_PRIORITY) & included).sum(axis=1),
+        'watch_list': ((codes == WATCH_LIST) & included).sum(axis=1),
+        'unreliable': ((codes == UNRELIABLE) & included).sum(axis=1),
+        'clear': ((codes == CLEAR) & included).sum(axis=1)
+    }, columns=columns)
+
+
+def _semester_keys(table: pd.DataFrame) -> pd.Series:
+    """Tag each normalized row with its 'YYYY-H1'/'YYYY-H2' semester key."""
+    months = table['Month']
+    valid = months.between(1, 12).fillna(False).to_numpy(dtype=bool)
+    first_half = months.le(6).fillna(False).to_numpy(dtype=bool)
+    keys = table['Year'].astype('string') + np.where(first_half, '-H1', '-H2')
+    return keys.where(valid)
+
+
+def _route_metrics(inad_counts: pd.Series, pax: pd.Series, config: AnalysisConfig) -> Dict[str, np.ndarray]:
+    """
+    Compute density, reliability and confidence for whole route columns.
+
+    Mirrors the per-route formulas of calculate_step3 as NumPy expressions.
+    """
+    inad = inad_counts.to_numpy(dtype=float)
+    pax_values = pax.to_numpy(dtype=float)
+
+    # Density (per mille), missing when there is no PAX
+    with np.errstate(divide='ignore', invalid='ignore'):
+        density = np.where(pax_values > 0, inad / pax_values * 1000, np.nan)
+
+    is_reliable = pax_values >= config.min_pax
+
+    inad_score = np.minimum(100, (inad / 20) * 100)
+    pax_score = np.minimum(100, (pax_values / 100000) * 100)
+    confidence = np.where(is_reliable, (0.6 * inad_score + 0.4 * pax_score).astype(np.int64), 0)
+
+    return {'Density': density, 'Confidence': confidence, 'IsReliable': is_reliable}
+
+
+def _summarize(total_inad: int, classified_df: pd.DataFrame, threshold: float, config: AnalysisConfig) -> Dict[str, Any]:
+    """Build the summary statistics block of an analysis result."""
+    return {
+        'total_inad': int(total_inad),
         'high_priority': int((classified_df['Priority'] == 'HIGH_PRIORITY').sum()),
         'watch_list': int((classified_df['Priority'] == 'WATCH_LIST').sum()),
         'unreliable': int((classified_df['Priority'] == 'UNRELIABLE').sum()),
@@ -536,92 +1460,289 @@ def run_full_analysis(
         'method': config.threshold_method
     }
 
+
+@timed('analyze_semesters')
+def analyze_semesters(
+    inad_table: pd.DataFrame,
+    bazl_table: pd.DataFrame,
+    semesters: List[str],
+    config: Optional[AnalysisConfig] = None,
+    cube: Optional[MonthlyCube] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the analysis pipeline for many semesters in one pass over the cube.
+
+    Route, airline and overall totals of all semesters come from a single
+    prefix-sum subtraction per measure; each semester's steps are then
+    reductions of its slice (see window_step1/2/3).
+
+    Args:
+        inad_table: Normalized INAD table (see load_inad_table)
+        bazl_table: Normalized BAZL table (see load_bazl_table)
+        semesters: Semester keys to analyze (e.g. ['2024-H1', '2024-H2'])
+        config: Analysis configuration (uses defaults if None)
+        cube: Monthly count cube of the two tables (built if None)
+
+    Returns:
+        Dictionary of semester -> results dict (same layout as run_full_analysis)
+    """
+    if config is None:
+        config = AnalysisConfig()
+    if cube is None:
+        with span('monthly_cube'):
+            cube = MonthlyCube(inad_table, bazl_table)
+
+    semesters = list(dict.fromkeys(semesters))
+    bounds = np.array(
+        [cube.window(*parse_semester(sem)) for sem in semesters], dtype=np.int64
+    ).reshape(-1, 2)
+    windows = CubeWindow.batch(cube, bounds[:, 0], bounds[:, 1])
+
     return {
-        'step1': step1_df,
-        'step2': step2_df,
-        'step3': classified_df,
-        'summary': summary,
-        'threshold': threshold,
-        'config': config
+        sem: AnalysisPipeline(None, None, window=window).run(config)
+        for sem, window in zip(semesters, windows)
     }
 
 
-def get_available_semesters(inad_path: str) -> List[Dict]:
+# AnalysisConfig fields a parameter sweep can vary
+SWEEP_PARAMETERS = [
+    'min_inad', 'min_pax', 'threshold_method',
+    'min_density', 'high_priority_multiplier', 'high_priority_min_inad'
+]
+
+
+def sweep_parameters(
+    inad_table: pd.DataFrame,
+    bazl_table: pd.DataFrame,
+    semesters: List[str],
+    grid: Dict[str, List[Any]],
+    config: Optional[AnalysisConfig] = None,
+    cube: Optional[MonthlyCube] = None
+) -> pd.DataFrame:
     """
-    Determine available semesters from INAD data.
+    Compute summary counts for every combination of a parameter grid.
+
+    Route counts, PAX and densities are computed once per semester (at the
+    smallest min_inad in the grid); each min_inad and min_pax value then
+    only masks routes, and the classification parameters are evaluated for
+    all grid points of a (min_inad, min_pax, threshold_method) group in one
+    broadcast pass of the priority rules.
 
     Args:
-        inad_path: Path to INAD-Tabelle file
+        inad_table: Normalized INAD table (see load_inad_table)
+        bazl_table: Normalized BAZL table (see load_bazl_table)
+        semesters: Semester keys to sweep
+        grid: Mapping of SWEEP_PARAMETERS name -> list of values; omitted
+            parameters keep their value from config
+        config: Base analysis configuration (uses defaults if None)
+        cube: Monthly count cube of the two tables (built if None)
 
     Returns:
-        List of semester dictionaries
+        DataFrame with one row per semester and grid point: Semester, the
+        swept parameters, threshold and the summary counts
     """
-    try:
-        df = pd.read_excel(inad_path, sheet_name=0, engine='openpyxl')
+    if config is None:
+        config = AnalysisConfig()
 
-        # Find year and month columns
-        year_col = None
-        month_col = None
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
 
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if 'jahr' in col_lower or 'year' in col_lower:
-                year_col = col
-            elif 'monat' in col_lower or 'month' in col_lower:
-                month_col = col
+    values = {
+        name: list(grid[name]) if name in grid else [getattr(config, name)]
+        for name in SWEEP_PARAMETERS
+    }
+    if any(len(v) == 0 for v in values.values()):
+        raise ValueError("Every sweep parameter needs at least one value")
+    points = pd.MultiIndex.from_product(list(values.values()), names=SWEEP_PARAMETERS).to_frame(index=False)
+
+    # Step 1-3 once per semester; larger min_inad values only drop routes
+    base_config = replace(config, min_inad=min(values['min_inad']))
+    base = analyze_semesters(inad_table, bazl_table, semesters, base_config, cube)
+
+    rows = []
+    structural = ['min_inad', 'min_pax', 'threshold_method']
+    for sem in dict.fromkeys(semesters):
+        result = base[sem]
+        step3_df = result['step3']
+        airline_counts = result['step1'].set_index('Airline')['INAD_Count']
+        route_inad = step3_df['INAD_Count'].to_numpy(dtype=float)
+        route_airline_inad = step3_df['Airline'].map(airline_counts).to_numpy(dtype=float)
+        arrays = _route_arrays(step3_df)
+        pax_values = step3_df['PAX'].to_numpy(dtype=float)
+        total_inad = result['summary']['total_inad']
+
+        codes_out = np.empty((len(points), 4), dtype=np.int64)
+        thresholds_out = np.empty(len(points), dtype=float)
+        for (min_inad, min_pax, method), group in points.groupby(structural, sort=False):
+            included = (route_inad >= min_inad) & (route_airline_inad >= min_inad)
+            reliable = pax_values >= min_pax
+
+            # Same threshold rule as the pipeline on the included routes
+            subset = pd.DataFrame({
+                'Density': step3_df['Density'][included],
+                'IsReliable': reliable[included]
+            })
+            min_density = group['min_density'].to_numpy(dtype=float)
+            has_reliable = bool((subset['IsReliable'] & subset['Density'].notna()).any())
+            if has_reliable:
+                threshold = np.full(len(group), calculate_threshold(
+                    subset, replace(config, threshold_method=method)
+                ))
+            else:
+                threshold = min_density
+
+            codes = _priority_codes(
+                density=arrays['density'],
+                pax=arrays['pax'],
+                inad=arrays['inad'],
+                reliable=reliable,
+                threshold=threshold[:, None],
+                min_density=min_density[:, None],
+                multiplier=group['high_priority_multiplier'].to_numpy(dtype=float)[:, None],
+                min_inad=group['high_priority_min_inad'].to_numpy(dtype=float)[:, None]
+            )
+            for col, code in enumerate([HIGH_PRIORITY, WATCH_LIST, UNRELIABLE, CLEAR]):
+                codes_out[group.index, col] = ((codes == code) & included).sum(axis=1)
+            thresholds_out[group.index] = threshold
+
+        counts = pd.DataFrame(codes_out, columns=['high_priority', 'watch_list', 'unreliable', 'clear'])
+        rows.append(pd.concat([
+            points.assign(Semester=sem, threshold=thresholds_out, total_inad=int(total_inad)),
+            counts
+        ], axis=1))
+
+    columns = ['Semester'] + SWEEP_PARAMETERS + [
+        'threshold', 'total_inad', 'high_priority', 'watch_list', 'unreliable', 'clear'
+    ]
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(rows, ignore_index=True)[columns]
+
+
+def semester_data_hashes(
+    inad_table: pd.DataFrame,
+    bazl_table: pd.DataFrame,
+    semesters: List[str]
+) -> Dict[str, str]:
+    """
+    Hash the INAD and BAZL rows that contribute to each semester.
 
-        if not year_col or not month_col:
-            return []
+    A semester's hash only changes when one of its own rows changes, so
+    callers can skip recomputing semesters whose inputs are unchanged.
 
-        # Normalize year/month columns
-        if pd.api.types.is_datetime64_any_dtype(df[year_col]):
-            years = pd.to_datetime(df[year_col], errors='coerce').dt.year
-        else:
-            years = pd.to_numeric(df[year_col], errors='coerce')
+    Args:
+        inad_table: Normalized INAD table
+        bazl_table: Normalized BAZL table
+        semesters: Semester keys to hash
 
-        if pd.api.types.is_datetime64_any_dtype(df[month_col]):
-            months = pd.to_datetime(df[month_col], errors='coerce').dt.month
+    Returns:
+        Dictionary of semester -> hex digest
+    """
+    inad_rows = pd.util.hash_pandas_object(inad_table, index=False).to_numpy()
+    inad_groups = pd.Series(np.arange(len(inad_table))).groupby(_semester_keys(inad_table).to_numpy()).indices
+
+    bazl_rows = pd.util.hash_pandas_object(bazl_table, index=False).to_numpy()
+    if bazl_table['Year'].notna().any():
+        bazl_groups = pd.Series(np.arange(len(bazl_table))).groupby(_semester_keys(bazl_table).to_numpy()).indices
+    else:
+        # Undated BAZL data contributes to every semester
+        bazl_groups = None
+
+    empty = np.array([], dtype=np.int64)
+    hashes = {}
+    for sem in semesters:
+        digest = hashlib.sha256(sem.encode('utf-8'))
+        digest.update(inad_rows[inad_groups.get(sem, empty)].tobytes())
+        digest.update(b'|')
+        if bazl_groups is None:
+            digest.update(bazl_rows.tobytes())
         else:
-            months = pd.to_numeric(df[month_col], errors='coerce')
-
-        df['Year'] = years.astype('Int64')
-        df['Month'] = months.astype('Int64')
-        df = df.dropna(subset=['Year', 'Month'])
-
-        if df.empty:
-            return []
-
-        min_year = int(df['Year'].min())
-        max_year = int(df['Year'].max())
-
-        semesters = []
-        for year in range(min_year, max_year + 1):
-            # H1: Jan-Jun
-            if ((df['Year'] == year) & (df['Month'].between(1, 6))).any():
-                h1_start = datetime(year, 1, 1)
-                h1_end = datetime(year, 6, 30)
-                semesters.append({
-                    'value': f'{year}-H1',
-                    'label': f'{year} H1 (Jan-Jun)',
-                    'start': h1_start.isoformat(),
-                    'end': h1_end.isoformat()
-                })
-
-            # H2: Jul-Dec
-            if ((df['Year'] == year) & (df['Month'].between(7, 12))).any():
-                h2_start = datetime(year, 7, 1)
-                h2_end = datetime(year, 12, 31)
-                semesters.append({
-                    'value': f'{year}-H2',
-                    'label': f'{year} H2 (Jul-Dec)',
-                    'start': h2_start.isoformat(),
-                    'end': h2_end.isoformat()
-                })
-
-        # Ensure chronological order
-        semesters.sort(key=lambda s: s['value'])
-
-        return semesters
+            digest.update(bazl_rows[bazl_groups.get(sem, empty)].tobytes())
+        hashes[sem] = digest.hexdigest()
 
+    return hashes
+
+
+def run_multi_semester_analysis(
+    inad_path: str,
+    bazl_path: str,
+    semesters: List[str],
+    config: Optional[AnalysisConfig] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the complete INAD analysis pipeline for several semesters at once.
+
+    The workbooks are loaded a single time and all semesters are analyzed
+    in one pass over their monthly cube (see analyze_semesters).
+
+    Args:
+        inad_path: Path to INAD-Tabelle file
+        bazl_path: Path to BAZL-Daten file
+        semesters: Semester keys to analyze (e.g. ['2024-H1', '2024-H2'])
+        config: Analysis configuration (uses defaults if None)
+
+    Returns:
+        Dictionary of semester -> results dict (same layout as run_full_analysis)
+    """
+    inad_table = load_inad_table(inad_path)
+    bazl_table = load_bazl_table(bazl_path)
+    return analyze_semesters(inad_table, bazl_table, semesters, config)
+
+
+def semesters_from_table(df: pd.DataFrame) -> List[Dict]:
+    """
+    Determine available semesters from a normalized INAD table.
+
+    Args:
+        df: Normalized INAD table (see load_inad_table)
+
+    Returns:
+        List of semester dictionaries in chronological order
+    """
+    return semesters_from_cube(MonthlyCube(df))
+
+
+def semesters_from_cube(cube: MonthlyCube) -> List[Dict]:
+    """
+    Determine available semesters from the INAD months of a cube.
+
+    Args:
+        cube: Monthly count cube
+
+    Returns:
+        List of semester dictionaries in chronological order
+    """
+    halves = dict.fromkeys((year, 'H1' if month <= 6 else 'H2') for year, month in cube.inad_months())
+
+    semesters = []
+    for year, half in halves:
+        start_date, end_date = parse_semester(f'{year}-{half}')
+        months = 'Jan-Jun' if half == 'H1' else 'Jul-Dec'
+        semesters.append({
+            'value': f'{year}-{half}',
+            'label': f'{year} {half} ({months})',
+            'start': start_date.isoformat(),
+            'end': end_date.isoformat()
+        })
+
+    # Ensure chronological order
+    semesters.sort(key=lambda s: s['value'])
+
+    return semesters
+
+
+def get_available_semesters(inad_path: str) -> List[Dict]:
+    """
+    Determine available semesters from INAD data.
+
+    Args:
+        inad_path: Path to INAD-Tabelle file
+
+    Returns:
+        List of semester dictionaries
+    """
+    try:
+        return semesters_from_table(load_inad_table(inad_path))
     except Exception as e:
         return []
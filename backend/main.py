@@ -3,21 +3,33 @@ CASA Dashboard Backend API
 FastAPI application for INAD analysis
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Query
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+import asyncio
+import contextvars
+import functools
+import json
 import os
-import shutil
+
+import pandas as pd
 
 from inad_analysis import (
     AnalysisConfig,
-    run_full_analysis,
-    get_available_semesters,
-    detect_systemic_cases
+    SWEEP_PARAMETERS,
+    config_fingerprint,
+    parse_semester,
+    parse_window,
+    window_label
 )
+from dataset import InadDataset
+from result_cache import ResultCache, DEFAULT_BUDGET_BYTES
+from upload_store import UploadStore
+from metrics import REGISTRY, CONTENT_TYPE, span, timed
 from geography import enrich_routes_with_coordinates, get_coverage_stats
 
 app = FastAPI(
@@ -35,20 +47,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def record_request_span(request: Request, call_next):
+    """Record every request as a span named after its method and route template."""
+    with span('http') as request_span:
+        response = await call_next(request)
+        route = request.scope.get('route')
+        request_span.name = f"{request.method} {getattr(route, 'path', 'unmatched')}"
+    return response
+
+# Bounded pool for blocking pandas/openpyxl work, so the event loop stays free
+ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', '4'))
+executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix='analysis')
+
+# Upper bound on semesters x grid points per /api/sweep request
+MAX_SWEEP_POINTS = int(os.getenv('MAX_SWEEP_POINTS', '100000'))
+
+# Memory budget for cached analysis payloads
+ANALYSIS_CACHE_BYTES = int(os.getenv('ANALYSIS_CACHE_BYTES', str(DEFAULT_BUDGET_BYTES)))
+
 # Store uploaded files and analysis state
 class AppState:
     def __init__(self):
         self.inad_path: Optional[str] = None
         self.bazl_path: Optional[str] = None
-        self.temp_dir: Optional[str] = None
-        self.analysis_cache: Dict[str, Any] = {}
+        self.dataset: Optional[InadDataset] = None
+        # Uploaded files by content hash, plus recently parsed upload datasets
+        self.uploads = UploadStore()
+        # Keyed by (dataset digest, semester, config fingerprint), so entries
+        # stay valid across uploads and config changes
+        self.analysis_cache = ResultCache(ANALYSIS_CACHE_BYTES)
+        self.inflight: Dict[tuple, asyncio.Future] = {}
         self.config = AnalysisConfig()
 
-    def cleanup(self):
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
-
 state = AppState()
 
 
@@ -62,6 +94,11 @@ class ConfigUpdate(BaseModel):
     threshold_method: Optional[str] = None
 
 
+class SweepRequest(BaseModel):
+    semesters: List[str]
+    grid: Dict[str, List[Any]]
+
+
 class SemesterInfo(BaseModel):
     value: str
     label: str
@@ -93,6 +130,118 @@ class RouteData(BaseModel):
     originCountry: Optional[str] = None
 
 
+async def run_blocking(func, *args):
+    """Run a blocking function on the analysis executor."""
+    loop = asyncio.get_running_loop()
+    # Carry the context over, so stage spans nest under the request span
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, func, *args))
+
+
+@timed('build_response')
+def build_analysis_response(semester: str, results: Dict[str, Any], config: AnalysisConfig) -> Dict[str, Any]:
+    """Convert pipeline results into the /api/analyze JSON payload."""
+    # Enrich with coordinates
+    step3_df = results['step3']
+    step3_enriched = enrich_routes_with_coordinates(step3_df)
+
+    # Convert to JSON-friendly format
+    routes = []
+    for _, row in step3_enriched.iterrows():
+        routes.append({
+            'airline': row['Airline'],
+            'lastStop': row['LastStop'],
+            'inad': int(row['INAD_Count']),
+            'pax': int(row['PAX']),
+            'density': round(row['Density'], 4) if pd.notna(row['Density']) and row['Density'] else None,
+            'confidence': int(row['Confidence']),
+            'priority': row['Priority'],
+            'originLat': row.get('OriginLat'),
+            'originLng': row.get('OriginLng'),
+            'originCity': row.get('OriginCity', ''),
+            'originCountry': row.get('OriginCountry', '')
+        })
+
+    # Step 1 airlines
+    airlines = []
+    for _, row in results['step1'].iterrows():
+        airlines.append({
+            'airline': row['Airline'],
+            'inadCount': int(row['INAD_Count'])
+        })
+
+    # Step 2 routes
+    step2_routes = []
+    for _, row in results['step2'].iterrows():
+        step2_routes.append({
+            'airline': row['Airline'],
+            'lastStop': row['LastStop'],
+            'inadCount': int(row['INAD_Count'])
+        })
+
+    return {
+        'semester': semester,
+        'summary': results['summary'],
+        'threshold': round(results['threshold'], 4),
+        'routes': routes,
+        'airlines': airlines,
+        'step2Routes': step2_routes,
+        'config': {
+            'min_inad': config.min_inad,
+            'min_pax': config.min_pax,
+            'min_density': config.min_density,
+            'threshold_method': config.threshold_method,
+            'high_priority_multiplier': config.high_priority_multiplier
+        }
+    }
+
+
+def compute_analysis(dataset: InadDataset, semester: str, config: AnalysisConfig) -> Dict[str, Any]:
+    """Analyze one semester of a dataset (runs on the executor)."""
+    results = dataset.analyze(semester, config)
+    return build_analysis_response(semester, results, config)
+
+
+def compute_window_analysis(dataset: InadDataset, window: str, config: AnalysisConfig) -> Dict[str, Any]:
+    """Analyze one month window of a dataset (runs on the executor)."""
+    label, results = dataset.analyze_window(window, config)
+    return {**build_analysis_response(label, results, config), 'window': label}
+
+
+async def get_analysis(semester: str, compute=compute_analysis) -> Dict[str, Any]:
+    """
+    Return the analysis payload for a semester under the current config.
+
+    Concurrent requests for the same dataset, semester and config share a
+    single in-flight computation instead of each starting their own.
+    Month windows use compute_window_analysis with their canonical key.
+    """
+    dataset = state.dataset
+    # Snapshot the config; update_config mutates state.config in place
+    config = replace(state.config)
+    cache_key = (dataset.digest, semester, config_fingerprint(config))
+
+    cached = state.analysis_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    future = state.inflight.get(cache_key)
+    if future is None:
+        future = asyncio.ensure_future(run_blocking(compute, dataset, semester, config))
+        state.inflight[cache_key] = future
+
+        def finish(done: asyncio.Future):
+            state.inflight.pop(cache_key, None)
+            # Skip caching results of a dataset that was replaced meanwhile
+            if not done.cancelled() and done.exception() is None and state.dataset is dataset:
+                state.analysis_cache.put(cache_key, done.result())
+
+        future.add_done_callback(finish)
+
+    # Shield so one cancelled client does not cancel the shared computation
+    return await asyncio.shield(future)
+
+
 # API Endpoints
 
 @app.get("/")
@@ -107,7 +256,7 @@ async def get_status():
     return {
         "inad_loaded": state.inad_path is not None,
         "bazl_loaded": state.bazl_path is not None,
-        "ready": state.inad_path is not None and state.bazl_path is not None
+        "ready": state.dataset is not None
     }
 
 
@@ -118,36 +267,27 @@ async def upload_files(
 ):
     """Upload INAD and BAZL data files"""
     try:
-        # Clean up previous temp files
-        state.cleanup()
-
-        # Create temp directory
-        state.temp_dir = tempfile.mkdtemp()
-
-        # Save INAD file
-        inad_path = os.path.join(state.temp_dir, "inad_data.xlsx")
-        with open(inad_path, "wb") as f:
-            content = await inad_file.read()
-            f.write(content)
+        # Stream both files to content-addressed storage (hashing and disk
+        # writes run on the executor, so other requests keep being served)
+        inad_path, inad_digest = await run_blocking(state.uploads.save, inad_file.file, 'inad')
+        bazl_path, bazl_digest = await run_blocking(state.uploads.save, bazl_file.file, 'bazl')
         state.inad_path = inad_path
-
-        # Save BAZL file
-        bazl_path = os.path.join(state.temp_dir, "bazl_data.xlsx")
-        with open(bazl_path, "wb") as f:
-            content = await bazl_file.read()
-            f.write(content)
         state.bazl_path = bazl_path
 
-        # Clear cache
-        state.analysis_cache = {}
-
-        # Get available semesters
-        semesters = get_available_semesters(state.inad_path)
+        # Parse both workbooks once; all endpoints slice this dataset.
+        # A previously uploaded pair reuses its dataset and warm caches.
+        state.dataset = None
+        key = (inad_digest, bazl_digest)
+        dataset = state.uploads.get_dataset(key)
+        if dataset is None:
+            dataset = await run_blocking(InadDataset.from_files, inad_path, bazl_path)
+            state.uploads.put_dataset(key, dataset)
+        state.dataset = dataset
 
         return {
             "success": True,
             "message": "Files uploaded successfully",
-            "semesters": semesters
+            "semesters": state.dataset.semesters
         }
 
     except Exception as e:
@@ -170,16 +310,14 @@ async def load_server_files(
         state.inad_path = inad_path
         state.bazl_path = bazl_path
 
-        # Clear cache
-        state.analysis_cache = {}
-
-        # Get available semesters
-        semesters = get_available_semesters(state.inad_path)
+        # Parse both workbooks once; all endpoints slice this dataset
+        state.dataset = None
+        state.dataset = await run_blocking(InadDataset.from_files, inad_path, bazl_path)
 
         return {
             "success": True,
             "message": "Server files loaded successfully",
-            "semesters": semesters
+            "semesters": state.dataset.semesters
         }
 
     except HTTPException:
@@ -191,128 +329,120 @@ async def load_server_files(
 @app.get("/api/semesters", response_model=List[SemesterInfo])
 async def get_semesters():
     """Get list of available semesters from loaded data"""
-    if not state.inad_path:
+    if state.dataset is None:
         raise HTTPException(status_code=400, detail="No INAD data loaded")
 
-    semesters = get_available_semesters(state.inad_path)
-    return semesters
+    return state.dataset.semesters
 
 
 @app.get("/api/analyze/{semester}")
 async def analyze_semester(semester: str):
     """Run full analysis for a specific semester"""
-    if not state.inad_path or not state.bazl_path:
+    if state.dataset is None:
         raise HTTPException(status_code=400, detail="Data files not loaded")
 
-    # Check cache
-    cache_key = f"{semester}_{state.config.threshold_method}_{state.config.min_inad}"
-    if cache_key in state.analysis_cache:
-        return state.analysis_cache[cache_key]
-
     try:
-        # Parse semester
-        year, half = semester.split('-')
-        year = int(year)
-
-        if half == 'H1':
-            start_date = datetime(year, 1, 1)
-            end_date = datetime(year, 6, 30)
-        else:
-            start_date = datetime(year, 7, 1)
-            end_date = datetime(year, 12, 31)
-
-        # Run analysis
-        results = run_full_analysis(
-            state.inad_path,
-            state.bazl_path,
-            start_date,
-            end_date,
-            state.config
-        )
+        return await get_analysis(semester)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Enrich with coordinates
-        step3_df = results['step3']
-        step3_enriched = enrich_routes_with_coordinates(step3_df)
 
-        # Convert to JSON-friendly format
-        routes = []
-        for _, row in step3_enriched.iterrows():
-            routes.append({
-                'airline': row['Airline'],
-                'lastStop': row['LastStop'],
-                'inad': int(row['INAD_Count']),
-                'pax': int(row['PAX']),
-                'density': round(row['Density'], 4) if row['Density'] else None,
-                'confidence': int(row['Confidence']),
-                'priority': row['Priority'],
-                'originLat': row.get('OriginLat'),
-                'originLng': row.get('OriginLng'),
-                'originCity': row.get('OriginCity', ''),
-                'originCountry': row.get('OriginCountry', '')
-            })
+@app.get("/api/analyze-window")
+async def analyze_window(window: str = Query(..., description="Month window, e.g. 2024-Q2, 2024 or 2023-07:2024-06")):
+    """Run full analysis for an arbitrary month window"""
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
 
-        # Step 1 airlines
-        airlines = []
-        for _, row in results['step1'].iterrows():
-            airlines.append({
-                'airline': row['Airline'],
-                'inadCount': int(row['INAD_Count'])
-            })
+    try:
+        label = window_label(*parse_window(window))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        return await get_analysis(label, compute_window_analysis)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Step 2 routes
-        step2_routes = []
-        for _, row in results['step2'].iterrows():
-            step2_routes.append({
-                'airline': row['Airline'],
-                'lastStop': row['LastStop'],
-                'inadCount': int(row['INAD_Count'])
-            })
 
-        response = {
-            'semester': semester,
-            'summary': results['summary'],
-            'threshold': round(results['threshold'], 4),
-            'routes': routes,
-            'airlines': airlines,
-            'step2Routes': step2_routes,
-            'config': {
-                'min_inad': state.config.min_inad,
-                'min_pax': state.config.min_pax,
-                'min_density': state.config.min_density,
-                'threshold_method': state.config.threshold_method,
-                'high_priority_multiplier': state.config.high_priority_multiplier
-            }
+@app.get("/api/analyze-window/rolling")
+async def analyze_rolling_windows(
+    months: int = Query(6, ge=1, description="Window length in months"),
+    step: int = Query(1, ge=1, description="Months between window starts")
+):
+    """Summary counts of a window sliding over all loaded months"""
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
+
+    try:
+        result = await run_blocking(state.dataset.rolling, months, step, replace(state.config))
+        return {
+            'months': months,
+            'step': step,
+            'windows': result.to_dict(orient='records')
         }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Cache result
-        state.analysis_cache[cache_key] = response
 
-        return response
+@app.get("/api/threshold-counts/{semester}")
+async def get_threshold_counts(
+    semester: str,
+    threshold: Optional[float] = Query(None, description="Density threshold (computed if omitted)"),
+    multiplier: Optional[float] = Query(None, description="High priority multiplier"),
+    min_density: Optional[float] = Query(None, description="Absolute minimum density"),
+    high_priority_min_inad: Optional[int] = Query(None, description="Minimum INAD for high priority"),
+    threshold_method: Optional[str] = Query(None, description="Threshold method used when threshold is omitted"),
+    min_inad: Optional[int] = Query(None, description="Minimum INAD cases per airline and route"),
+    min_pax: Optional[int] = Query(None, description="Minimum passengers for reliable density")
+):
+    """Live priority counts for a semester at a threshold and multiplier"""
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
+
+    overrides = {
+        'high_priority_multiplier': multiplier,
+        'min_density': min_density,
+        'high_priority_min_inad': high_priority_min_inad,
+        'threshold_method': threshold_method,
+        'min_inad': min_inad,
+        'min_pax': min_pax
+    }
+    config = replace(state.config, **{k: v for k, v in overrides.items() if v is not None})
+    dataset = state.dataset
 
+    try:
+        # Answer from the sorted index on the event loop once it is built
+        if dataset.threshold_ready(semester, config, need_threshold=threshold is None):
+            return dataset.threshold_counts(semester, config, threshold)
+        return await run_blocking(dataset.threshold_counts, semester, config, threshold)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def historic_point(semester: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a semester analysis to its point in the historic trend."""
+    return {
+        'semester': semester,
+        'summary': analysis['summary'],
+        'threshold': analysis['threshold'],
+        'highPriorityCount': analysis['summary']['high_priority'],
+        'watchListCount': analysis['summary']['watch_list'],
+        'totalInad': analysis['summary']['total_inad']
+    }
+
+
 @app.get("/api/historic")
 async def get_historic_data(semesters: str = Query(..., description="Comma-separated semester list")):
     """Get historic data across multiple semesters"""
-    if not state.inad_path or not state.bazl_path:
+    if state.dataset is None:
         raise HTTPException(status_code=400, detail="Data files not loaded")
 
     try:
-        semester_list = semesters.split(',')
-        results = []
-
-        for semester in semester_list:
-            analysis = await analyze_semester(semester.strip())
-            results.append({
-                'semester': semester.strip(),
-                'summary': analysis['summary'],
-                'threshold': analysis['threshold'],
-                'highPriorityCount': analysis['summary']['high_priority'],
-                'watchListCount': analysis['summary']['watch_list'],
-                'totalInad': analysis['summary']['total_inad']
-            })
+        semester_list = [semester.strip() for semester in semesters.split(',')]
+        analyses = await asyncio.gather(*(get_analysis(semester) for semester in semester_list))
+        results = [historic_point(semester, analysis) for semester, analysis in zip(semester_list, analyses)]
 
         return {
             'semesters': results,
@@ -323,6 +453,51 @@ async def get_historic_data(semesters: str = Query(..., description="Comma-separ
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/historic/stream")
+async def stream_historic_data(semesters: str = Query(..., description="Comma-separated semester list")):
+    """
+    Stream historic data as NDJSON, one line per semester in completion order.
+
+    Missing semesters are computed concurrently on the analysis executor.
+    Each line is {"type": "semester", ...point} or {"type": "error",
+    "semester", "detail"}; a final {"type": "trend", "trend"} line follows
+    once every semester is done.
+    """
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
+
+    semester_list = [semester.strip() for semester in semesters.split(',')]
+    try:
+        for semester in semester_list:
+            parse_semester(semester)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def analyze(semester: str):
+        try:
+            return semester, await get_analysis(semester), None
+        except Exception as e:
+            return semester, None, str(e)
+
+    async def events():
+        points = []
+        for next_done in asyncio.as_completed([analyze(semester) for semester in semester_list]):
+            semester, analysis, error = await next_done
+            if error is not None:
+                yield json.dumps({'type': 'error', 'semester': semester, 'detail': error}) + '\n'
+                continue
+            point = historic_point(semester, analysis)
+            points.append(point)
+            yield json.dumps({'type': 'semester', **point}) + '\n'
+
+        # Trend compares first and last semesters in the requested order
+        order = {semester: i for i, semester in enumerate(semester_list)}
+        points.sort(key=lambda point: order[point['semester']])
+        yield json.dumps({'type': 'trend', 'trend': calculate_trend(points)}) + '\n'
+
+    return StreamingResponse(events(), media_type='application/x-ndjson')
+
+
 def calculate_trend(semester_data: List[Dict]) -> Dict:
     """Calculate trend metrics across semesters"""
     if len(semester_data) < 2:
@@ -354,33 +529,14 @@ def calculate_trend(semester_data: List[Dict]) -> Dict:
 @app.get("/api/systemic")
 async def get_systemic_cases(semesters: str = Query(..., description="Comma-separated semester list")):
     """Detect systemic cases across semesters"""
-    if not state.inad_path or not state.bazl_path:
+    if state.dataset is None:
         raise HTTPException(status_code=400, detail="Data files not loaded")
 
     try:
-        semester_list = semesters.split(',')
-        semester_results = []
-
-        for semester in semester_list:
-            analysis = await analyze_semester(semester.strip())
-
-            # Convert routes back to DataFrame for systemic detection
-            import pandas as pd
-            routes_df = pd.DataFrame(analysis['routes'])
-            routes_df = routes_df.rename(columns={
-                'airline': 'Airline',
-                'lastStop': 'LastStop',
-                'inad': 'INAD_Count',
-                'pax': 'PAX',
-                'density': 'Density',
-                'confidence': 'Confidence',
-                'priority': 'Priority'
-            })
-
-            semester_results.append((semester.strip(), routes_df))
+        semester_list = [semester.strip() for semester in semesters.split(',')]
 
-        # Detect systemic cases
-        systemic_df = detect_systemic_cases(semester_results, state.config)
+        # Detect systemic cases from the route history index
+        systemic_df = await run_blocking(state.dataset.systemic_cases, semester_list, replace(state.config))
 
         # Convert to JSON
         cases = []
@@ -390,6 +546,8 @@ async def get_systemic_cases(semesters: str = Query(..., description="Comma-sepa
                 'lastStop': row['LastStop'],
                 'appearances': int(row['Appearances']),
                 'consecutive': bool(row['Consecutive']),
+                'longestStreak': int(row['LongestStreak']),
+                'currentStreak': int(row['CurrentStreak']),
                 'trend': row['Trend'],
                 'latestPriority': row['LatestPriority']
             })
@@ -405,6 +563,67 @@ async def get_systemic_cases(semesters: str = Query(..., description="Comma-sepa
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/route-history")
+async def get_route_history(
+    airline: str = Query(..., description="Airline code"),
+    last_stop: str = Query(..., alias="lastStop", description="Last stop airport code"),
+    semesters: str = Query(..., description="Comma-separated semester list")
+):
+    """Priority, density and INAD count of one route across semesters"""
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
+
+    try:
+        semester_list = [semester.strip() for semester in semesters.split(',')]
+        config = replace(state.config)
+        history = await run_blocking(state.dataset.history_for, semester_list, config)
+        return {
+            'airline': airline,
+            'lastStop': last_stop,
+            'history': history.route(airline, last_stop, semester_list)
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/sweep")
+async def sweep_parameters(request: SweepRequest):
+    """Summary counts for every combination of a parameter grid"""
+    if state.dataset is None:
+        raise HTTPException(status_code=400, detail="Data files not loaded")
+
+    unknown = set(request.grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sweep parameters: {sorted(unknown)}")
+
+    points = len(request.semesters)
+    for values in request.grid.values():
+        points *= max(len(values), 1)
+    if points > MAX_SWEEP_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Sweep too large: {points} points (limit {MAX_SWEEP_POINTS})"
+        )
+
+    try:
+        semesters = [semester.strip() for semester in request.semesters]
+        results = await run_blocking(
+            state.dataset.sweep, semesters, request.grid, replace(state.config)
+        )
+        return {
+            'semesters': semesters,
+            'parameters': SWEEP_PARAMETERS,
+            'points': len(results),
+            'results': results.to_dict(orient='records')
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/config")
 async def get_config():
     """Get current analysis configuration"""
@@ -434,16 +653,25 @@ async def update_config(config: ConfigUpdate):
     if config.threshold_method is not None:
         state.config.threshold_method = config.threshold_method
 
-    # Clear cache when config changes
-    state.analysis_cache = {}
-
     return {"success": True, "config": await get_config()}
 
 
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Get analysis result cache usage and hit/miss/eviction counters"""
+    return state.analysis_cache.stats()
+
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Per-stage wall time, CPU time and peak memory histograms in Prometheus text format"""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up temp files on shutdown"""
-    state.cleanup()
+    """Stop the analysis executor on shutdown"""
+    executor.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
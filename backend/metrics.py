@@ -0,0 +1,286 @@
+"""
+Metrics Module - Per-stage timing and memory spans for CASA Dashboard
+
+Code paths wrap their stages in span(name). Each finished span records its
+wall time, CPU time and (when memory tracing is on) peak traced allocation
+above the memory in use when it started, into histograms keyed by stage
+name. The API exposes them as Prometheus text; the generator script prints
+them as a per-stage table.
+
+Spans nest: the active spans are kept in a context variable, so spans of
+concurrent requests (asyncio tasks, executor threads) do not mix. CPU time
+is process-wide and memory tracing is global, so both are exact for one
+request at a time and approximate under concurrency. Memory tracing uses
+tracemalloc, which slows allocation-heavy code, and is off unless enabled
+with enable_memory_tracing() or the CASA_TRACE_MEMORY environment variable.
+"""
+
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Histogram bucket upper bounds
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MEMORY_BUCKETS = tuple(float(1 << shift) for shift in range(16, 34, 2))  # 64 KiB .. 4 GiB
+
+# Enables memory tracing at import time (e.g. CASA_TRACE_MEMORY=1 for the API)
+TRACE_MEMORY_ENV = 'CASA_TRACE_MEMORY'
+
+# Prometheus text exposition format version
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_trace_memory = os.getenv(TRACE_MEMORY_ENV, '').lower() in ('1', 'true', 'yes')
+
+# Spans currently open in this context, outermost first
+_active_spans: ContextVar[Tuple['Span', ...]] = ContextVar('casa_active_spans', default=())
+
+
+def enable_memory_tracing(enabled: bool = True) -> None:
+    """Turn peak-memory recording of spans on or off."""
+    global _trace_memory
+    _trace_memory = enabled
+    if not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def memory_tracing_enabled() -> bool:
+    """Return True if spans record peak traced memory."""
+    return _trace_memory
+
+
+class Histogram:
+    """Cumulative-bucket histogram per stage label."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # stage -> [count per bucket (last is +Inf), sum]
+        self._series: Dict[str, List] = {}
+
+    def observe(self, stage: str, value: float) -> None:
+        series = self._series.get(stage)
+        if series is None:
+            series = self._series[stage] = [[0] * (len(self.buckets) + 1), 0.0]
+        # Bucket i counts values in (bucket[i-1], bucket[i]]; the last is +Inf
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def snapshot(self) -> Dict[str, List]:
+        return {stage: [list(counts), total] for stage, (counts, total) in self._series.items()}
+
+    def merge(self, snapshot: Dict[str, List]) -> None:
+        for stage, (counts, total) in snapshot.items():
+            series = self._series.get(stage)
+            if series is None:
+                self._series[stage] = [list(counts), total]
+            else:
+                series[0] = [a + b for a, b in zip(series[0], counts)]
+                series[1] += total
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for stage in sorted(self._series):
+            counts, total = self._series[stage]
+            label = _escape_label(stage)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{stage="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{stage="{label}"}} {total!r}')
+            lines.append(f'{self.name}_count{{stage="{label}"}} {cumulative}')
+        return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry:
+    """Span histograms plus per-stage totals for profile tables."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.duration = Histogram(
+            'casa_stage_duration_seconds', 'Wall time of pipeline stages and API requests.', DURATION_BUCKETS
+        )
+        self.cpu = Histogram(
+            'casa_stage_cpu_seconds', 'Process CPU time of pipeline stages and API requests.', DURATION_BUCKETS
+        )
+        self.memory = Histogram(
+            'casa_stage_peak_memory_bytes', 'Peak traced allocation of a stage above its starting memory.',
+            MEMORY_BUCKETS
+        )
+        # stage -> [calls, wall seconds, CPU seconds, max peak bytes or None]
+        self._totals: Dict[str, List] = {}
+
+    def reset(self) -> None:
+        """Drop every recorded observation."""
+        with self._lock:
+            self._clear()
+
+    def observe(self, stage: str, wall: float, cpu: float, peak_bytes: Optional[int] = None) -> None:
+        """Record one finished span."""
+        with self._lock:
+            self.duration.observe(stage, wall)
+            self.cpu.observe(stage, cpu)
+            if peak_bytes is not None:
+                self.memory.observe(stage, peak_bytes)
+            totals = self._totals.setdefault(stage, [0, 0.0, 0.0, None])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+            if peak_bytes is not None:
+                totals[3] = peak_bytes if totals[3] is None else max(totals[3], peak_bytes)
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Totals per stage.
+
+        Returns:
+            Dictionary of stage -> calls, wall and cpu seconds, and the
+            largest peak_bytes (None without memory tracing)
+        """
+        with self._lock:
+            return {
+                stage: {'calls': calls, 'wall': wall, 'cpu': cpu, 'peak_bytes': peak}
+                for stage, (calls, wall, cpu, peak) in self._totals.items()
+            }
+
+    def drain(self) -> Dict:
+        """Return a picklable snapshot of all observations and reset the registry."""
+        with self._lock:
+            snapshot = {
+                'duration': self.duration.snapshot(),
+                'cpu': self.cpu.snapshot(),
+                'memory': self.memory.snapshot(),
+                'totals': {stage: list(totals) for stage, totals in self._totals.items()}
+            }
+            self._clear()
+        return snapshot
+
+    def merge(self, snapshot: Dict) -> None:
+        """Add the observations of a snapshot (e.g. drained in a worker process)."""
+        with self._lock:
+            self.duration.merge(snapshot['duration'])
+            self.cpu.merge(snapshot['cpu'])
+            self.memory.merge(snapshot['memory'])
+            for stage, (calls, wall, cpu, peak) in snapshot['totals'].items():
+                totals = self._totals.setdefault(stage, [0, 0.0, 0.0, None])
+                totals[0] += calls
+                totals[1] += wall
+                totals[2] += cpu
+                if peak is not None:
+                    totals[3] = peak if totals[3] is None else max(totals[3], peak)
+
+    def render(self) -> str:
+        """Render all histograms in the Prometheus text exposition format."""
+        with self._lock:
+            lines = self.duration.render() + self.cpu.render() + self.memory.render()
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry used by span() unless another one is passed
+REGISTRY = MetricsRegistry()
+
+
+class Span:
+    """One timed stage; the name may be changed until the span ends."""
+
+    __slots__ = ('name', 'wall', 'cpu', 'peak_bytes', '_base', '_peak')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_bytes: Optional[int] = None
+        self._base = 0
+        self._peak = 0
+
+
+def _fold_peak(spans: Sequence[Span], peak: int) -> None:
+    for open_span in spans:
+        if peak > open_span._peak:
+            open_span._peak = peak
+
+
+@contextmanager
+def span(name: str, registry: Optional[MetricsRegistry] = None) -> Iterator[Span]:
+    """
+    Time a stage and record it in the registry when it ends.
+
+    Args:
+        name: Stage name (the histogram label)
+        registry: Registry to record into (defaults to REGISTRY)
+
+    Yields:
+        The Span, whose name can still be changed inside the block
+    """
+    current = Span(name)
+    tracing = _trace_memory
+    if tracing:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # The traced peak is global: hand the peak so far to the open spans
+        # before resetting it to measure this span on its own
+        size, peak = tracemalloc.get_traced_memory()
+        _fold_peak(_active_spans.get(), peak)
+        tracemalloc.reset_peak()
+        current._base = current._peak = size
+
+    token = _active_spans.set(_active_spans.get() + (current,))
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield current
+    finally:
+        current.wall = time.perf_counter() - start
+        current.cpu = time.process_time() - cpu_start
+        _active_spans.reset(token)
+        if tracing and tracemalloc.is_tracing():
+            _fold_peak((current,), tracemalloc.get_traced_memory()[1])
+            _fold_peak(_active_spans.get(), current._peak)
+            tracemalloc.reset_peak()
+            current.peak_bytes = current._peak - current._base
+        (registry or REGISTRY).observe(current.name, current.wall, current.cpu, current.peak_bytes)
+
+
+def timed(name: str) -> Callable:
+    """Decorator that runs every call of a function in span(name)."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def format_profile(summary: Dict[str, Dict]) -> str:
+    """
+    Format per-stage totals (see MetricsRegistry.summary) as a table.
+
+    Args:
+        summary: Stage totals
+
+    Returns:
+        Fixed-width table, slowest stage first
+    """
+    lines = [f"{'Stage':<30}{'Calls':>7}{'Wall (s)':>11}{'CPU (s)':>10}{'Peak (MB)':>12}"]
+    for stage, totals in sorted(summary.items(), key=lambda item: -item[1]['wall']):
+        peak = totals['peak_bytes']
+        peak_text = f"{peak / (1024 * 1024):.1f}" if peak is not None else '-'
+        lines.append(
+            f"{stage:<30}{totals['calls']:>7}{totals['wall']:>11.3f}{totals['cpu']:>10.3f}{peak_text:>12}"
+        )
+    return '\n'.join(lines)
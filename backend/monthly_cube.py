@@ -0,0 +1,297 @@
+"""
+Monthly Cube Module - Airline x last stop x month count cube
+
+Aggregates the normalized INAD and BAZL tables once, at ingest, into an
+integer-coded cube with dimensions airline, last stop, month and measure
+(included INAD cases, excluded INAD cases, PAX and the number of BAZL rows
+behind the PAX). The airline and last-stop axes have sorted code
+dictionaries; the cube is sparse over them (one row per (airline,
+lastStop) pair that occurs) and dense over months.
+
+Every measure is stored as a prefix sum along the month axis, so the
+totals of any month window (semester, quarter, calendar year, rolling or
+custom range) are one subtraction per route, airline totals are a
+reduceat over each airline's contiguous routes, and many windows are a
+single fancy-indexed subtraction.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Measures stored per route and month
+MEASURES = ('included', 'excluded', 'pax', 'pax_rows')
+
+# Columns of the normalized tables the cube reads
+INAD_COLUMNS = ['Airline', 'LastStop', 'Year', 'Month', 'Included']
+BAZL_COLUMNS = ['Airline', 'Airport', 'PAX', 'Year', 'Month']
+
+
+def month_key(year: int, month: int) -> int:
+    """Number a calendar month (consecutive months differ by one)."""
+    return int(year) * 12 + int(month) - 1
+
+
+def key_to_month(key: int) -> Tuple[int, int]:
+    """Inverse of month_key: (year, month)."""
+    return int(key) // 12, int(key) % 12 + 1
+
+
+def _month_keys(table: pd.DataFrame) -> np.ndarray:
+    """Month keys of a normalized table (-1 where Year/Month is missing or invalid)."""
+    years = table['Year'].to_numpy(dtype=float, na_value=np.nan)
+    months = table['Month'].to_numpy(dtype=float, na_value=np.nan)
+    valid = ~np.isnan(years) & (months >= 1) & (months <= 12)
+    keys = np.full(len(table), -1, dtype=np.int64)
+    keys[valid] = (years[valid] * 12 + months[valid] - 1).astype(np.int64)
+    return keys
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    """Prefix sums along the month axis with a leading zero column."""
+    out = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,), dtype=values.dtype)
+    np.cumsum(values, axis=-1, out=out[..., 1:])
+    return out
+
+
+def _empty_table(columns: List[str]) -> pd.DataFrame:
+    """Empty stand-in for a missing normalized table."""
+    dtypes = {'Year': 'Int64', 'Month': 'Int64', 'Included': bool, 'PAX': 'int64'}
+    return pd.DataFrame({name: pd.Series([], dtype=dtypes.get(name, 'str')) for name in columns})
+
+
+class MonthlyCube:
+    """
+    INAD and PAX totals per route and month, stored as prefix sums.
+
+    Routes are the (airline, lastStop) pairs of both tables, sorted by
+    airline and then last stop, so each airline's routes are contiguous.
+    INAD cases without a last stop are kept in a route with stop code -1:
+    they count towards their airline but never form a route of their own.
+    Either table may be omitted (e.g. to aggregate BAZL PAX alone).
+    """
+
+    def __init__(self, inad_table: Optional[pd.DataFrame] = None, bazl_table: Optional[pd.DataFrame] = None):
+        if inad_table is None:
+            inad_table = _empty_table(INAD_COLUMNS)
+        if bazl_table is None:
+            bazl_table = _empty_table(BAZL_COLUMNS)
+
+        inad_months = _month_keys(inad_table)
+        bazl_months = _month_keys(bazl_table)
+        self.pax_dated = bool((bazl_months >= 0).any())
+
+        known = np.concatenate([inad_months, bazl_months if self.pax_dated else []])
+        known = known[known >= 0]
+        self.first_month = int(known.min()) if len(known) else 0
+        self.n_months = int(known.max()) - self.first_month + 1 if len(known) else 0
+
+        # Axis code dictionaries (sorted, as groupby orders its keys)
+        airline_codes, self.airlines = pd.factorize(
+            pd.concat([inad_table['Airline'], bazl_table['Airline']], ignore_index=True), sort=True
+        )
+        stop_codes, self.stops = pd.factorize(
+            pd.concat([inad_table['LastStop'], bazl_table['Airport']], ignore_index=True), sort=True
+        )
+        n_inad = len(inad_table)
+        route_keys = airline_codes * (len(self.stops) + 1) + stop_codes + 1
+        has_airline = airline_codes >= 0
+
+        # Route axis: every (airline, stop) pair seen, in sorted key order
+        unique_keys = np.unique(route_keys[has_airline])
+        self.route_airline = unique_keys // (len(self.stops) + 1)
+        self.route_stop = unique_keys % (len(self.stops) + 1) - 1
+        self._route_keys = unique_keys
+        self._airline_starts = np.searchsorted(self.route_airline, np.arange(len(self.airlines)))
+
+        def grid(rows: np.ndarray, months: np.ndarray, values: np.ndarray) -> np.ndarray:
+            """Sum row values into a route x month grid (rows without a month are dropped)."""
+            keep = has_airline[rows] & (months >= 0)
+            route = np.searchsorted(unique_keys, route_keys[rows][keep])
+            out = np.zeros((len(unique_keys), self.n_months), dtype=values.dtype)
+            np.add.at(out, (route, months[keep] - self.first_month), values[keep])
+            return out
+
+        # Included and excluded INAD cases per route and month
+        included = inad_table['Included'].to_numpy(dtype=bool)
+        inad_rows = np.arange(n_inad)
+        self.prefix: Dict[str, np.ndarray] = {
+            'included': _prefix(grid(inad_rows, inad_months, included.astype(np.int64))),
+            'excluded': _prefix(grid(inad_rows, inad_months, (~included).astype(np.int64)))
+        }
+
+        # Per-month INAD rows and included cases, rows without an airline too
+        dated = inad_months >= 0
+        self.inad_rows = np.bincount(inad_months[dated] - self.first_month, minlength=self.n_months)
+        self.total_prefix = _prefix(np.bincount(
+            inad_months[dated & included] - self.first_month, minlength=self.n_months
+        ).astype(np.int64))
+
+        # PAX per route and month; undated BAZL data applies to every window
+        pax = bazl_table['PAX'].to_numpy()
+        self.pax_dtype = np.dtype(np.int64) if pd.api.types.is_integer_dtype(bazl_table['PAX'].dtype) else np.dtype(float)
+        pax = np.nan_to_num(pax.astype(self.pax_dtype)) if self.pax_dtype.kind == 'f' else pax.astype(np.int64)
+        bazl_rows = np.arange(n_inad, n_inad + len(bazl_table))
+        if self.pax_dated:
+            self.prefix['pax'] = _prefix(grid(bazl_rows, bazl_months, pax))
+            self.prefix['pax_rows'] = _prefix(grid(bazl_rows, bazl_months, np.ones(len(pax), dtype=np.int64)))
+            self.static = {}
+        else:
+            keep = has_airline[bazl_rows]
+            route = np.searchsorted(unique_keys, route_keys[bazl_rows][keep])
+            self.static = {
+                'pax': np.bincount(route, weights=pax[keep], minlength=len(unique_keys)).astype(self.pax_dtype),
+                'pax_rows': np.bincount(route, minlength=len(unique_keys)).astype(np.int64)
+            }
+
+    @property
+    def n_routes(self) -> int:
+        return len(self._route_keys)
+
+    @property
+    def months(self) -> List[Tuple[int, int]]:
+        """(year, month) of every month position."""
+        return [key_to_month(self.first_month + i) for i in range(self.n_months)]
+
+    def window(self, start_date: datetime, end_date: datetime) -> Tuple[int, int]:
+        """
+        Convert a date range into month positions [lo, hi) of the cube.
+
+        A month belongs to the range when its first day does, which is how
+        the table-based pipeline filters rows by their first-of-month date.
+
+        Args:
+            start_date: Start of analysis period
+            end_date: End of analysis period
+
+        Returns:
+            Tuple of (lo, hi) positions, clipped to the cube's month range
+        """
+        lo = month_key(start_date.year, start_date.month)
+        if start_date > datetime(start_date.year, start_date.month, 1):
+            lo += 1
+        hi = month_key(end_date.year, end_date.month) + 1
+        lo = min(max(lo - self.first_month, 0), self.n_months)
+        hi = min(max(hi - self.first_month, lo), self.n_months)
+        return lo, hi
+
+    def route_sums(self, measure: str, lo, hi) -> np.ndarray:
+        """
+        Per-route totals of a measure over month windows.
+
+        Args:
+            measure: One of MEASURES
+            lo: Window start position(s) (inclusive)
+            hi: Window end position(s) (exclusive)
+
+        Returns:
+            Array of shape (n_routes,) for scalar bounds, or (n_routes, k)
+            for k window bounds
+        """
+        if measure in self.static:
+            values = self.static[measure]
+            return values if np.ndim(lo) == 0 else np.repeat(values[:, None], len(lo), axis=1)
+        prefix = self.prefix[measure]
+        return prefix[:, hi] - prefix[:, lo]
+
+    def month_values(self, measure: str, lo: int, hi: int) -> np.ndarray:
+        """Per-route, per-month values of a dated measure for months [lo, hi)."""
+        return np.diff(self.prefix[measure][:, lo:hi + 1], axis=1)
+
+    def period_sums(self, measure: str, lo, hi) -> np.ndarray:
+        """Totals of a measure over all routes for month windows."""
+        return self.route_sums(measure, lo, hi).sum(axis=0)
+
+    def inad_months(self) -> List[Tuple[int, int]]:
+        """(year, month) of every month with INAD rows."""
+        return [key_to_month(self.first_month + i) for i in np.flatnonzero(self.inad_rows)]
+
+    def airline_sums(self, route_values: np.ndarray) -> np.ndarray:
+        """Sum per-route values (first axis) into per-airline totals."""
+        # Every airline has at least one route, so the starts strictly increase
+        if self.n_routes == 0:
+            return np.zeros((len(self.airlines),) + route_values.shape[1:], dtype=route_values.dtype)
+        return np.add.reduceat(route_values, self._airline_starts, axis=0)
+
+    def total(self, lo, hi) -> np.ndarray:
+        """Included INAD cases of all rows over month windows."""
+        return self.total_prefix[hi] - self.total_prefix[lo]
+
+    def route_positions(self, airlines: Sequence, stops: Sequence) -> np.ndarray:
+        """
+        Route rows of (airline, lastStop) pairs.
+
+        Args:
+            airlines: Airline codes
+            stops: Last stop codes
+
+        Returns:
+            Route row positions (-1 for pairs not in the cube)
+        """
+        airline_codes = self.airlines.get_indexer(pd.Index(airlines))
+        stop_codes = self.stops.get_indexer(pd.Index(stops))
+        keys = airline_codes * (len(self.stops) + 1) + stop_codes + 1
+        pos = np.searchsorted(self._route_keys, keys)
+        pos = np.minimum(pos, max(self.n_routes - 1, 0))
+        found = (airline_codes >= 0) & (stop_codes >= 0) & (self.n_routes > 0)
+        if self.n_routes:
+            found &= self._route_keys[pos] == keys
+        return np.where(found, pos, -1)
+
+
+class CubeWindow:
+    """Route, airline and overall totals of one month window of a cube."""
+
+    def __init__(self, cube: MonthlyCube, lo: int, hi: int):
+        self.cube = cube
+        self.lo = lo
+        self.hi = hi
+        self.route_inad = cube.route_sums('included', lo, hi)
+        self.airline_inad = cube.airline_sums(self.route_inad)
+        self.route_pax = cube.route_sums('pax', lo, hi)
+        self.route_pax_rows = cube.route_sums('pax_rows', lo, hi)
+        self.total_inad = int(cube.total(lo, hi))
+
+    @classmethod
+    def batch(cls, cube: MonthlyCube, lo: Sequence[int], hi: Sequence[int]) -> List['CubeWindow']:
+        """
+        Windows for many month ranges from one prefix-sum subtraction each measure.
+
+        Args:
+            cube: Monthly count cube
+            lo: Window start positions (inclusive)
+            hi: Window end positions (exclusive)
+
+        Returns:
+            One CubeWindow per (lo, hi) pair
+        """
+        lo = np.asarray(lo, dtype=np.int64)
+        hi = np.asarray(hi, dtype=np.int64)
+        route_inad = cube.route_sums('included', lo, hi)
+        # Rows of the transposed matrices are contiguous per window
+        totals = {
+            'route_inad': np.ascontiguousarray(route_inad.T),
+            'airline_inad': np.ascontiguousarray(cube.airline_sums(route_inad).T),
+            'route_pax': np.ascontiguousarray(cube.route_sums('pax', lo, hi).T),
+            'route_pax_rows': np.ascontiguousarray(cube.route_sums('pax_rows', lo, hi).T)
+        }
+        total_inad = cube.total(lo, hi)
+
+        windows = []
+        for k in range(len(lo)):
+            window = cls.__new__(cls)
+            window.cube = cube
+            window.lo = int(lo[k])
+            window.hi = int(hi[k])
+            for name, matrix in totals.items():
+                setattr(window, name, matrix[k])
+            window.total_inad = int(total_inad[k])
+            windows.append(window)
+        return windows
+
+    @classmethod
+    def from_dates(cls, cube: MonthlyCube, start_date: datetime, end_date: datetime) -> 'CubeWindow':
+        """Window of a cube covering a date range."""
+        return cls(cube, *cube.window(start_date, end_date))
@@ -0,0 +1,101 @@
+"""
+Result Cache Module - LRU cache for analysis payloads with a memory budget
+
+Entries are sized by their JSON encoding (the form in which they are sent to
+the client). When the total exceeds the byte budget, the least recently used
+entries are evicted. Hit, miss and eviction counters are kept for the stats
+endpoint.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Default budget for cached analysis payloads (64 MB)
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a payload by its JSON length."""
+    return len(json.dumps(value, default=str))
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by an approximate byte budget."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value (marking it recently used), or None."""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any, size: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries over budget.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size in bytes (estimated from the JSON encoding if None)
+        """
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # A single entry larger than the whole budget is not worth keeping
+            if size > self.budget_bytes:
+                return
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.budget_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'budget_bytes': self.budget_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+        self._bytes -= self._sizes.pop(key)
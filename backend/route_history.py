@@ -0,0 +1,198 @@
+"""
+Route History Module - Route-by-semester index of analysis results
+
+Stores priority codes, densities and INAD counts of every analyzed route in
+(airline, lastStop) x semester matrices. Each analyzed semester fills one
+column, so systemic-case, trend and history queries over any semester
+subset are array slices instead of rebuilding DataFrames per request.
+"""
+
+import threading
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from inad_analysis import (
+    AnalysisConfig,
+    PRIORITY_DTYPE,
+    PRIORITY_LABELS,
+    HIGH_PRIORITY,
+    WATCH_LIST,
+    systemic_from_matrices
+)
+
+# Marks a route that is not in a semester's step 3 results
+ABSENT = -1
+
+
+class RouteHistory:
+    """Priority, density and INAD count per route and semester."""
+
+    def __init__(self):
+        self._route_ids: Dict[Tuple[str, str], int] = {}
+        self._routes: List[Tuple[str, str]] = []
+        self._semester_ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self.priority = np.full((0, 0), ABSENT, dtype=np.int8)
+        self.density = np.full((0, 0), np.nan)
+        self.inad = np.zeros((0, 0), dtype=np.int64)
+        # Row position within the semester's step 3 results (keeps output order)
+        self.position = np.full((0, 0), ABSENT, dtype=np.int64)
+
+    @property
+    def semesters(self) -> List[str]:
+        """Semesters recorded so far."""
+        return list(self._semester_ids)
+
+    def __contains__(self, semester: str) -> bool:
+        return semester in self._semester_ids
+
+    def _grow(self, n_routes: int, n_semesters: int) -> None:
+        """Resize the matrices (with headroom) to hold the given shape."""
+        rows, cols = self.priority.shape
+        if n_routes <= rows and n_semesters <= cols:
+            return
+        new_rows = max(n_routes, rows * 2 if n_routes > rows else rows)
+        new_cols = max(n_semesters, cols * 2 if n_semesters > cols else cols)
+
+        def resized(matrix: np.ndarray, fill) -> np.ndarray:
+            out = np.full((new_rows, new_cols), fill, dtype=matrix.dtype)
+            out[:rows, :cols] = matrix
+            return out
+
+        self.priority = resized(self.priority, ABSENT)
+        self.density = resized(self.density, np.nan)
+        self.inad = resized(self.inad, 0)
+        self.position = resized(self.position, ABSENT)
+
+    def update(self, semester: str, step3_df: pd.DataFrame) -> None:
+        """
+        Record (or replace) one semester's classified step 3 routes.
+
+        Args:
+            semester: Semester key
+            step3_df: Classified step 3 results (with a Priority column)
+        """
+        keys = list(zip(step3_df['Airline'], step3_df['LastStop']))
+        codes = pd.Categorical(step3_df['Priority'], dtype=PRIORITY_DTYPE).codes
+        density = pd.to_numeric(step3_df['Density'], errors='coerce').to_numpy(dtype=float)
+        inad = step3_df['INAD_Count'].to_numpy(dtype=np.int64)
+
+        with self._lock:
+            col = self._semester_ids.setdefault(semester, len(self._semester_ids))
+            rows = np.empty(len(keys), dtype=np.int64)
+            for i, key in enumerate(keys):
+                row = self._route_ids.get(key)
+                if row is None:
+                    row = len(self._routes)
+                    self._route_ids[key] = row
+                    self._routes.append(key)
+                rows[i] = row
+            self._grow(len(self._routes), len(self._semester_ids))
+
+            self.priority[:, col] = ABSENT
+            self.density[:, col] = np.nan
+            self.inad[:, col] = 0
+            self.position[:, col] = ABSENT
+
+            self.priority[rows, col] = codes
+            self.density[rows, col] = density
+            self.inad[rows, col] = inad
+            self.position[rows, col] = np.arange(len(keys))
+
+    def _columns(self, semesters: List[str]) -> np.ndarray:
+        missing = [sem for sem in semesters if sem not in self._semester_ids]
+        if missing:
+            raise KeyError(f"Semesters not recorded: {missing}")
+        return np.array([self._semester_ids[sem] for sem in semesters], dtype=np.int64)
+
+    def matrices(self, semesters: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Slice the history to a semester subset.
+
+        Args:
+            semesters: Semester keys, in the column order wanted
+
+        Returns:
+            Dictionary with 'priority', 'density', 'inad' and 'position'
+            matrices of shape (n_routes, len(semesters))
+        """
+        with self._lock:
+            cols = self._columns(semesters)
+            n = len(self._routes)
+            return {
+                'priority': self.priority[:n, cols],
+                'density': self.density[:n, cols],
+                'inad': self.inad[:n, cols],
+                'position': self.position[:n, cols]
+            }
+
+    def routes(self) -> List[Tuple[str, str]]:
+        """(airline, lastStop) of every matrix row."""
+        with self._lock:
+            return list(self._routes)
+
+    def route(self, airline: str, last_stop: str, semesters: List[str]) -> List[Dict[str, Any]]:
+        """
+        History of a single route over a semester subset.
+
+        Args:
+            airline: Airline code
+            last_stop: Last stop airport code
+            semesters: Semester keys
+
+        Returns:
+            One entry per semester with priority (None when the route was
+            not analyzed that semester), density and INAD count
+        """
+        with self._lock:
+            cols = self._columns(semesters)
+            row = self._route_ids.get((airline, last_stop))
+            if row is None:
+                return [{'semester': sem, 'priority': None, 'density': None, 'inad': 0} for sem in semesters]
+            codes = self.priority[row, cols]
+            density = self.density[row, cols]
+            inad = self.inad[row, cols]
+
+        history = []
+        for sem, code, dens, count in zip(semesters, codes, density, inad):
+            history.append({
+                'semester': sem,
+                'priority': PRIORITY_LABELS[code] if code != ABSENT else None,
+                'density': float(dens) if not np.isnan(dens) else None,
+                'inad': int(count)
+            })
+        return history
+
+    def systemic_cases(self, semesters: List[str], config: AnalysisConfig) -> pd.DataFrame:
+        """
+        Detect systemic cases over a semester subset (see detect_systemic_cases).
+
+        Args:
+            semesters: Semester keys in chronological order
+            config: Analysis configuration
+
+        Returns:
+            DataFrame with systemic case analysis, in the same row order as
+            detect_systemic_cases on the same step 3 results
+        """
+        data = self.matrices(semesters)
+        routes = self.routes()[:len(data['priority'])]
+        priority = data['priority']
+
+        # Order rows by first flagged semester, then position in its results
+        # (never-flagged rows are dropped by systemic_from_matrices anyway)
+        flagged = (priority == HIGH_PRIORITY) | (priority == WATCH_LIST)
+        first = flagged.argmax(axis=1) if semesters else np.zeros(len(priority), dtype=np.int64)
+        position = data['position'][np.arange(len(first)), first] if semesters else first
+        order = np.lexsort((position, first))
+
+        return systemic_from_matrices(
+            [routes[row] for row in order],
+            semesters,
+            priority[order],
+            data['density'][order],
+            config
+        )
@@ -0,0 +1,88 @@
+"""
+Threshold Index Module - Sorted density arrays for live threshold queries
+
+Keeps the densities of a semester's reliable routes sorted, so the number
+of HIGH_PRIORITY and WATCH_LIST routes at any threshold and multiplier is
+answered with binary searches instead of re-running classify_priority.
+The counts follow the same rules as the classification step.
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Distinct high_priority_min_inad values kept per index
+MAX_INAD_FILTERS = 32
+
+
+def _count_at_least(sorted_values: np.ndarray, cutoff: float) -> int:
+    """Number of values >= cutoff in an ascending array."""
+    return int(len(sorted_values) - np.searchsorted(sorted_values, cutoff, side='left'))
+
+
+class ThresholdIndex:
+    """Priority counts of one semester's step 3 routes at arbitrary thresholds."""
+
+    def __init__(self, step3_df: pd.DataFrame):
+        density = pd.to_numeric(step3_df['Density'], errors='coerce').to_numpy(dtype=float)
+        pax = step3_df['PAX'].to_numpy(dtype=float)
+        inad = step3_df['INAD_Count'].to_numpy(dtype=float)
+        reliable = step3_df['IsReliable'].to_numpy(dtype=bool)
+
+        has_data = reliable & ~np.isnan(density) & (pax != 0)
+        order = np.argsort(density[has_data], kind='stable')
+
+        self.total = len(step3_df)
+        self.unreliable = int((~reliable).sum())
+        self.no_data = int((reliable & ~has_data).sum())
+        self.densities = density[has_data][order]
+        self.inad = inad[has_data][order]
+        self._by_min_inad: Dict[float, np.ndarray] = {}
+
+    def _high_candidates(self, min_inad: float) -> np.ndarray:
+        """Sorted densities of routes with at least min_inad INAD cases."""
+        candidates = self._by_min_inad.get(min_inad)
+        if candidates is None:
+            if len(self._by_min_inad) >= MAX_INAD_FILTERS:
+                self._by_min_inad.clear()
+            # Filtering keeps the ascending order
+            candidates = self.densities[self.inad >= min_inad]
+            self._by_min_inad[min_inad] = candidates
+        return candidates
+
+    def counts(
+        self,
+        threshold: float,
+        multiplier: float,
+        min_density: float,
+        high_priority_min_inad: float
+    ) -> Dict[str, int]:
+        """
+        Count routes per priority at a threshold and multiplier.
+
+        Args:
+            threshold: Density threshold for WATCH_LIST
+            multiplier: Threshold multiplier for HIGH_PRIORITY
+            min_density: Absolute minimum density for HIGH_PRIORITY
+            high_priority_min_inad: Minimum INAD cases for HIGH_PRIORITY
+
+        Returns:
+            Dictionary of summary counts (high_priority, watch_list, clear,
+            unreliable, no_data, total)
+        """
+        watch = _count_at_least(self.densities, threshold)
+        # HIGH_PRIORITY needs density above all three cutoffs at once
+        high_cutoff = max(threshold, min_density, threshold * multiplier)
+        high = _count_at_least(self._high_candidates(float(high_priority_min_inad)), high_cutoff)
+        if np.isnan(threshold):
+            watch = high = 0
+
+        return {
+            'high_priority': high,
+            'watch_list': watch - high,
+            'clear': len(self.densities) - watch,
+            'unreliable': self.unreliable,
+            'no_data': self.no_data,
+            'total': self.total
+        }
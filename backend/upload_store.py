@@ -0,0 +1,126 @@
+"""
+Upload Store Module - Content-addressed storage for uploaded workbooks
+
+Uploads are streamed to disk in fixed-size chunks and hashed while they
+arrive, so peak memory does not grow with the file size. Each file is
+stored under its SHA-256 content hash: uploading the same content again
+reuses the stored file (and its parsed-table sidecar cache), and the parsed
+dataset of a recent (INAD, BAZL) pair is kept in memory, so switching back
+to it skips parsing and keeps its warm analysis caches.
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from data_cache import get_cache_dir
+
+# Bytes read from the upload per chunk
+CHUNK_SIZE = 1 << 20
+
+# Stored files kept per kind; older ones are removed with their sidecars
+MAX_STORED_FILES = 8
+
+# Parsed datasets kept in memory (one per INAD/BAZL content pair)
+MAX_DATASETS = 4
+
+# Directory override (defaults to casa_uploads in the system temp directory)
+UPLOAD_DIR_ENV = 'CASA_UPLOAD_DIR'
+
+
+def get_upload_dir() -> str:
+    """Return the directory uploaded workbooks are stored in."""
+    return os.getenv(UPLOAD_DIR_ENV) or os.path.join(tempfile.gettempdir(), 'casa_uploads')
+
+
+class UploadStore:
+    """Content-addressed upload files plus an LRU of their parsed datasets."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        max_files: int = MAX_STORED_FILES,
+        max_datasets: int = MAX_DATASETS
+    ):
+        self.root = root or get_upload_dir()
+        self.max_files = max_files
+        self.max_datasets = max_datasets
+        self._datasets: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path_for(self, kind: str, digest: str) -> str:
+        """Return the stored path of a file with the given content hash."""
+        return os.path.join(self.root, f'{kind}.{digest}.xlsx')
+
+    def save(self, upload, kind: str, chunk_size: int = CHUNK_SIZE) -> Tuple[str, str]:
+        """
+        Stream an upload to disk, hashing it on the way.
+
+        Blocking file I/O - run it off the event loop (see main.run_blocking).
+
+        Args:
+            upload: Binary file-like object with read(size) (e.g. UploadFile.file)
+            kind: File kind used in the stored name (e.g. 'inad', 'bazl')
+            chunk_size: Read size in bytes
+
+        Returns:
+            Tuple of (stored file path, SHA-256 hex digest)
+        """
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = upload.read(chunk_size)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            path = self.path_for(kind, digest.hexdigest())
+            if os.path.exists(path):
+                # Same content as an earlier upload - keep the existing file
+                os.utime(path)
+            else:
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._prune(kind)
+        return path, digest.hexdigest()
+
+    def _prune(self, kind: str) -> None:
+        """Remove the least recently stored files of a kind over the limit."""
+        pattern = os.path.join(glob.escape(self.root), f'{kind}.*.xlsx')
+        paths = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+        for path in paths[self.max_files:]:
+            name = glob.escape(os.path.basename(path))
+            sidecars = glob.glob(os.path.join(glob.escape(get_cache_dir(path)), f'{name}.*.arrow'))
+            for stale in [path] + sidecars:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def get_dataset(self, key: Hashable) -> Optional[Any]:
+        """Return the parsed dataset stored under a key (marking it recently used), or None."""
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is not None:
+                self._datasets.move_to_end(key)
+            return dataset
+
+    def put_dataset(self, key: Hashable, dataset: Any) -> None:
+        """Keep a parsed dataset, evicting the least recently used over the limit."""
+        with self._lock:
+            self._datasets[key] = dataset
+            self._datasets.move_to_end(key)
+            while len(self._datasets) > self.max_datasets:
+                self._datasets.popitem(last=False)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the column-projected INAD/BAZL reader against pandas.read_excel.
+
+Times each ingest path and records its peak traced Python allocation.
+The workbooks in data/ are used unless paths are given.
+
+Usage:
+    python scripts/benchmark_ingest.py [--repeat N] [--no-memory] [INAD_FILE BAZL_FILE]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from inad_analysis import _parse_inad_workbook, _parse_bazl_workbook
+from generate_analysis import find_data_files
+
+
+def read_excel_full(file_path):
+    """The previous ingest path: materialize every column of the first sheet."""
+    return pd.read_excel(file_path, sheet_name=0, engine='openpyxl')
+
+
+def measure(func, file_path, repeat, trace_memory=True):
+    """Return (best wall time in seconds, peak traced memory in MB, row count).
+
+    Timing runs are untraced; the peak comes from one extra traced run,
+    because tracemalloc slows allocation-heavy parsing considerably.
+    """
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = func(file_path)
+        elapsed = time.perf_counter() - start
+        rows = len(df)
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        func(file_path)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    return best, peak, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('files', nargs='*', help='INAD and BAZL workbook paths')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per path (best time is reported)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory run')
+    args = parser.parse_args()
+
+    if args.files:
+        if len(args.files) != 2:
+            parser.error('pass both INAD_FILE and BAZL_FILE, or neither')
+        inad_file, bazl_file = args.files
+    else:
+        inad_file, bazl_file = find_data_files(Path(__file__).parent.parent / 'data')
+
+    # openpyxl warns about unsupported workbook extensions on every load
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+    cases = [
+        ('INAD', inad_file, _parse_inad_workbook),
+        ('BAZL', bazl_file, _parse_bazl_workbook),
+    ]
+
+    print(f"{'File':<6}{'Path':<12}{'Rows':>10}{'Time (s)':>11}{'Peak (MB)':>12}")
+    for label, file_path, projected in cases:
+        if not file_path:
+            print(f"{label:<6}(file not found)")
+            continue
+        for name, func in [('read_excel', read_excel_full), ('projected', projected)]:
+            elapsed, peak_mb, rows = measure(func, file_path, args.repeat, not args.no_memory)
+            peak_text = f"{peak_mb:.1f}" if peak_mb is not None else '-'
+            print(f"{label:<6}{name:<12}{rows:>10}{elapsed:>11.2f}{peak_text:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analysis pipeline on synthetic data at multiples of the real volume.
+
+For every scale, synthetic INAD/BAZL data is generated (see
+generate_synthetic_data.py) and each pipeline stage is timed on it, with
+the peak traced Python allocation of one extra run. Results are printed as
+a table and written to a JSON file; pass an earlier file as --baseline to
+print the time ratio against it.
+
+Workbook parsing is only measured while a table fits on one Excel sheet.
+All later stages start from the normalized columnar tables, i.e. the warm
+cache path of load_inad_table/load_bazl_table: read_*_table times the
+memory-mapped read, load_inad_data/load_bazl_data the period selection.
+
+Usage:
+    python scripts/benchmark_pipeline.py [--scales 1,10,100,1000] [--repeat N] [--no-memory]
+        [--no-excel] [--output FILE] [--baseline FILE] [--data-dir DIR]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from inad_analysis import (
+    AnalysisConfig,
+    _parse_inad_workbook,
+    _parse_bazl_workbook,
+    analyze_semesters,
+    bazl_lookup,
+    calculate_step1,
+    calculate_step2,
+    calculate_step3,
+    calculate_threshold,
+    classify_priority,
+    detect_systemic_cases,
+    inad_period,
+    parse_semester,
+    semesters_from_cube
+)
+from monthly_cube import MonthlyCube
+from geography import enrich_routes_with_coordinates
+from generate_analysis import analyze_semester, generate_historic_data, generate_systemic_cases
+from generate_synthetic_data import (
+    read_columnar,
+    scale_name,
+    synthetic_tables,
+    write_columnar,
+    write_excel
+)
+
+DEFAULT_SCALES = '1,10,100,1000'
+DEFAULT_OUTPUT = 'benchmark_pipeline.json'
+
+# Version of the JSON result layout
+RESULTS_VERSION = 1
+
+
+def measure(func, repeat, trace_memory=True):
+    """Return (best wall time in seconds, CPU time of that run, peak traced memory in MB, result).
+
+    Timing runs are untraced; the peak comes from one extra traced run,
+    because tracemalloc slows allocation-heavy stages considerably.
+    """
+    best = None
+    cpu = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+            cpu = time.process_time() - cpu_start
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    return best, cpu, peak, result
+
+
+def export_json(all_results, config):
+    """Build and serialize every file generate_analysis.py writes; return the total size in bytes."""
+    size = 0
+    for semester, results in all_results.items():
+        payload, _ = analyze_semester(None, None, semester, config, results)
+        size += len(json.dumps(payload, indent=2))
+    size += len(json.dumps(generate_historic_data(all_results), indent=2))
+    step3 = [(semester, results['step3']) for semester, results in all_results.items()]
+    size += len(json.dumps(generate_systemic_cases(step3, config), indent=2))
+    return size
+
+
+def environment():
+    """Interpreter, platform and library versions the results were measured with."""
+    try:
+        import pyarrow
+        arrow_version = pyarrow.__version__
+    except ImportError:
+        arrow_version = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'pyarrow': arrow_version
+    }
+
+
+def load_baseline(path):
+    """Map (scale, stage) -> seconds from an earlier results file."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        (entry['scale'], stage['stage']): stage['seconds']
+        for entry in data.get('scales', [])
+        for stage in entry.get('stages', [])
+    }
+
+
+def run_scale(scale, args, data_dir, baseline):
+    """Generate one scale's data and benchmark every stage on it."""
+    config = AnalysisConfig()
+    name = scale_name(scale)
+
+    tables = synthetic_tables(scale, args.seed)
+    entry = {'scale': scale, 'inad_rows': len(tables['inad']), 'bazl_rows': len(tables['bazl']), 'stages': []}
+    columnar = write_columnar(tables, data_dir, name)
+    excel = {'inad': None, 'bazl': None} if args.no_excel else write_excel(tables, data_dir, name, args.seed)
+    del tables
+    gc.collect()
+
+    print(f"\nScale {scale:g}: {entry['inad_rows']} INAD cases, {entry['bazl_rows']} BAZL rows")
+    header = f"{'Stage':<32}{'Rows':>10}{'Time (s)':>11}{'CPU (s)':>10}{'Peak (MB)':>12}"
+    print(header + (f"{'vs base':>10}" if baseline else ''))
+
+    def stage(label, func):
+        elapsed, cpu, peak, value = measure(func, args.repeat, not args.no_memory)
+        counted = value[0] if isinstance(value, tuple) else value
+        rows = len(counted) if hasattr(counted, '__len__') else None
+        entry['stages'].append({
+            'stage': label,
+            'seconds': round(elapsed, 6),
+            'cpu_seconds': round(cpu, 6),
+            'peak_mb': round(peak, 3) if peak is not None else None,
+            'rows': rows
+        })
+        peak_text = f"{peak:.1f}" if peak is not None else '-'
+        rows_text = str(rows) if rows is not None else '-'
+        line = f"{label:<32}{rows_text:>10}{elapsed:>11.3f}{cpu:>10.3f}{peak_text:>12}"
+        base = baseline.get((scale, label)) if baseline else None
+        if base:
+            line += f"{elapsed / base:>9.2f}x"
+        print(line)
+        return value
+
+    if excel['inad'] is not None:
+        stage('parse_inad_workbook', lambda: _parse_inad_workbook(str(excel['inad'])))
+    if excel['bazl'] is not None:
+        stage('parse_bazl_workbook', lambda: _parse_bazl_workbook(str(excel['bazl'])))
+
+    inad_table = stage('read_inad_table', lambda: read_columnar(columnar['inad']))
+    bazl_table = stage('read_bazl_table', lambda: read_columnar(columnar['bazl']))
+
+    # Single-semester stages run on the latest semester (which has BAZL PAX)
+    semesters = [s['value'] for s in semesters_from_cube(MonthlyCube(inad_table))]
+    entry['semesters'] = len(semesters)
+    start_date, end_date = parse_semester(semesters[-1])
+
+    inad_df = stage('load_inad_data', lambda: inad_period(inad_table, start_date, end_date))
+    pax_lookup, _ = stage('load_bazl_data', lambda: bazl_lookup(bazl_table, start_date, end_date))
+    step1 = stage('calculate_step1', lambda: calculate_step1(inad_df, config))
+    step2 = stage('calculate_step2', lambda: calculate_step2(inad_df, step1, config))
+    step3 = stage('calculate_step3', lambda: calculate_step3(step2, pax_lookup, config))
+    threshold = stage('calculate_threshold', lambda: calculate_threshold(step3, config))
+    stage('classify_priority', lambda: classify_priority(step3, threshold, config))
+
+    # Whole-dataset stages, as generate_analysis.py runs them
+    cube = stage('monthly_cube', lambda: MonthlyCube(inad_table, bazl_table))
+    all_results = stage('analyze_semesters', lambda: analyze_semesters(inad_table, bazl_table, semesters, config, cube))
+    stage('enrich_routes_with_coordinates', lambda: [
+        enrich_routes_with_coordinates(results['step3']) for results in all_results.values()
+    ])
+    stage('detect_systemic_cases', lambda: detect_systemic_cases(
+        [(semester, results['step3']) for semester, results in all_results.items()], config
+    ))
+    entry['json_bytes'] = stage('json_export', lambda: export_json(all_results, config))
+
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=DEFAULT_SCALES, help='Comma-separated data volume multiples')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per stage (best time is reported)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the traced peak-memory runs')
+    parser.add_argument('--no-excel', action='store_true', help='Skip writing and parsing the workbooks')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the synthetic data')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='JSON results file')
+    parser.add_argument('--baseline', help='Earlier JSON results file to compare against')
+    parser.add_argument('--data-dir', help='Keep the generated data in this directory (default: temporary)')
+    args = parser.parse_args()
+
+    try:
+        scales = [float(value) for value in args.scales.split(',') if value.strip()]
+    except ValueError:
+        parser.error(f"invalid --scales: {args.scales}")
+    baseline = load_baseline(args.baseline) if args.baseline else None
+
+    # openpyxl warns about unsupported workbook extensions on every load
+    warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+
+    report = {
+        'version': RESULTS_VERSION,
+        'generated_at': datetime.now().isoformat(),
+        'environment': environment(),
+        'settings': {'repeat': args.repeat, 'memory': not args.no_memory, 'seed': args.seed},
+        'scales': []
+    }
+
+    with tempfile.TemporaryDirectory(prefix='casa_bench_') as tmp_dir:
+        data_dir = Path(args.data_dir or tmp_dir)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for scale in scales:
+            try:
+                report['scales'].append(run_scale(scale, args, data_dir, baseline))
+            except MemoryError:
+                print(f"\nScale {scale:g}: out of memory")
+                report['scales'].append({'scale': scale, 'error': 'MemoryError'})
+            gc.collect()
+
+            # Write after every scale, so a run killed at a large scale keeps the rest
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
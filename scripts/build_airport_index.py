@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Rebuild the compact airport index used by backend/geography.py.
+
+Merges the airportsdata package with the local AIRPORT_DATABASE fallback
+and writes backend/airport_index.npy (sorted codes, float32 coordinates,
+string ids) plus backend/airport_index.json (interned string tables).
+Run this after upgrading airportsdata or editing AIRPORT_DATABASE.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from geography import AIRPORT_INDEX_PATH, AIRPORT_STRINGS_PATH, write_airport_index
+
+
+def main():
+    count = write_airport_index()
+    print(f"Wrote {count} airports")
+    print(f"  {AIRPORT_INDEX_PATH} ({os.path.getsize(AIRPORT_INDEX_PATH) // 1024} KB)")
+    print(f"  {AIRPORT_STRINGS_PATH} ({os.path.getsize(AIRPORT_STRINGS_PATH) // 1024} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,22 +4,73 @@ Generate static JSON analysis files from INAD and BAZL Excel data.
 This script is run by GitHub Actions when new data is uploaded.
 """
 
+import argparse
+import gzip
+import hashlib
 import json
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+import pandas as pd
+
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
 
 from inad_analysis import (
     AnalysisConfig,
     run_full_analysis,
+    analyze_semesters,
+    load_inad_table,
+    load_bazl_table,
+    parse_semester,
     get_available_semesters,
-    detect_systemic_cases
+    detect_systemic_cases,
+    config_fingerprint,
+    semester_data_hashes
 )
 from geography import enrich_routes_with_coordinates
+from data_cache import cache_enabled
+from metrics import REGISTRY, enable_memory_tracing, format_profile, span
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Normalized tables held by each worker process (see _init_worker)
+_worker_tables = None
+
+# Records which inputs produced each analysis_<semester>.json
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Files whose changes invalidate every semester in the manifest
+PIPELINE_SOURCES = [
+    'backend/inad_analysis.py',
+    'backend/monthly_cube.py',
+    'backend/excel_reader.py',
+    'backend/data_cache.py',
+    'backend/geography.py',
+    'backend/airport_index.npy',
+    'backend/airport_index.json',
+    'scripts/generate_analysis.py',
+]
+
+# Per-route lists of the analysis payload that compact output stores column-wise
+COLUMNAR_LISTS = ('routes', 'airlines', 'step2Routes')
+
+# Precompressed siblings written next to each compact output file
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+# Hex digits of the content hash in immutable file names (<stem>.<hash>.json)
+CONTENT_HASH_LENGTH = 12
+HASHED_FILE_PATTERN = re.compile(
+    r'^(?P<name>(?:analysis_.+|bootstrap)\.[0-9a-f]{%d}\.json)(?:\.gz|\.br)?(?:\.tmp)?$' % CONTENT_HASH_LENGTH
+)
 
 def find_data_files(data_dir):
     """Find INAD and BAZL files in the data directory."""
@@ -35,30 +86,130 @@ def find_data_files(data_dir):
 
     return inad_file, bazl_file
 
-def analyze_semester(inad_path, bazl_path, semester, config):
+def columnar(records):
+    """Turn a list of same-keyed dicts into one list per key."""
+    if not records:
+        return {}
+    return {key: [record[key] for record in records] for key in records[0]}
+
+def compact_payload(payload):
+    """Return an analysis payload with its per-route lists stored column-wise."""
+    return {
+        **payload,
+        **{name: columnar(payload[name]) for name in COLUMNAR_LISTS},
+        'layout': 'columnar'
+    }
+
+def compressed_suffixes():
+    """Suffixes of the precompressed siblings this environment can write."""
+    return COMPRESSED_SUFFIXES if brotli is not None else COMPRESSED_SUFFIXES[:1]
+
+def missing_siblings(path):
+    """Suffixes of the precompressed siblings of an output file that don't exist yet."""
+    return [suffix for suffix in compressed_suffixes() if not os.path.exists(f'{path}{suffix}')]
+
+def write_atomic(path, data):
+    """Write bytes through a temporary file, so an interrupted run leaves no partial file."""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def precompress(path, data=None, suffixes=None):
+    """Write the .gz (and, with brotli installed, .br) siblings of an output file.
+
+    suffixes limits the siblings written; by default all are rewritten and a
+    stale .br is removed when brotli is not installed.
+    """
+    if suffixes is None:
+        suffixes = compressed_suffixes()
+        if brotli is None and os.path.exists(f'{path}.br'):
+            os.remove(f'{path}.br')
+    if data is None:
+        data = Path(path).read_bytes()
+    if '.gz' in suffixes:
+        write_atomic(f'{path}.gz', gzip.compress(data, compresslevel=9, mtime=0))
+    if '.br' in suffixes:
+        write_atomic(f'{path}.br', brotli.compress(data, quality=11))
+
+def serialize(data, compact=False, **kwargs):
+    """Return the JSON text of an output file (minified when compact)."""
+    if compact:
+        return json.dumps(data, separators=(',', ':'))
+    return json.dumps(data, **kwargs)
+
+def write_json(path, data, compact=False, **kwargs):
+    """Serialize one output file (recorded as the write_json stage).
+
+    Compact output is minified and gets precompressed siblings; otherwise
+    stale siblings from an earlier compact run are removed.
+    """
+    with span('write_json'):
+        text = serialize(data, compact, **kwargs)
+        with open(path, 'w') as f:
+            f.write(text)
+
+        if compact:
+            precompress(path, text.encode('utf-8'))
+        else:
+            for suffix in COMPRESSED_SUFFIXES:
+                if os.path.exists(f'{path}{suffix}'):
+                    os.remove(f'{path}{suffix}')
+
+def write_hashed(output_dir, stem, text, compact=False):
+    """Write JSON text to <stem>.<content hash>.json and return the file name.
+
+    The name changes whenever the content does, so the file can be cached
+    as immutable. An existing file of that name already holds the text;
+    in compact mode, any of its precompressed siblings still missing (e.g.
+    after an interrupted run, or brotli installed since) are written.
+    """
+    data = text.encode('utf-8')
+    name = f'{stem}.{hashlib.sha256(data).hexdigest()[:CONTENT_HASH_LENGTH]}.json'
+    path = Path(output_dir) / name
+    missing = missing_siblings(path) if compact else []
+    if missing or not path.exists():
+        with span('write_json'):
+            if not path.exists():
+                write_atomic(path, data)
+            if missing:
+                precompress(path, data, missing)
+    return name
+
+def without_timestamp(payload):
+    """Drop generated_at, so unchanged content hashes to the same file name."""
+    if payload is None:
+        return None
+    return {key: value for key, value in payload.items() if key != 'generated_at'}
+
+def prune_hashed(output_dir, keep):
+    """Remove content-hashed files (and their siblings) not named in keep."""
+    for path in Path(output_dir).iterdir():
+        match = HASHED_FILE_PATTERN.match(path.name)
+        if match and match.group('name') not in keep:
+            path.unlink()
+
+def analyze_semester(inad_path, bazl_path, semester, config, results=None):
     """Run analysis for a single semester.
 
     Returns both the JSON-friendly payload and the raw step3 DataFrame
     so we can reuse calculations for systemic case detection without
-    re-running the full pipeline.
+    re-running the full pipeline. Pass ``results`` (one entry of
+    analyze_semesters) to skip running the pipeline here.
     """
-    year, half = semester.split('-')
-    year = int(year)
-
-    if half == 'H1':
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 6, 30)
-    else:
-        start_date = datetime(year, 7, 1)
-        end_date = datetime(year, 12, 31)
-
-    results = run_full_analysis(inad_path, bazl_path, start_date, end_date, config)
+    if results is None:
+        start_date, end_date = parse_semester(semester)
+        results = run_full_analysis(inad_path, bazl_path, start_date, end_date, config)
 
     # Enrich with coordinates
     step3_df = results['step3']
     step3_enriched = enrich_routes_with_coordinates(step3_df)
 
-    # Convert to JSON-friendly format
+    with span('build_payload'):
+        return _semester_payload(semester, results, step3_enriched, config), step3_df
+
+def _semester_payload(semester, results, step3_enriched, config):
+    """Convert one semester's enriched results into the analysis_<semester>.json payload."""
     routes = []
     for _, row in step3_enriched.iterrows():
         routes.append({
@@ -66,7 +217,7 @@ def analyze_semester(inad_path, bazl_path, semester, config):
             'lastStop': row['LastStop'],
             'inad': int(row['INAD_Count']),
             'pax': int(row['PAX']),
-            'density': round(row['Density'], 4) if row['Density'] else None,
+            'density': round(row['Density'], 4) if pd.notna(row['Density']) and row['Density'] else None,
             'confidence': int(row['Confidence']),
             'priority': row['Priority'],
             'originLat': row.get('OriginLat'),
@@ -107,7 +258,128 @@ def analyze_semester(inad_path, bazl_path, semester, config):
             'high_priority_multiplier': config.high_priority_multiplier
         },
         'generated_at': datetime.now().isoformat()
-    }, step3_df
+    }
+
+def process_semesters(inad_table, bazl_table, semesters, config, output_dir, compact=False):
+    """Analyze a group of semesters and write each analysis_<semester>.json.
+
+    Returns a list of (semester, payload, step3_df, error) tuples; payload
+    and step3_df are None and error is set when a semester fails.
+    """
+    all_results = analyze_semesters(inad_table, bazl_table, semesters, config)
+
+    processed = []
+    for semester in semesters:
+        try:
+            result, step3_df = analyze_semester(
+                None, None, semester, config, results=all_results[semester]
+            )
+
+            # Save individual semester analysis
+            path = Path(output_dir) / f'analysis_{semester}.json'
+            if compact:
+                write_json(path, compact_payload(result), compact=True)
+            else:
+                write_json(path, result, indent=2)
+            processed.append((semester, result, step3_df, None))
+        except Exception as e:
+            processed.append((semester, None, None, str(e)))
+
+    return processed
+
+def _init_worker(inad_path, bazl_path, trace_memory=False):
+    """Load the normalized tables once per worker from the columnar cache."""
+    global _worker_tables
+    # Forked workers inherit the parent's spans; report only their own
+    REGISTRY.reset()
+    enable_memory_tracing(trace_memory)
+    _worker_tables = (load_inad_table(inad_path), load_bazl_table(bazl_path))
+
+def _process_in_worker(semesters, config, output_dir, compact=False):
+    """Pool task: analyze semesters against the worker's cached tables.
+
+    Returns the processed tuples and the stage spans recorded for them.
+    """
+    inad_table, bazl_table = _worker_tables
+    processed = process_semesters(inad_table, bazl_table, semesters, config, output_dir, compact)
+    return processed, REGISTRY.drain()
+
+def run_semesters(
+    inad_path, bazl_path, semesters, config, output_dir, jobs=1, tables=None, trace_memory=False, compact=False
+):
+    """Analyze all semesters, optionally fanned out over a process pool.
+
+    The workbooks are parsed once up front (pass ``tables`` if they are
+    already loaded). Pool workers then memory-map the parsed tables from
+    the columnar cache instead of receiving them pickled; their stage spans
+    are merged into this process's metrics registry. Yields processed
+    tuples (see process_semesters) as each group of semesters completes.
+    """
+    if not semesters:
+        return
+
+    # Parse once (and populate the cache the workers read from)
+    if tables is None:
+        tables = (load_inad_table(inad_path), load_bazl_table(bazl_path))
+    inad_table, bazl_table = tables
+
+    if jobs > 1 and not cache_enabled():
+        print("Note: pyarrow is not installed, so the columnar cache is unavailable; running serially")
+        jobs = 1
+    jobs = min(jobs, len(semesters))
+
+    if jobs <= 1:
+        yield from process_semesters(inad_table, bazl_table, semesters, config, output_dir, compact)
+        return
+
+    # Round-robin so old (small) and recent (large) semesters spread evenly
+    groups = [semesters[i::jobs] for i in range(jobs)]
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(inad_path, bazl_path, trace_memory)
+    ) as pool:
+        futures = [
+            pool.submit(_process_in_worker, group, config, str(output_dir), compact) for group in groups
+        ]
+        for future in as_completed(futures):
+            processed, spans = future.result()
+            REGISTRY.merge(spans)
+            yield from processed
+
+def pipeline_fingerprint(project_root, config, compact=False):
+    """Hash the analysis code, configuration and output layout shared by all semesters."""
+    seed = f'manifest-v{MANIFEST_VERSION}:{config_fingerprint(config)}' + (':compact' if compact else '')
+    digest = hashlib.sha256(seed.encode('utf-8'))
+    for relative in PIPELINE_SOURCES:
+        path = Path(project_root) / relative
+        digest.update(relative.encode('utf-8'))
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def load_manifest(output_dir):
+    """Load the previous run's manifest (empty if missing or unreadable)."""
+    try:
+        with open(Path(output_dir) / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+def flagged_routes(step3_df):
+    """Return the routes systemic detection needs, at full density precision."""
+    flagged = step3_df[step3_df['Priority'].isin(['HIGH_PRIORITY', 'WATCH_LIST'])]
+    return [
+        [row.Airline, row.LastStop, row.Priority, float(row.Density)]
+        for row in flagged.itertuples(index=False)
+    ]
+
+def step3_from_manifest(entry):
+    """Rebuild the step3 rows used by detect_systemic_cases from a manifest entry."""
+    return pd.DataFrame(
+        entry.get('flagged', []), columns=['Airline', 'LastStop', 'Priority', 'Density']
+    )
 
 def generate_historic_data(semester_results):
     """Generate historic trend data from semester results."""
@@ -157,8 +429,6 @@ def generate_historic_data(semester_results):
 
 def generate_systemic_cases(semester_step3_results, config):
     """Generate systemic cases data from pre-computed step3 results."""
-    import pandas as pd
-
     systemic_df = detect_systemic_cases(semester_step3_results, config)
 
     cases = []
@@ -168,6 +438,8 @@ def generate_systemic_cases(semester_step3_results, config):
             'lastStop': row['LastStop'],
             'appearances': int(row['Appearances']),
             'consecutive': bool(row['Consecutive']),
+            'longestStreak': int(row['LongestStreak']),
+            'currentStreak': int(row['CurrentStreak']),
             'trend': row['Trend'],
             'latestPriority': row['LatestPriority']
         })
@@ -177,7 +449,33 @@ def generate_systemic_cases(semester_step3_results, config):
         'generated_at': datetime.now().isoformat()
     }
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description='Generate static JSON analysis files.')
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=int(os.getenv('ANALYSIS_JOBS', '1')),
+        help='Worker processes for per-semester analysis (0 = one per CPU core)'
+    )
+    parser.add_argument(
+        '--full', action='store_true',
+        help='Recompute every semester, ignoring the manifest from the previous run'
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Print wall time, CPU time and peak memory per pipeline stage (traces memory, which slows the run)'
+    )
+    parser.add_argument(
+        '--compact', action='store_true', default=os.getenv('ANALYSIS_COMPACT', '') not in ('', '0'),
+        help='Write minified JSON with column-wise route lists, plus .gz/.br siblings'
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.profile:
+        enable_memory_tracing()
+
     # Paths
     project_root = Path(__file__).parent.parent
     data_dir = project_root / 'data'
@@ -203,7 +501,7 @@ def main():
 
     # Get available semesters
     semesters = get_available_semesters(inad_file)
-    max_semesters = int(os.getenv('MAX_SEMESTERS', '12'))
+    max_semesters = int(os.getenv('MAX_SEMESTERS', '0'))
     if max_semesters and len(semesters) > max_semesters:
         semesters = semesters[-max_semesters:]
         print(f"Found {len(semesters)} semesters (trimmed to last {max_semesters}): {[s['value'] for s in semesters]}")
@@ -211,34 +509,69 @@ def main():
         print(f"Found {len(semesters)} semesters: {[s['value'] for s in semesters]}")
 
     # Save semesters list
-    with open(output_dir / 'semesters.json', 'w') as f:
-        json.dump(semesters, f, indent=2)
+    write_json(output_dir / 'semesters.json', semesters, compact=args.compact, indent=2)
     print("Generated: semesters.json")
 
-    # Analyze each semester
-    semester_results = {}
-    semester_step3 = []
-    for sem_info in semesters:
-        semester = sem_info['value']
-        print(f"Analyzing {semester}...")
+    # Hash each semester's contributing rows together with code and config
+    semester_values = [s['value'] for s in semesters]
+    tables = (load_inad_table(inad_file), load_bazl_table(bazl_file))
+    pipeline_hash = pipeline_fingerprint(project_root, config, args.compact)
+    with span('semester_hashes'):
+        semester_hashes = {
+            sem: hashlib.sha256(f'{pipeline_hash}:{data_hash}'.encode('utf-8')).hexdigest()
+            for sem, data_hash in semester_data_hashes(*tables, semester_values).items()
+        }
 
+    previous = {} if args.full else load_manifest(output_dir).get('semesters', {})
+    manifest_entries = {}
+    semester_results = {}
+    step3_by_semester = {}
+
+    # Reuse semesters whose inputs are unchanged since the last run
+    for semester in semester_values:
+        entry = previous.get(semester)
+        if not entry or entry.get('hash') != semester_hashes[semester]:
+            continue
+        path = output_dir / f'analysis_{semester}.json'
         try:
-            result, step3_df = analyze_semester(inad_file, bazl_file, semester, config)
-            semester_results[semester] = result
-            semester_step3.append((semester, step3_df))
+            with open(path) as f:
+                semester_results[semester] = json.load(f)
+            missing = missing_siblings(path) if args.compact else []
+            if missing:
+                precompress(path, suffixes=missing)
+        except (OSError, ValueError):
+            continue
+        step3_by_semester[semester] = step3_from_manifest(entry)
+        manifest_entries[semester] = entry
+
+    changed = [sem for sem in semester_values if sem not in semester_results]
+    print(f"Reusing {len(semester_results)} unchanged semesters; analyzing {len(changed)} (jobs: {jobs})...")
+
+    # Run the pipeline for changed semesters, writing each file as it completes
+    for semester, result, step3_df, error in run_semesters(
+        inad_file, bazl_file, changed, config, output_dir, jobs,
+        tables=tables, trace_memory=args.profile, compact=args.compact
+    ):
+        if error is not None:
+            print(f"  Error analyzing {semester}: {error}")
+            continue
+        semester_results[semester] = result
+        step3_by_semester[semester] = step3_df
+        manifest_entries[semester] = {
+            'hash': semester_hashes[semester],
+            'flagged': flagged_routes(step3_df)
+        }
+        print(f"  Generated: analysis_{semester}.json")
 
-            # Save individual semester analysis
-            with open(output_dir / f'analysis_{semester}.json', 'w') as f:
-                json.dump(result, f, indent=2)
-            print(f"  Generated: analysis_{semester}.json")
-        except Exception as e:
-            print(f"  Error analyzing {semester}: {e}")
+    # Systemic detection expects chronological order
+    semester_step3 = [(sem, step3_by_semester[sem]) for sem in semester_values if sem in step3_by_semester]
 
     # Generate historic data
+    historic = None
+    systemic = None
     if semester_results:
         historic = generate_historic_data(semester_results)
-        with open(output_dir / 'historic.json', 'w') as f:
-            json.dump(historic, f, indent=2)
+        write_json(output_dir / 'historic.json', historic, compact=args.compact, indent=2)
         print("Generated: historic.json")
 
     # Generate systemic cases
@@ -246,16 +579,44 @@ def main():
         print("Detecting systemic cases...")
         try:
             systemic = generate_systemic_cases(semester_step3, config)
-            with open(output_dir / 'systemic.json', 'w') as f:
-                json.dump(systemic, f, indent=2)
+            write_json(output_dir / 'systemic.json', systemic, compact=args.compact, indent=2)
             print("Generated: systemic.json")
         except Exception as e:
             print(f"Error generating systemic cases: {e}")
 
+    # Immutable, content-hashed copies of the semester files, plus one
+    # bootstrap file with everything the dashboard needs for its first render.
+    # Timestamps stay out of them (index.json carries generated_at), so their
+    # names only change when the data does.
+    semester_files = {}
+    semester_payloads = {}
+    for semester in semester_values:
+        path = output_dir / f'analysis_{semester}.json'
+        if semester in semester_results and path.exists():
+            with open(path) as f:
+                semester_payloads[semester] = without_timestamp(json.load(f))
+            semester_files[semester] = write_hashed(
+                output_dir, f'analysis_{semester}',
+                serialize(semester_payloads[semester], args.compact, indent=2), args.compact
+            )
+
+    latest = semester_values[-1] if semester_values else None
+    bootstrap = {
+        'semesters': semesters,
+        'latest_semester': latest,
+        'analysis': semester_payloads.get(latest),
+        'historic': without_timestamp(historic),
+        'systemic': without_timestamp(systemic)
+    }
+    bootstrap_file = write_hashed(output_dir, 'bootstrap', serialize(bootstrap, args.compact, indent=2), args.compact)
+    print(f"Generated: {bootstrap_file}")
+
     # Generate index file with metadata
     index = {
         'semesters': [s['value'] for s in semesters],
         'latest_semester': semesters[-1]['value'] if semesters else None,
+        'bootstrap': bootstrap_file,
+        'files': semester_files,
         'generated_at': datetime.now().isoformat(),
         'config': {
             'min_inad': config.min_inad,
@@ -265,11 +626,24 @@ def main():
             'high_priority_multiplier': config.high_priority_multiplier
         }
     }
-    with open(output_dir / 'index.json', 'w') as f:
-        json.dump(index, f, indent=2)
+    write_json(output_dir / 'index.json', index, compact=args.compact, indent=2)
     print("Generated: index.json")
+    prune_hashed(output_dir, {bootstrap_file, *semester_files.values()})
+
+    # Record the inputs behind each semester file for the next run
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'pipeline': pipeline_hash,
+        'semesters': {sem: manifest_entries[sem] for sem in semester_values if sem in manifest_entries}
+    }
+    write_json(output_dir / MANIFEST_NAME, manifest)
+    print(f"Generated: {MANIFEST_NAME}")
 
     print("\nAnalysis complete!")
 
+    if args.profile:
+        print("\nStage profile (nested stages are included in their callers):")
+        print(format_profile(REGISTRY.summary()))
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic INAD-Tabelle and BAZL-Daten data at a multiple of the real volume.
+
+Scale 1 matches the shape of the real workbooks (about 18k INAD cases over
+15.5 years, 2 years of monthly BAZL PAX). Larger scales grow the number of
+routes linearly and the number of airlines and last stops with the square
+root of the scale, keeping the skew of the real data: a few airlines and
+stops carry most cases, reason codes follow the real mix (about 40% count
+towards the analysis) and cases follow the real monthly seasonality.
+
+Each table is written as an Excel workbook with the real header names (when
+it fits on one sheet) and as its normalized columnar table in the Arrow IPC
+(Feather) format that load_inad_table/load_bazl_table produce.
+
+Usage:
+    python scripts/generate_synthetic_data.py [--scale N] [--seed S] [--format excel,arrow] [--output-dir DIR]
+"""
+
+import argparse
+import itertools
+import string
+import sys
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from inad_analysis import EXCLUDE_CODES
+from geography import AIRPORT_DATABASE, get_airport_table
+
+try:
+    import pyarrow.feather as _feather
+except ImportError:  # pragma: no cover - columnar output needs pyarrow
+    _feather = None
+
+# Volume of the real data (scale 1; about half of the candidate routes end
+# up with cases, most of them with only a few)
+BASE_INAD_ROWS = 18000
+BASE_AIRLINES = 150
+BASE_STOPS = 400
+BASE_ROUTES = 1400
+
+# INAD months covered, and the trailing months that also have BAZL PAX
+FIRST_MONTH = (2010, 1)
+LAST_MONTH = (2025, 6)
+BAZL_MONTHS = 24
+
+# Popularity skew (Zipf exponents) of airlines and last stops
+AIRLINE_SKEW = 1.0
+STOP_SKEW = 1.0
+
+# BAZL coverage: a route of average case volume has PAX in 1 - exp(-x)
+# of the months (and is in the BAZL data at all with the same probability)
+BAZL_COVERAGE = 2.0
+
+# Spread (lognormal sigma) of the case volume between routes
+ROUTE_SPREAD = 2.5
+
+# Share of routes that only fly part of the period
+PARTIAL_ROUTE_SHARE = 0.4
+
+# Median INAD cases per 1000 PAX on a route
+MEDIAN_DENSITY = 0.05
+
+# Rows with a missing airline / last stop
+MISSING_AIRLINE = 0.0005
+MISSING_STOP = 0.0015
+
+# Relative case volume per calendar month (from the real INAD table)
+MONTH_PROFILE = np.array([1.00, 1.02, 1.10, 0.84, 0.99, 1.07, 1.04, 0.91, 1.07, 0.93, 0.99, 1.21])
+
+# Yearly growth of the case volume
+YEARLY_GROWTH = 1.02
+
+# Reason code mix in percent (from the real INAD table; rare codes folded in)
+REASON_CODES = {
+    'H': 16.0, 'I': 14.9, 'E': 12.8, 'G': 11.9, 'C6': 9.9, 'C': 7.2, 'F1e': 7.0,
+    'A3': 3.2, 'F': 3.0, 'C8': 2.2, 'A5': 1.8, 'B': 1.4, 'C2': 1.3, 'F1n': 1.1,
+    'C5e': 0.9, 'A': 0.9, 'C4e': 0.8, 'B1n': 0.6, 'D': 0.4, 'A1': 0.4, 'B1e': 0.4,
+    'C1': 0.3, 'A2': 0.3, 'D2e': 0.3, 'C3': 0.3, 'C5n': 0.2, 'D2n': 0.2, 'B2e': 0.2,
+    'D1n': 0.2, 'D1e': 0.1
+}
+
+# Header names of the generated workbooks (as in the real files)
+INAD_HEADERS = ['Jahr', 'Monat', 'Ankunftsdatum', 'Nationalität', 'Abflugort (last stop)',
+                'Fluggesellschaft', 'Flugnummer', 'EVGrund']
+BAZL_HEADERS = ['Airline Code (IATA)', 'Flughafen (IATA)', 'Passagiere / Passagers', 'Jahr', 'Monat']
+
+# Data rows that fit on one Excel sheet
+EXCEL_MAX_ROWS = 1048575
+
+
+def _codes(count: int, length: int, exclude=()) -> List[str]:
+    """Return `count` distinct upper-case codes of `length` letters."""
+    excluded = set(exclude)
+    codes = []
+    for letters in itertools.product(string.ascii_uppercase, repeat=length):
+        code = ''.join(letters)
+        if code not in excluded:
+            codes.append(code)
+            if len(codes) == count:
+                break
+    return codes
+
+
+def airline_codes(count: int) -> List[str]:
+    """Two-letter airline codes, then three-letter ones once those run out."""
+    codes = _codes(min(count, 26 * 26), 2)
+    if count > len(codes):
+        codes += _codes(count - len(codes), 3)
+    return codes
+
+
+def stop_codes(count: int) -> List[str]:
+    """
+    Last stop codes, most popular first.
+
+    The airports of the local fallback database come first, then the rest of
+    the airport index, so most cases resolve to coordinates; codes beyond the
+    index are made-up three-letter codes that stay unresolved.
+    """
+    known = list(AIRPORT_DATABASE)
+    known += [code for code in get_airport_table().index if code not in AIRPORT_DATABASE]
+    codes = known[:count]
+    if count > len(codes):
+        codes += _codes(count - len(codes), 3, exclude=known)
+    return codes
+
+
+def _zipf_weights(count: int, skew: float) -> np.ndarray:
+    weights = 1.0 / np.arange(1, count + 1) ** skew
+    return weights / weights.sum()
+
+
+def _months() -> np.ndarray:
+    """Month keys (year * 12 + month - 1) from FIRST_MONTH to LAST_MONTH."""
+    first = FIRST_MONTH[0] * 12 + FIRST_MONTH[1] - 1
+    last = LAST_MONTH[0] * 12 + LAST_MONTH[1] - 1
+    return np.arange(first, last + 1)
+
+
+def _sample_routes(rng: np.random.Generator, n_routes: int, n_airlines: int, n_stops: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw distinct (airline, stop) index pairs, popular airlines and stops first."""
+    airline_p = _zipf_weights(n_airlines, AIRLINE_SKEW)
+    stop_p = _zipf_weights(n_stops, STOP_SKEW)
+    n_routes = min(n_routes, n_airlines * n_stops // 2)
+
+    keys = np.empty(0, dtype=np.int64)
+    while len(keys) < n_routes:
+        draws = 2 * (n_routes - len(keys))
+        new = rng.choice(n_airlines, draws, p=airline_p) * n_stops + rng.choice(n_stops, draws, p=stop_p)
+        keys = np.concatenate([keys, new])
+        _, first = np.unique(keys, return_index=True)
+        keys = keys[np.sort(first)]
+    keys = keys[:n_routes]
+    return keys // n_stops, keys % n_stops
+
+
+def _draw_months(rng: np.random.Generator, routes: np.ndarray, start: np.ndarray, end: np.ndarray, month_p: np.ndarray) -> np.ndarray:
+    """Draw a month position per case from the seasonal profile, within its route's active span."""
+    cdf = np.concatenate([[0.0], np.cumsum(month_p)])
+    lo = cdf[start[routes]]
+    hi = cdf[end[routes] + 1]
+    months = np.searchsorted(cdf, lo + rng.random(len(routes)) * (hi - lo), side='right') - 1
+    return np.clip(months, start[routes], end[routes])
+
+
+def synthetic_tables(scale: float = 1, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """
+    Generate the synthetic INAD and BAZL tables.
+
+    Args:
+        scale: Multiple of the real data volume
+        seed: Random seed (the same seed and scale give the same tables)
+
+    Returns:
+        Dictionary with 'inad' (Airline, LastStop, Year, Month, Code) and
+        'bazl' (Airline, Airport, PAX, Year, Month) DataFrames
+    """
+    rng = np.random.default_rng(seed)
+    growth = np.sqrt(scale)
+    n_airlines = max(2, round(BASE_AIRLINES * growth))
+    n_stops = max(2, round(BASE_STOPS * growth))
+    airlines = np.array(airline_codes(n_airlines), dtype=object)
+    stops = np.array(stop_codes(n_stops), dtype=object)
+
+    route_airline, route_stop = _sample_routes(rng, round(BASE_ROUTES * scale), n_airlines, n_stops)
+    n_routes = len(route_airline)
+
+    # Case rate per route: popular airlines and stops already have more
+    # routes, so their popularity only adds a damped share on top
+    weight = (
+        np.sqrt(_zipf_weights(n_airlines, AIRLINE_SKEW)[route_airline])
+        * np.sqrt(_zipf_weights(n_stops, STOP_SKEW)[route_stop])
+        * rng.lognormal(0.0, ROUTE_SPREAD, n_routes)
+    )
+    weight /= weight.sum()
+
+    # Seasonal, slowly growing monthly volume
+    months = _months()
+    month_p = MONTH_PROFILE[months % 12] * YEARLY_GROWTH ** (months // 12 - months[0] // 12)
+    month_p /= month_p.sum()
+
+    # Some routes only fly part of the period
+    n_months = len(months)
+    start = np.zeros(n_routes, dtype=np.int64)
+    end = np.full(n_routes, n_months - 1, dtype=np.int64)
+    partial = rng.random(n_routes) < PARTIAL_ROUTE_SHARE
+    length = np.minimum(n_months, 12 + rng.integers(0, n_months, n_routes))
+    start[partial] = rng.integers(0, n_months - length[partial] + 1)
+    end[partial] = start[partial] + length[partial] - 1
+
+    # INAD cases
+    n_cases = rng.poisson(BASE_INAD_ROWS * scale)
+    case_route = rng.choice(n_routes, n_cases, p=weight)
+    case_month = months[_draw_months(rng, case_route, start, end, month_p)]
+    code_names = np.array(list(REASON_CODES), dtype=object)
+    code_p = np.array(list(REASON_CODES.values()))
+    case_code = rng.choice(len(code_names), n_cases, p=code_p / code_p.sum())
+
+    inad_airline = pd.Series(airlines[route_airline[case_route]], dtype='str')
+    inad_stop = pd.Series(stops[route_stop[case_route]], dtype='str')
+    inad_airline[rng.random(n_cases) < MISSING_AIRLINE] = None
+    inad_stop[rng.random(n_cases) < MISSING_STOP] = None
+    inad = pd.DataFrame({
+        'Airline': inad_airline,
+        'LastStop': inad_stop,
+        'Year': pd.array(case_month // 12, dtype='Int64'),
+        'Month': pd.array(case_month % 12 + 1, dtype='Int64'),
+        'Code': pd.Series(code_names[case_code], dtype='str')
+    })
+
+    # BAZL rows: busy routes are reported in more of the trailing months
+    bazl_months = np.arange(max(0, n_months - BAZL_MONTHS), n_months)
+    coverage = 1 - np.exp(-weight * n_routes * BAZL_COVERAGE)
+    served = np.flatnonzero(rng.random(n_routes) < coverage)
+    rows = rng.random((len(served), len(bazl_months))) < coverage[served, None]
+    row_route, row_month = np.nonzero(rows)
+    row_route = served[row_route]
+    row_month = bazl_months[row_month]
+
+    # PAX from the route's expected cases and a per-route density
+    density = rng.lognormal(np.log(MEDIAN_DENSITY), 0.9, n_routes)
+    expected_cases = BASE_INAD_ROWS * scale * weight[row_route] * month_p[row_month]
+    pax = expected_cases / density[row_route] * 1000 * rng.lognormal(0.0, 0.25, len(row_route))
+    bazl_month = months[row_month]
+    bazl = pd.DataFrame({
+        'Airline': pd.Series(airlines[route_airline[row_route]], dtype='str'),
+        'Airport': pd.Series(stops[route_stop[row_route]], dtype='str'),
+        'PAX': np.maximum(1, np.rint(pax)).astype(np.int64),
+        'Year': pd.array(bazl_month // 12, dtype='Int64'),
+        'Month': pd.array(bazl_month % 12 + 1, dtype='Int64')
+    }).sort_values(['Year', 'Month', 'Airline', 'Airport'], kind='stable').reset_index(drop=True)
+
+    return {'inad': inad, 'bazl': bazl}
+
+
+def normalized_tables(tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Convert synthetic tables to the normalized tables of load_inad_table/load_bazl_table.
+
+    Args:
+        tables: Output of synthetic_tables
+
+    Returns:
+        Dictionary with the normalized 'inad' and 'bazl' DataFrames
+    """
+    inad = tables['inad']
+    return {
+        'inad': pd.DataFrame({
+            'Airline': inad['Airline'],
+            'LastStop': inad['LastStop'],
+            'Year': inad['Year'],
+            'Month': inad['Month'],
+            'Included': ~inad['Code'].isin(EXCLUDE_CODES).to_numpy()
+        }),
+        'bazl': tables['bazl']
+    }
+
+
+def _inad_rows(inad: pd.DataFrame, rng: np.random.Generator):
+    """Yield INAD workbook rows, with filler values for the unused columns."""
+    n = len(inad)
+    day = rng.integers(1, 29, n).tolist()
+    flight = rng.integers(1, 9999, n).tolist()
+    nationality = rng.choice(['XK', 'RS', 'TR', 'NG', 'DZ', 'MA', 'IQ', 'AF', 'CN', 'BR'], n).tolist()
+    columns = zip(
+        inad['Year'].tolist(), inad['Month'].tolist(), day, nationality,
+        inad['LastStop'].tolist(), inad['Airline'].tolist(), flight, inad['Code'].tolist()
+    )
+    for year, month, d, nat, stop, airline, number, code in columns:
+        yield [year, month, date(year, month, d), nat,
+               None if pd.isna(stop) else stop,
+               None if pd.isna(airline) else airline,
+               None if pd.isna(airline) else f'{airline}{number}', code]
+
+
+def _write_workbook(path: Path, headers: List[str], rows) -> None:
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Data')
+    sheet.append(headers)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_excel(tables: Dict[str, pd.DataFrame], output_dir: Path, name: str, seed: int = 0) -> Dict[str, Optional[Path]]:
+    """
+    Write the synthetic tables as INAD/BAZL workbooks.
+
+    Tables with more rows than fit on one sheet are skipped.
+
+    Args:
+        tables: Output of synthetic_tables
+        output_dir: Directory to write to
+        name: File name suffix (e.g. 'synthetic_x10')
+        seed: Seed for the filler columns
+
+    Returns:
+        Dictionary of 'inad'/'bazl' -> written path (None when skipped)
+    """
+    rng = np.random.default_rng(seed)
+    inad, bazl = tables['inad'], tables['bazl']
+    paths: Dict[str, Optional[Path]] = {}
+
+    inad_path = output_dir / f'INAD_Tabelle_{name}.xlsx'
+    if len(inad) <= EXCEL_MAX_ROWS:
+        _write_workbook(inad_path, INAD_HEADERS, _inad_rows(inad, rng))
+        paths['inad'] = inad_path
+    else:
+        paths['inad'] = None
+
+    bazl_path = output_dir / f'BAZL-Daten_{name}.xlsx'
+    if len(bazl) <= EXCEL_MAX_ROWS:
+        rows = zip(bazl['Airline'].tolist(), bazl['Airport'].tolist(), bazl['PAX'].tolist(),
+                   bazl['Year'].tolist(), bazl['Month'].tolist())
+        _write_workbook(bazl_path, BAZL_HEADERS, (list(row) for row in rows))
+        paths['bazl'] = bazl_path
+    else:
+        paths['bazl'] = None
+
+    return paths
+
+
+def write_columnar(tables: Dict[str, pd.DataFrame], output_dir: Path, name: str) -> Dict[str, Path]:
+    """
+    Write the normalized tables as uncompressed Arrow IPC (Feather) files.
+
+    Args:
+        tables: Output of synthetic_tables
+        output_dir: Directory to write to
+        name: File name suffix (e.g. 'synthetic_x10')
+
+    Returns:
+        Dictionary of 'inad'/'bazl' -> written path
+    """
+    if _feather is None:
+        raise RuntimeError('Columnar output requires pyarrow')
+
+    paths = {}
+    for kind, table in normalized_tables(tables).items():
+        path = output_dir / f'{kind}_{name}.arrow'
+        _feather.write_feather(table, path, compression='uncompressed')
+        paths[kind] = path
+    return paths
+
+
+def read_columnar(path: Path) -> pd.DataFrame:
+    """Memory-map a normalized table written by write_columnar."""
+    return _feather.read_table(path, memory_map=True).to_pandas()
+
+
+def scale_name(scale: float) -> str:
+    """File name suffix of a scale (e.g. 'synthetic_x10')."""
+    return f'synthetic_x{scale:g}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=float, default=1, help='Multiple of the real data volume')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--format', default='excel,arrow', help='Comma-separated output formats (excel, arrow)')
+    parser.add_argument('--output-dir', default='data/synthetic', help='Directory to write to')
+    args = parser.parse_args()
+
+    formats = {f.strip() for f in args.format.split(',') if f.strip()}
+    unknown = formats - {'excel', 'arrow'}
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(sorted(unknown))}")
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    name = scale_name(args.scale)
+
+    tables = synthetic_tables(args.scale, args.seed)
+    print(f"Generated {len(tables['inad'])} INAD cases and {len(tables['bazl'])} BAZL rows (scale {args.scale:g})")
+
+    if 'arrow' in formats:
+        for kind, path in write_columnar(tables, output_dir, name).items():
+            print(f"  {kind.upper()} columnar: {path}")
+    if 'excel' in formats:
+        for kind, path in write_excel(tables, output_dir, name, args.seed).items():
+            if path is None:
+                print(f"  {kind.upper()} workbook skipped: more than {EXCEL_MAX_ROWS} rows")
+            else:
+                print(f"  {kind.upper()} workbook: {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -75,12 +75,17 @@ const HistoricTrends = ({ translations }) => {
     );
   }
 
-  if (isLoading) {
+  // Streamed data arrives one semester at a time (static JSON has no 'complete' flag)
+  const isStreaming = historicData?.complete === false;
+  const loadedCount = historicData?.semesters?.length || 0;
+
+  if (isLoading || (isStreaming && loadedCount === 0)) {
     return (
       <div className="card" style={{ textAlign: 'center', padding: '48px' }}>
         <RefreshCw size={32} style={{ color: 'var(--color-primary)', animation: 'spin 1s linear infinite' }} />
         <p style={{ marginTop: '16px', color: 'var(--text-muted)' }}>
           {t.loadingHistoric || 'Loading historic data...'}
+          {isStreaming && ` (${loadedCount}/${historicData.total})`}
         </p>
         <style>{`
           @keyframes spin {
@@ -130,6 +135,18 @@ const HistoricTrends = ({ translations }) => {
                  trend.direction === 'improving' ? (t.improving || 'Improving') :
                  (t.stable || 'Stable')}
               </span>
+              {isStreaming && (
+                <div style={{ display: 'flex', alignItems: 'center', gap: '6px', marginTop: '4px', fontSize: '0.75rem', color: 'var(--text-muted)' }}>
+                  <RefreshCw size={12} style={{ animation: 'spin 1s linear infinite' }} />
+                  {t.loadingHistoric || 'Loading historic data...'} ({loadedCount}/{historicData.total})
+                  <style>{`
+                    @keyframes spin {
+                      from { transform: rotate(0deg); }
+                      to { transform: rotate(360deg); }
+                    }
+                  `}</style>
+                </div>
+              )}
             </div>
           </div>
 
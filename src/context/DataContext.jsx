@@ -21,6 +21,31 @@ const isStaticMode = () => {
 // Helper to get the base path for static analysis files
 const getStaticBasePath = () => `${process.env.PUBLIC_URL || ''}/analysis`;
 
+// Compact static files store these per-route lists column-wise ({ field: [values] })
+const COLUMNAR_LISTS = ['routes', 'airlines', 'step2Routes'];
+
+// Helper to rebuild per-route objects from one array per field
+const expandColumns = (columns) => {
+  if (!columns || Array.isArray(columns)) return columns || [];
+  const fields = Object.keys(columns);
+  const length = fields.length ? columns[fields[0]].length : 0;
+  const rows = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const row = {};
+    for (const field of fields) row[field] = columns[field][i];
+    rows[i] = row;
+  }
+  return rows;
+};
+
+// Helper to bring a static analysis file into the layout the API returns
+const normalizeAnalysis = (analysis) => {
+  if (!analysis || analysis.layout !== 'columnar') return analysis;
+  const { layout, ...rest } = analysis;
+  for (const name of COLUMNAR_LISTS) rest[name] = expandColumns(rest[name]);
+  return rest;
+};
+
 // Provider component
 export const DataProvider = ({ children }) => {
   // Data loading state
@@ -34,6 +59,9 @@ export const DataProvider = ({ children }) => {
   // Current semester selection
   const [currentSemester, setCurrentSemester] = useState(null);
 
+  // Content-hashed static file per semester (from index.json)
+  const [staticFiles, setStaticFiles] = useState({});
+
   // Analysis results
   const [analysisData, setAnalysisData] = useState(null);
   const [historicData, setHistoricData] = useState(null);
@@ -60,6 +88,29 @@ export const DataProvider = ({ children }) => {
       try {
         const basePath = `${process.env.PUBLIC_URL || ''}/analysis`;
 
+        // The index is the only file that changes under the same name, so
+        // revalidate it; the bootstrap it names holds everything for the first
+        // render and, like the semester files, can be cached as immutable
+        const indexRes = await fetch(`${basePath}/index.json`, { cache: 'no-cache' });
+        const index = indexRes.ok ? await indexRes.json() : null;
+        if (index && index.bootstrap) {
+          const bootstrapRes = await fetch(`${basePath}/${index.bootstrap}`);
+          if (bootstrapRes.ok) {
+            const bootstrap = await bootstrapRes.json();
+            if (!Array.isArray(bootstrap.semesters) || bootstrap.semesters.length === 0) return;
+
+            setStaticFiles(index.files || {});
+            setSemesters(bootstrap.semesters);
+            setDataReady(true);
+            setCurrentSemester(bootstrap.latest_semester);
+            if (bootstrap.analysis) setAnalysisData(normalizeAnalysis(bootstrap.analysis));
+            if (bootstrap.historic) setHistoricData(bootstrap.historic);
+            if (bootstrap.systemic) setSystemicCases(bootstrap.systemic);
+            return;
+          }
+        }
+
+        // Output of older generators: one request per file
         const semestersRes = await fetch(`${basePath}/semesters.json`);
         if (!semestersRes.ok) return;
 
@@ -75,7 +126,7 @@ export const DataProvider = ({ children }) => {
         // Load primary analysis for latest semester
         const analysisRes = await fetch(`${basePath}/analysis_${latest}.json`);
         if (analysisRes.ok) {
-          const analysisJson = await analysisRes.json();
+          const analysisJson = normalizeAnalysis(await analysisRes.json());
           setAnalysisData(analysisJson);
         }
 
@@ -200,19 +251,32 @@ export const DataProvider = ({ children }) => {
       }
     }
 
-    // Dynamic mode - use API
-    setIsLoading(true);
+    // Dynamic mode - stream semesters from the API as they are computed
     setError(null);
 
+    const order = new Map(sems.map((sem, index) => [sem, index]));
+    let result = { semesters: [], trend: null, errors: [], total: sems.length, complete: false };
+    setHistoricData(result);
+
     try {
-      const result = await api.getHistoricData(sems);
-      setHistoricData(result);
+      await api.streamHistoricData(sems, (event) => {
+        const { type, ...payload } = event;
+        if (type === 'semester') {
+          const points = [...result.semesters, payload]
+            .sort((a, b) => order.get(a.semester) - order.get(b.semester));
+          result = { ...result, semesters: points };
+        } else if (type === 'error') {
+          result = { ...result, errors: [...result.errors, payload] };
+        } else if (type === 'trend') {
+          result = { ...result, trend: payload.trend, complete: true };
+        }
+        setHistoricData(result);
+      });
       return result;
     } catch (err) {
+      setHistoricData(null);
       setError(err.message);
       throw err;
-    } finally {
-      setIsLoading(false);
     }
   }, [semesters, historicData]);
 
@@ -294,9 +358,10 @@ export const DataProvider = ({ children }) => {
       setError(null);
       try {
         const basePath = getStaticBasePath();
-        const analysisRes = await fetch(`${basePath}/analysis_${semester}.json`);
+        const file = staticFiles[semester] || `analysis_${semester}.json`;
+        const analysisRes = await fetch(`${basePath}/${file}`);
         if (analysisRes.ok) {
-          const analysisJson = await analysisRes.json();
+          const analysisJson = normalizeAnalysis(await analysisRes.json());
           setAnalysisData(analysisJson);
         } else {
           setError(`Failed to load analysis data for ${semester}`);
@@ -311,7 +376,7 @@ export const DataProvider = ({ children }) => {
       // In dynamic mode, use the API
       await runAnalysis(semester);
     }
-  }, [runAnalysis]);
+  }, [runAnalysis, staticFiles]);
 
   // Clear error
   const clearError = useCallback(() => {
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Settings, Save, RefreshCw, Upload, Server, FileSpreadsheet, Info } from 'lucide-react';
 import { useData } from '../context/DataContext';
+import { getThresholdCounts } from '../services/api';
 
 const Configuration = ({ translations = {} }) => {
   const {
@@ -31,6 +32,7 @@ const Configuration = ({ translations = {} }) => {
   const [inadPath, setInadPath] = useState('');
   const [bazlPath, setBazlPath] = useState('');
   const [message, setMessage] = useState(null);
+  const [liveCounts, setLiveCounts] = useState(null);
 
   // Sync with context config
   useEffect(() => {
@@ -39,6 +41,42 @@ const Configuration = ({ translations = {} }) => {
     }
   }, [config]);
 
+  // Live priority counts for the current semester while sliders move
+  useEffect(() => {
+    if (isStaticMode || !dataReady || !currentSemester) {
+      setLiveCounts(null);
+      return undefined;
+    }
+
+    let cancelled = false;
+    getThresholdCounts(currentSemester, {
+      multiplier: localConfig.high_priority_multiplier,
+      min_density: localConfig.min_density,
+      threshold_method: localConfig.threshold_method,
+      min_inad: localConfig.min_inad,
+      min_pax: localConfig.min_pax,
+    })
+      .then((counts) => {
+        if (!cancelled) setLiveCounts(counts);
+      })
+      .catch(() => {
+        if (!cancelled) setLiveCounts(null);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [
+    isStaticMode,
+    dataReady,
+    currentSemester,
+    localConfig.high_priority_multiplier,
+    localConfig.min_density,
+    localConfig.threshold_method,
+    localConfig.min_inad,
+    localConfig.min_pax,
+  ]);
+
   const t = {
     pageTitle: translations.configurationTitle || 'Configuration',
     pageSubtitle: translations.configurationSubtitle || 'Adjust analysis parameters and data sources',
@@ -72,6 +110,10 @@ const Configuration = ({ translations = {} }) => {
     dataStatus: translations.dataStatus || 'Data Status',
     dataLoaded: translations.dataLoaded || 'Data loaded and ready',
     noDataLoaded: translations.noDataLoaded || 'No data loaded',
+    livePreview: translations.livePreview || 'Preview',
+    threshold: translations.threshold || 'Threshold',
+    highPriority: translations.highPriority || 'High Priority',
+    watchList: translations.watchList || 'Watch List',
   };
 
   const handleFileUpload = async () => {
@@ -415,6 +457,20 @@ const Configuration = ({ translations = {} }) => {
             </p>
           </div>
 
+          {/* Live counts for the current semester */}
+          {liveCounts && (
+            <div style={{ marginBottom: '20px', fontSize: '0.875rem', color: 'var(--text-muted)' }}>
+              {t.livePreview} ({currentSemester}, {t.threshold}: {liveCounts.threshold.toFixed(4)}):{' '}
+              <span style={{ fontWeight: 600, color: 'var(--color-danger)' }}>
+                {liveCounts.high_priority} {t.highPriority}
+              </span>
+              {' · '}
+              <span style={{ fontWeight: 600, color: 'var(--color-warning)' }}>
+                {liveCounts.watch_list} {t.watchList}
+              </span>
+            </div>
+          )}
+
           {/* Action Buttons */}
           <div style={{ display: 'flex', gap: '12px' }}>
             <button
@@ -140,8 +140,9 @@ const HelpDocs = ({ translations = {} }) => {
 
           <h4 style={{ marginBottom: '12px', color: 'var(--color-primary)' }}>Detection Criteria</h4>
           <ul style={{ marginBottom: '16px', marginLeft: '20px' }}>
-            <li style={{ marginBottom: '8px' }}>Route flagged as HIGH_PRIORITY or WATCH_LIST for 2+ consecutive semesters</li>
-            <li style={{ marginBottom: '8px' }}>Trend analysis compares first and last appearance densities</li>
+            <li style={{ marginBottom: '8px' }}>Route flagged as HIGH_PRIORITY or WATCH_LIST in 2+ semesters</li>
+            <li style={{ marginBottom: '8px' }}>Marked consecutive when the flags include a run of 2+ adjacent semesters</li>
+            <li style={{ marginBottom: '8px' }}>Trend analysis fits a line through the densities of all flagged semesters</li>
             <li>Routes marked as WORSENING, IMPROVING, or STABLE</li>
           </ul>
 
@@ -149,11 +150,11 @@ const HelpDocs = ({ translations = {} }) => {
           <div style={{ display: 'grid', gap: '12px' }}>
             <div style={{ display: 'flex', alignItems: 'center', gap: '12px', padding: '12px', background: 'var(--bg-tertiary)', borderRadius: '8px' }}>
               <span style={{ color: 'var(--color-danger)', fontWeight: 600 }}>WORSENING</span>
-              <span style={{ fontSize: '0.875rem' }}>Density increased by more than 10%</span>
+              <span style={{ fontSize: '0.875rem' }}>Fitted density increased by more than 10%</span>
             </div>
             <div style={{ display: 'flex', alignItems: 'center', gap: '12px', padding: '12px', background: 'var(--bg-tertiary)', borderRadius: '8px' }}>
               <span style={{ color: 'var(--color-success)', fontWeight: 600 }}>IMPROVING</span>
-              <span style={{ fontSize: '0.875rem' }}>Density decreased by more than 10%</span>
+              <span style={{ fontSize: '0.875rem' }}>Fitted density decreased by more than 10%</span>
             </div>
             <div style={{ display: 'flex', alignItems: 'center', gap: '12px', padding: '12px', background: 'var(--bg-tertiary)', borderRadius: '8px' }}>
               <span style={{ color: 'var(--text-secondary)', fontWeight: 600 }}>STABLE</span>
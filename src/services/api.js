@@ -115,6 +115,44 @@ export const getHistoricData = async (semesters) => {
   return response.json();
 };
 
+/**
+ * Stream historic data, one semester at a time in completion order
+ * @param {string[]} semesters - Array of semester identifiers
+ * @param {Function} onEvent - Called with each event ({ type: 'semester' | 'error' | 'trend', ... })
+ */
+export const streamHistoricData = async (semesters, onEvent) => {
+  const params = new URLSearchParams({
+    semesters: semesters.join(','),
+  });
+
+  const response = await fetch(`${API_URL}/api/historic/stream?${params}`);
+
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.detail || 'Failed to get historic data');
+  }
+
+  // NDJSON: one event per line, possibly split across chunks
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    for (const line of lines) {
+      if (line.trim()) onEvent(JSON.parse(line));
+    }
+
+    if (done) break;
+  }
+
+  if (buffer.trim()) onEvent(JSON.parse(buffer));
+};
+
 /**
  * Detect systemic cases across semesters
  * @param {string[]} semesters - Array of semester identifiers
@@ -163,6 +201,52 @@ export const updateConfig = async (config) => {
   return response.json();
 };
 
+/**
+ * Get live priority counts for a semester at a threshold and multiplier
+ * @param {string} semester - Semester identifier (e.g., "2024-H1")
+ * @param {Object} params - Optional threshold, multiplier, min_density,
+ *   high_priority_min_inad, threshold_method, min_inad and min_pax
+ */
+export const getThresholdCounts = async (semester, params = {}) => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null) {
+      query.append(key, value);
+    }
+  });
+
+  const response = await fetch(`${API_URL}/api/threshold-counts/${semester}?${query}`);
+
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.detail || 'Failed to get threshold counts');
+  }
+
+  return response.json();
+};
+
+/**
+ * Get summary counts for every combination of a parameter grid
+ * @param {string[]} semesters - Semesters to sweep
+ * @param {Object} grid - Parameter name -> array of values
+ */
+export const sweepParameters = async (semesters, grid) => {
+  const response = await fetch(`${API_URL}/api/sweep`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({ semesters, grid }),
+  });
+
+  if (!response.ok) {
+    const error = await response.json();
+    throw new Error(error.detail || 'Failed to run parameter sweep');
+  }
+
+  return response.json();
+};
+
 // Export default API object
 const api = {
   checkHealth,
@@ -172,9 +256,12 @@ const api = {
   getSemesters,
   analyzeSemester,
   getHistoricData,
+  streamHistoricData,
   getSystemicCases,
   getConfig,
   updateConfig,
+  getThresholdCounts,
+  sweepParameters,
 };
 
 export default api;
@@ -0,0 +1,152 @@
+"""
+Equivalence of the join-based calculate_step3 with the original row loop.
+
+reference_step3 is the iterrows implementation calculate_step3 replaced,
+kept verbatim. Both run on seeded random routes and PAX lookups, including
+lookups aggregated from BAZL tables with duplicate (Airline, Airport, month)
+rows, routes without any PAX match, partner airlines and empty input.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from inad_analysis import AnalysisConfig, bazl_lookup, calculate_step3
+
+AIRLINES = ['LX', 'BA', 'TK', 'JU', 'AC', 'EK', 'QR', 'LH']
+STOPS = ['ZRH', 'LHR', 'IST', 'BEG', 'YUL', 'DXB', 'DOH', 'FRA', 'PRN', 'SKP']
+
+TRIALS = 200
+
+
+def reference_step3(step2_df, pax_lookup, config, partner_mapping=None):
+    """The row-loop calculate_step3 the join-based version replaced."""
+    results = []
+
+    for _, row in step2_df.iterrows():
+        airline = row['Airline']
+        laststop = row['LastStop']
+        inad_count = row['INAD_Count']
+
+        # Get PAX (including partner airlines if applicable)
+        pax = pax_lookup.get((airline, laststop), 0)
+
+        if partner_mapping and airline in partner_mapping:
+            for partner in partner_mapping[airline]:
+                pax += pax_lookup.get((partner, laststop), 0)
+
+        # Calculate density (per mille)
+        density = (inad_count / pax * 1000) if pax > 0 else None
+
+        # Determine reliability
+        is_reliable = pax >= config.min_pax
+
+        # Calculate confidence score
+        if pax < config.min_pax:
+            confidence = 0
+        else:
+            inad_score = min(100, (inad_count / 20) * 100)
+            pax_score = min(100, (pax / 100000) * 100)
+            confidence = int(0.6 * inad_score + 0.4 * pax_score)
+
+        results.append({
+            'Airline': airline,
+            'LastStop': laststop,
+            'INAD_Count': inad_count,
+            'PAX': pax,
+            'Density': density,
+            'Confidence': confidence,
+            'IsReliable': is_reliable
+        })
+
+    columns = ['Airline', 'LastStop', 'INAD_Count', 'PAX', 'Density', 'Confidence', 'IsReliable']
+    return pd.DataFrame(results, columns=columns)
+
+
+def random_step2(rng, max_routes=30):
+    """Distinct (Airline, LastStop) routes with INAD counts, sorted like step 2."""
+    pairs = [(airline, stop) for airline in AIRLINES for stop in STOPS]
+    size = int(rng.integers(1, max_routes + 1))
+    chosen = rng.choice(len(pairs), size=size, replace=False)
+    step2 = pd.DataFrame({
+        'Airline': [pairs[i][0] for i in chosen],
+        'LastStop': [pairs[i][1] for i in chosen],
+        'INAD_Count': rng.integers(1, 40, size=size)
+    })
+    return step2.sort_values('INAD_Count', ascending=False)
+
+
+def random_bazl(rng, rows):
+    """Normalized BAZL table whose (Airline, Airport, month) keys repeat."""
+    return pd.DataFrame({
+        'Airline': rng.choice(AIRLINES, size=rows),
+        'Airport': rng.choice(STOPS, size=rows),
+        'PAX': rng.integers(0, 60000, size=rows),
+        'Year': np.full(rows, 2024),
+        'Month': rng.integers(1, 7, size=rows)
+    })
+
+
+def random_partners(rng):
+    """Partner mapping for a few airlines (sometimes including themselves)."""
+    owners = rng.choice(AIRLINES, size=int(rng.integers(1, 4)), replace=False)
+    return {
+        str(owner): [str(p) for p in rng.choice(AIRLINES, size=int(rng.integers(1, 3)), replace=False)]
+        for owner in owners
+    }
+
+
+def random_config(rng):
+    return AnalysisConfig(min_pax=int(rng.choice([0, 1000, 5000, 20000])))
+
+
+def assert_same(pax_lookup, step2, config, partner_mapping=None):
+    expected = reference_step3(step2, pax_lookup, config, partner_mapping)
+    actual = calculate_step3(step2, pax_lookup, config, partner_mapping)
+    # The row loop leaves Density as an object column of None when no route
+    # has PAX; both layouts mean "missing"
+    if len(expected):
+        expected['Density'] = expected['Density'].astype(float)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize('seed', range(TRIALS))
+def test_matches_row_loop_on_bazl_lookup(seed):
+    rng = np.random.default_rng(seed)
+    bazl = random_bazl(rng, int(rng.integers(1, 300)))
+    pax_lookup, _ = bazl_lookup(bazl, datetime(2024, 1, 1), datetime(2024, 6, 30))
+    partner_mapping = random_partners(rng) if seed % 3 == 0 else None
+    assert_same(pax_lookup, random_step2(rng), random_config(rng), partner_mapping)
+
+
+@pytest.mark.parametrize('seed', range(TRIALS))
+def test_matches_row_loop_on_sparse_lookup(seed):
+    rng = np.random.default_rng(10_000 + seed)
+    step2 = random_step2(rng)
+    # Only some routes (and some unrelated keys) have PAX
+    keys = {(a, s) for a, s in zip(step2['Airline'], step2['LastStop']) if rng.random() < 0.5}
+    keys |= {(str(rng.choice(AIRLINES)), str(rng.choice(STOPS))) for _ in range(5)}
+    pax_lookup = {key: int(rng.integers(0, 200000)) for key in keys}
+    partner_mapping = random_partners(rng) if seed % 2 == 0 else None
+    assert_same(pax_lookup, step2, random_config(rng), partner_mapping)
+
+
+def test_empty_step2():
+    step2 = pd.DataFrame(columns=['Airline', 'LastStop', 'INAD_Count'])
+    assert_same({('LX', 'ZRH'): 10000}, step2, AnalysisConfig())
+    assert_same({}, step2, AnalysisConfig())
+
+
+@pytest.mark.parametrize('partner_mapping', [None, {'LX': ['BA']}])
+def test_no_pax_match(partner_mapping):
+    rng = np.random.default_rng(7)
+    step2 = random_step2(rng)
+    assert_same({}, step2, AnalysisConfig(), partner_mapping)
+    assert_same({('ZZ', 'XXX'): 50000}, step2, AnalysisConfig(), partner_mapping)
@@ -0,0 +1,60 @@
+"""
+Consecutive runs of systemic cases follow the calendar, not list positions.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from inad_analysis import AnalysisConfig, _calendar_gaps, detect_systemic_cases
+
+
+def step3(priority):
+    """Step 3 result with one LX/BEG route of the given priority."""
+    return pd.DataFrame({
+        'Airline': ['LX'],
+        'LastStop': ['BEG'],
+        'Priority': [priority],
+        'Density': [0.5]
+    })
+
+
+def systemic(semesters):
+    return detect_systemic_cases(
+        [(semester, step3('WATCH_LIST')) for semester in semesters], AnalysisConfig()
+    ).iloc[0]
+
+
+def test_calendar_gaps():
+    assert _calendar_gaps(['2023-H1', '2023-H2', '2024-H1']).tolist() == [False, False]
+    assert _calendar_gaps(['2023-H1', '2024-H1']).tolist() == [True]
+    assert _calendar_gaps(['2022-H2', '2023-H1', '2024-H2']).tolist() == [False, True]
+    assert _calendar_gaps(['2024-H1']).tolist() == []
+
+
+def test_adjacent_semesters_form_a_run():
+    case = systemic(['2023-H1', '2023-H2', '2024-H1'])
+    assert bool(case['Consecutive'])
+    assert case['LongestStreak'] == 3
+    assert case['CurrentStreak'] == 3
+
+
+def test_skipped_semester_breaks_the_run():
+    case = systemic(['2023-H1', '2024-H1'])
+    assert case['Appearances'] == 2
+    assert not bool(case['Consecutive'])
+    assert case['LongestStreak'] == 1
+    assert case['CurrentStreak'] == 1
+
+    case = systemic(['2022-H1', '2022-H2', '2023-H2', '2024-H1', '2024-H2'])
+    assert case['LongestStreak'] == 3
+    assert case['CurrentStreak'] == 3
+    np.testing.assert_array_equal(
+        [entry['Semester'] for entry in case['History']],
+        ['2022-H1', '2022-H2', '2023-H2', '2024-H1', '2024-H2']
+    )
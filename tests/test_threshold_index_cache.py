@@ -0,0 +1,76 @@
+"""
+The per-dataset threshold index cache evicts least recently used entries.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+import dataset as dataset_module
+from dataset import InadDataset
+from inad_analysis import AnalysisConfig
+
+SEMESTER = '2024-H1'
+
+
+@pytest.fixture
+def dataset():
+    rng = np.random.default_rng(0)
+    rows = 2000
+    airlines = rng.choice(['LX', 'BA', 'TK', 'JU', 'AC'], size=rows)
+    stops = rng.choice(['ZRH', 'LHR', 'IST', 'BEG', 'YUL', 'DXB'], size=rows)
+    inad = pd.DataFrame({
+        'Airline': airlines.astype(object),
+        'LastStop': stops.astype(object),
+        'Year': pd.array(np.full(rows, 2024), dtype='Int64'),
+        'Month': pd.array(rng.integers(1, 7, size=rows), dtype='Int64'),
+        'Included': np.ones(rows, dtype=bool)
+    })
+    pairs = inad[['Airline', 'LastStop']].drop_duplicates()
+    bazl = pd.DataFrame({
+        'Airline': pairs['Airline'].to_numpy(),
+        'Airport': pairs['LastStop'].to_numpy(),
+        'PAX': rng.integers(1000, 200000, size=len(pairs)),
+        'Year': pd.array(np.full(len(pairs), 2024), dtype='Int64'),
+        'Month': pd.array(np.full(len(pairs), 3), dtype='Int64')
+    })
+    return InadDataset(inad, bazl)
+
+
+def config(min_pax):
+    return AnalysisConfig(min_pax=min_pax)
+
+
+def cached(dataset, min_pax):
+    return dataset.threshold_ready(SEMESTER, config(min_pax), need_threshold=False)
+
+
+def test_evicts_least_recently_used(dataset, monkeypatch):
+    monkeypatch.setattr(dataset_module, 'MAX_THRESHOLD_INDEXES', 3)
+    for min_pax in (1000, 2000, 3000):
+        dataset.threshold_counts(SEMESTER, config(min_pax))
+
+    # Touch the oldest entry, then add a fourth: the second one goes
+    dataset.threshold_counts(SEMESTER, config(1000))
+    dataset.threshold_counts(SEMESTER, config(4000))
+
+    assert [cached(dataset, min_pax) for min_pax in (1000, 2000, 3000, 4000)] == [True, False, True, True]
+
+
+def test_concurrent_lookups(dataset, monkeypatch):
+    monkeypatch.setattr(dataset_module, 'MAX_THRESHOLD_INDEXES', 4)
+    min_pax_values = [1000 * (i % 8 + 1) for i in range(64)]
+    expected = {value: dataset.threshold_counts(SEMESTER, config(value)) for value in set(min_pax_values)}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda value: dataset.threshold_counts(SEMESTER, config(value)), min_pax_values))
+
+    assert results == [expected[value] for value in min_pax_values]
+    assert sum(cached(dataset, value) for value in set(min_pax_values)) == 4